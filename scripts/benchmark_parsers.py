@@ -0,0 +1,70 @@
+import os
+import sys
+import time
+
+# Add project root to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from src.classes.centralnovel_book import MyCentralNovelBook  # noqa: E402
+from src.classes.novelsbr_book import MyNovelsBrBook  # noqa: E402
+from src.classes.pandanovel_book import MyPandaNovelBook  # noqa: E402
+from src.classes.royalroad_book import MyRoyalRoadBook  # noqa: E402
+from src.utils.html_parser import make_soup, make_tree  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "tests", "fixtures")
+
+# fixture file -> (scraper class, spec section whose regions are parsed)
+TARGETS = {
+    "royalroad_chap.html": (MyRoyalRoadBook, "chapter"),
+    "royalroad_toc.html": (MyRoyalRoadBook, "toc"),
+    "pandanovel_chap.html": (MyPandaNovelBook, "chapter"),
+    "pandanovel_toc.html": (MyPandaNovelBook, "metadata"),
+    "novelsbr_chap.html": (MyNovelsBrBook, "chapter"),
+    "novelsbr_toc.html": (MyNovelsBrBook, "toc"),
+    "centralnovel_chap.html": (MyCentralNovelBook, "chapter"),
+    "centralnovel_toc.html": (MyCentralNovelBook, "toc"),
+}
+
+ITERATIONS = 200
+
+
+def _time(func, iterations: int = ITERATIONS) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def run_benchmarks():
+    print("🚀 Parser benchmark (ms per page, lower is better)")
+    print(f"{'Fixture':<26}{'html.parser':>12}{'lxml':>10}{'lxml+regions':>14}{'lxml.html':>11}{'speedup':>10}")
+    print("=" * 83)
+
+    for filename, (scraper_class, section) in TARGETS.items():
+        path = os.path.join(FIXTURES_DIR, filename)
+        if not os.path.exists(path):
+            print(f"❌ Missing fixture: {filename}")
+            continue
+
+        with open(path, "rb") as f:
+            raw = f.read()
+        text = raw.decode("utf-8")
+        regions = getattr(scraper_class.spec, section).regions
+
+        baseline = _time(lambda: BeautifulSoup(text, "html.parser"))
+        lxml_full = _time(lambda: BeautifulSoup(text, "lxml"))
+        restricted = _time(lambda: make_soup(raw, regions, encoding="utf-8", backend="lxml"))
+        raw_lxml = _time(lambda: make_tree(raw))
+
+        print(
+            f"{filename:<26}{baseline:>12.2f}{lxml_full:>10.2f}{restricted:>14.2f}{raw_lxml:>11.2f}"
+            f"{baseline / restricted:>9.1f}x"
+        )
+
+    print("\nspeedup = html.parser (previous default) vs lxml restricted to the scraper's regions.")
+
+
+if __name__ == "__main__":
+    run_benchmarks()
@@ -1,16 +1,22 @@
 import random
+import threading
 import time
-import cloudscraper
 import requests
 import concurrent.futures
 from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple
 
 from src.utils.constants import EPUB_STRINGS
 from src.utils.logger import logger
 from src.config import get_settings
 from src.schemas.novel_schema import Novel, Chapter, BookMetadata, ChapterContent
 from src.services.metrics_service import benchmark_scraper
-from src.utils.exceptions import NovelNotFoundException, ChapterLimitException
+from src.services.session_manager import SessionManager
+from src.services.parse_pool import ParsePool
+from src.services.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from src.services.chapter_cache import ChapterCache
+from src.services.shutdown_service import ShutdownService
+from src.utils.exceptions import NovelNotFoundException, ChapterLimitException, CircuitOpenException, JobInterruptedException
 # Removed multiple statements on one line in later chunk if needed, but here we fix imports.
 
 class BaseScraper(ABC):
@@ -24,25 +30,20 @@ class BaseScraper(ABC):
         # Identify which subclass is running
         self.class_name = self.__class__.__name__
         
-        # Initialize cloudscraper
-        self._session = cloudscraper.create_scraper(
-            browser={
-                'browser': 'chrome',
-                'platform': 'windows',
-                'desktop': True
-            }
-        )
-
-        # Proxy configuration
+        # Pooled, thread-safe session (see SessionManager)
+        self._session = SessionManager.get_session(self.class_name, self.settings.PROXY_URL)
         if self.settings.PROXY_URL:
-            self._session.proxies = {
-                "http": self.settings.PROXY_URL,
-                "https": self.settings.PROXY_URL
-            }
             logger.info(f"[{self.class_name}] Proxy enabled from environment.")
         else:
             logger.warning(f"[{self.class_name}] No proxy detected. Using direct server IP.")
         
+        # Shared per-domain circuit breaker (fed by every fetch of every job)
+        self._breaker = CircuitBreakerRegistry.get(main_url)
+
+        # Chapter downloads in flight for this job: the volumes of a sharded job share them,
+        # so the domain never sees more than MAX_WORKERS requests (the size of its session pool)
+        self._fetch_slots = threading.BoundedSemaphore(max(1, self.settings.MAX_WORKERS))
+        
         self.book_title = "Unknown Title"
         logger.debug(f"[{self.class_name}] Instance initialized for: {main_url}")
 
@@ -56,18 +57,84 @@ class BaseScraper(ABC):
         """Must return a list of URLs for the chapters."""
         pass
 
+    def get_total_chapters(self) -> Optional[int]:
+        """Real number of chapters of the book, or None when the adapter cannot tell."""
+        return None
+
+    def has_paginated_index(self) -> bool:
+        """True when the chapter list comes from a paginated index (the only way to know the real count)."""
+        return False
+
+    def get_volumes(self) -> Optional[list]:
+        """
+        The site's own volumes as [(title, chapter count)] in reading order (whole book),
+        or None when the site does not group chapters into volumes.
+        """
+        return None
+
+    def poll_chapters(self, validators: Optional[dict] = None,
+                      interval: Optional[float] = None) -> Tuple[Optional[list], dict]:
+        """
+        Cheap TOC poll used by the new-chapter watcher: returns (None, validators) when the book
+        did not change since the poll that produced `validators`, else (every chapter link, new validators).
+        Extra requests the poll makes are spaced by `interval` seconds per domain.
+        Adapters that cannot tell never report changes.
+        """
+        return None, validators or {}
+
     @abstractmethod
     def get_chapter_content(self, url: str) -> ChapterContent: 
         """Must return a ChapterContent object with title and content."""
         pass
 
-    def _fetch_with_retry(self, url: str, max_retries: int = 3) -> ChapterContent:
-        """Internal helper to fetch chapter content with exponential backoff."""
+    # Optional split of get_chapter_content, so large jobs can parse in the ParsePool.
+    # Adapters opt in by overriding both halves (see supports_split_parsing).
+
+    def fetch_chapter(self, url: str) -> bytes:
+        """Network half of get_chapter_content: returns the raw chapter page (response bytes)."""
+        raise NotImplementedError
+
+    @classmethod
+    def parse_chapter(cls, html: bytes, url: str) -> ChapterContent:
+        """
+        CPU half of get_chapter_content: extracts title and content from a raw page.
+        Must only use class-level state, since it may run in a worker process (see ParsePool).
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def supports_split_parsing(cls) -> bool:
+        return (
+            cls.fetch_chapter is not BaseScraper.fetch_chapter
+            and cls.parse_chapter.__func__ is not BaseScraper.parse_chapter.__func__
+        )
+
+    def _fetch_in_slot(self, url: str, raw: bool = False):
+        with self._fetch_slots:
+            return self._fetch_with_retry(url, raw=raw)
+
+    def _fetch_with_retry(self, url: str, max_retries: int = 3, raw: bool = False):
+        """
+        Internal helper to fetch chapter content with exponential backoff.
+        With `raw=True` only the page is downloaded (parsing happens later, see ParsePool).
+        """
+        # Breaker of the host serving the chapter (the book page may live on another domain)
+        breaker = CircuitBreakerRegistry.get(url)
         for i in range(max_retries):
+            # Fail fast while the domain is banning us instead of burning retries and proxy quota.
+            # During the half-open probe the other workers wait for its outcome: only OPEN aborts.
+            if not breaker.wait_for_request():
+                raise CircuitOpenException(breaker.domain, breaker.retry_after())
             try:
-                data = self.get_chapter_content(url)
-                if not data or not data.content:
-                    raise ValueError("Main content is empty or not found.")
+                if raw:
+                    data = self.fetch_chapter(url)
+                    if not data:
+                        raise ValueError("Chapter page is empty.")
+                else:
+                    data = self.get_chapter_content(url)
+                    if not data or not data.content:
+                        raise ValueError("Main content is empty or not found.")
+                breaker.record_success()
                 return data
             except requests.exceptions.HTTPError as e:
                  if e.response.status_code == 404:
@@ -75,6 +142,9 @@ class BaseScraper(ABC):
                      raise e
                  # Special handling for Rate Limits (429) and IP Bans (403)
                  if e.response.status_code in [429, 403]:
+                     breaker.record_failure()
+                     if breaker.state == CircuitBreaker.OPEN:
+                         raise CircuitOpenException(breaker.domain, breaker.retry_after())
                      # Only retry if we have retries left
                      if i < max_retries - 1:
                         # Reduced backoff: Assuming rotating proxy, we just need a new IP.
@@ -87,7 +157,6 @@ class BaseScraper(ABC):
                      # If last retry, fall through to re-raise logic
                      pass
                  raise e
-                 raise e
             except (requests.exceptions.ProxyError, requests.exceptions.ConnectTimeout, requests.exceptions.ConnectionError) as e:
                 # Proxy Failover Logic
                 if self.settings.PROXY_URL_FALLBACK and self.settings.PROXY_URL_FALLBACK != self.settings.PROXY_URL:
@@ -121,15 +190,167 @@ class BaseScraper(ABC):
                 logger.error(f"[{self.class_name}] Max retries reached for: {url}")
                 raise e
 
+    def _error_chapter(self, index: int) -> ChapterContent:
+        return ChapterContent(
+            title=f'Error Chapter {index+1}', 
+            content=EPUB_STRINGS["error_content"]
+        )
+
+    def _download_chapters(self, chapter_urls: list, progress_callback=None, positions: Optional[list] = None,
+                           chapter_callback=None) -> list:
+        """
+        Downloads the given chapters in parallel and returns their ChapterContent in order.
+        Chapters prefetched by the watcher are taken from the ChapterCache. Large jobs only fetch in
+        the threads and ship raw pages in batches to the ParsePool; small jobs (or adapters without
+        parse_chapter) fetch and parse in-process.
+        `positions` are the chapters' 0-based positions in the book (for logs and error pages)
+        when only some of them are downloaded.
+        `chapter_callback(i, content)` is called as soon as chapter `i` (of `chapter_urls`) is final.
+        Downloads start front to back and parsed batches are collected in order, so the finished
+        chapters grow from the start of the book.
+        """
+        total_to_download = len(chapter_urls)
+        positions = positions or list(range(total_to_download))
+        chapters_data_results = [None] * total_to_download
+
+        use_parse_pool = self.supports_split_parsing() and ParsePool.should_use(total_to_download)
+        parse_func = type(self).parse_chapter
+        batch_size = self.settings.PARSE_BATCH_SIZE
+        pending_batch = []
+        parse_jobs = []
+        if use_parse_pool:
+            logger.info(f"[{self.class_name}] Parsing {total_to_download} chapters in the process pool.")
+        
+        def finish(index: int, data: ChapterContent):
+            chapters_data_results[index] = data
+            if chapter_callback:
+                chapter_callback(index, data)
+
+        def collect(job, batch):
+            for index, data in ParsePool.collect(job, parse_func, batch):
+                if data and data.content:
+                    finish(index, data)
+                    continue
+                # Empty parse (e.g. challenge page): one more full in-process attempt
+                try:
+                    finish(index, self._fetch_with_retry(chapter_urls[index]))
+                except Exception as e:
+                    logger.error(f"[{self.class_name}] Error on chapter {positions[index]+1}: {e}")
+                    finish(index, self._error_chapter(positions[index]))
+
+        completed_count = 0
+        for i, url in enumerate(chapter_urls):
+            cached = ChapterCache.get(url)
+            if cached is not None:
+                finish(i, cached)
+                completed_count += 1
+        if completed_count:
+            logger.info(f"[{self.class_name}] {completed_count} chapters served from the chapter cache.")
+
+        # Calculate checkpoints for logging (every 10%)
+        checkpoints = {max(1, int(total_to_download * (i / 10))) for i in range(1, 11)}
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.settings.MAX_WORKERS) as executor:
+            future_to_index = {
+                executor.submit(self._fetch_in_slot, url, raw=use_parse_pool): i 
+                for i, url in enumerate(chapter_urls) if chapters_data_results[i] is None
+            }
+            
+            for future in concurrent.futures.as_completed(future_to_index):
+                index = future_to_index[future]
+                try:
+                    result = future.result()
+                    if use_parse_pool:
+                        pending_batch.append((index, chapter_urls[index], result))
+                        if len(pending_batch) >= batch_size:
+                            parse_jobs.append((ParsePool.submit(parse_func, pending_batch), pending_batch))
+                            pending_batch = []
+                    else:
+                        finish(index, result)
+                except CircuitOpenException as e:
+                    # The domain is banning us: abort the whole job instead of building an EPUB of error pages
+                    logger.error(f"[{self.class_name}] Aborting scrape at chapter {positions[index]+1}: {e}")
+                    for pending in future_to_index:
+                        pending.cancel()
+                    raise e
+                except Exception as e:
+                    logger.error(f"[{self.class_name}] Error on chapter {positions[index]+1}: {e}")
+                    finish(index, self._error_chapter(positions[index]))
+
+                # Parsed batches are collected in order as soon as they are ready (not only at the end)
+                while parse_jobs and parse_jobs[0][0].done():
+                    collect(*parse_jobs.pop(0))
+
+                if ShutdownService.is_interrupted():
+                    # Server shutdown: stop between two chapters (the finished ones are checkpointed)
+                    logger.warning(f"[{self.class_name}] Interrupted by the shutdown at chapter {positions[index]+1}.")
+                    for pending in future_to_index:
+                        pending.cancel()
+                    raise JobInterruptedException("Interrupted by a server shutdown.")
+                
+                completed_count += 1
+                
+                # Progress Logic
+                # Scale from 15% to 95% based on chapter download
+                # 15 + (count/total * 80)
+                if total_to_download > 0:
+                    current_pct = 15 + int((completed_count / total_to_download) * 80)
+                    if progress_callback:
+                        progress_callback(current_pct)
+
+                if completed_count in checkpoints or completed_count == total_to_download:
+                    percentage = (completed_count / total_to_download) * 100
+                    logger.info(f"[{self.class_name}] Progress: {percentage:.0f}% ({completed_count}/{total_to_download})")
+
+        # Collect the parsed batches
+        if pending_batch:
+            parse_jobs.append((ParsePool.submit(parse_func, pending_batch), pending_batch))
+
+        for job, batch in parse_jobs:
+            collect(job, batch)
+
+        return chapters_data_results
+
     @benchmark_scraper
-    def scrape_novel(self, progress_callback=None) -> Novel:
+    def scrape_novel(self, progress_callback=None, reuse: Optional[Dict[str, Chapter]] = None,
+                     partial=None, chapter_callback=None) -> Novel:
         """
         Main process to orchestrate scraping and return a Novel object.
         :param progress_callback: Optional async or sync function(progress: int) -> None
+        :param reuse: Chapters already available keyed by URL (a previous artifact for update jobs, see
+            ArtifactStore; the checkpoint of an interrupted job, see CheckpointStore).
+            Only the chapters missing from it are downloaded.
+        :param partial: Optional PartialBook receiving the chapters as they finish (partial downloads).
+        :param chapter_callback: Optional function(position, Chapter) called as each chapter is final.
         """
         start_time = time.time()
+        book_metadata, chapter_urls, cover_bytes = self.load_book(progress_callback)
+        if partial is not None:
+            partial.start(book_metadata, cover_bytes, len(chapter_urls))
+
+        def on_chapter(position: int, chapter: Chapter):
+            if partial is not None:
+                partial.add(position, chapter)
+            if chapter_callback:
+                chapter_callback(position, chapter)
+
+        novel = self.download_novel(
+            book_metadata, chapter_urls, cover_bytes, progress_callback, reuse,
+            chapter_callback=on_chapter if partial is not None or chapter_callback else None
+        )
+
+        total_time = time.time() - start_time
+        logger.info(f"[{self.class_name}] DONE: Scraped '{self.book_title}' in {total_time:.2f}s")
+        return novel
+
+    def load_book(self, progress_callback=None) -> Tuple[BookMetadata, list, Optional[bytes]]:
+        """Steps 1-2 of a scrape: metadata, chapter links of the requested range and cover image."""
         logger.info(f"[{self.class_name}] Starting Scrape for: {self._main_url}")
 
+        if self._breaker.state == CircuitBreaker.OPEN:
+            logger.error(f"[{self.class_name}] Circuit open for {self._breaker.domain}. Refusing to start scrape.")
+            raise CircuitOpenException(self._breaker.domain, self._breaker.retry_after())
+
         if progress_callback:
             # Report initial progress
             progress_callback(5)
@@ -146,6 +367,8 @@ class BaseScraper(ABC):
             if e.response.status_code == 404:
                  logger.error(f"[{self.class_name}] Novel not found (404): {self._main_url}")
                  raise NovelNotFoundException(f"Novel not found at {self._main_url}")
+            if e.response.status_code in [429, 403]:
+                self._breaker.record_failure()
             raise e
         except Exception as e:
             logger.error(f"[{self.class_name}] Critical failure fetching metadata: {e}", exc_info=True)
@@ -183,64 +406,67 @@ class BaseScraper(ABC):
             except Exception as e:
                 logger.warning(f"[{self.class_name}] Failed to download cover image: {e}")
 
-        # 3. Parallel Chapter Download
+        return book_metadata, chapter_urls, cover_bytes
+
+    def download_novel(self, book_metadata: BookMetadata, chapter_urls: list, cover_bytes: Optional[bytes] = None,
+                       progress_callback=None, reuse: Optional[Dict[str, Chapter]] = None,
+                       first_index: int = 1, chapter_callback=None) -> Novel:
+        """
+        Step 3-4 of a scrape: downloads `chapter_urls` (except the reused ones) and assembles the Novel.
+        `first_index` numbers the chapters when this is one volume of a larger job.
+        `chapter_callback(position, Chapter)` receives every chapter as soon as it is final.
+        """
+        reuse = reuse or {}
+        total_to_download = len(chapter_urls)
+
+        # 3. Parallel Chapter Download (only what a previous artifact does not already have)
         chapters: list[Chapter] = []
-        chapters_data_results = [None] * total_to_download
-        
-        completed_count = 0
-        # Calculate checkpoints for logging (every 10%)
-        checkpoints = {max(1, int(total_to_download * (i / 10))) for i in range(1, 11)}
+        positions = [i for i, url in enumerate(chapter_urls) if url not in reuse]
+        if reuse:
+            logger.info(
+                f"[{self.class_name}] Resume: {len(positions)} chapters to download, "
+                f"{total_to_download - len(positions)} reused (previous artifact or checkpoint)."
+            )
+        on_downloaded = None
+        if chapter_callback:
+            for i, url in enumerate(chapter_urls):
+                if url in reuse:
+                    chapter_callback(i, reuse[url].model_copy(update={"index": i + first_index}))
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.settings.MAX_WORKERS) as executor:
-            future_to_index = {
-                executor.submit(self._fetch_with_retry, url): i 
-                for i, url in enumerate(chapter_urls)
-            }
-            
-            for future in concurrent.futures.as_completed(future_to_index):
-                index = future_to_index[future]
-                try:
-                    result = future.result()
-                    chapters_data_results[index] = result
-                except Exception as e:
-                    logger.error(f"[{self.class_name}] Error on chapter {index+1}: {e}")
-                    chapters_data_results[index] = ChapterContent(
-                        title=f'Error Chapter {index+1}', 
-                        content=EPUB_STRINGS["error_content"]
-                    )
-                
-                completed_count += 1
-                
-                # Progress Logic
-                # Scale from 15% to 95% based on chapter download
-                # 15 + (count/total * 80)
-                if total_to_download > 0:
-                    current_pct = 15 + int((completed_count / total_to_download) * 80)
-                    if progress_callback:
-                        progress_callback(current_pct)
+            def on_downloaded(i: int, data: ChapterContent):
+                position = positions[i]
+                chapter_callback(position, Chapter(
+                    index=position + first_index, title=data.title, content=data.content, url=chapter_urls[position]
+                ))
 
-                if completed_count in checkpoints or completed_count == total_to_download:
-                    percentage = (completed_count / total_to_download) * 100
-                    logger.info(f"[{self.class_name}] Progress: {percentage:.0f}% ({completed_count}/{total_to_download})")
+        downloaded = self._download_chapters(
+            [chapter_urls[i] for i in positions], progress_callback, [i + first_index - 1 for i in positions],
+            on_downloaded
+        )
+        chapters_data_results = [None] * total_to_download
+        for position, data in zip(positions, downloaded):
+            chapters_data_results[position] = data
 
         # 4. Assemble Chapter Objects
         for i, data in enumerate(chapters_data_results):
+            url = chapter_urls[i]
+            if url in reuse:
+                chapters.append(reuse[url].model_copy(update={"index": i + first_index}))
+                continue
             if not data:
                 continue
             
             # Data is already ChapterContent, no need to parse dicts
             chapters.append(Chapter(
-                index=i+1,
+                index=i + first_index,
                 title=data.title,
-                content=data.content
+                content=data.content,
+                url=url
             ))
 
         if not chapters:
             logger.critical(f"[{self.class_name}] Scrape failed: No chapters collected.")
             raise ValueError("No chapters found.")
-            
-        total_time = time.time() - start_time
-        logger.info(f"[{self.class_name}] DONE: Scraped '{self.book_title}' in {total_time:.2f}s")
 
         return Novel(
             metadata=book_metadata,
@@ -0,0 +1,47 @@
+from src.classes.site_spec import ChapterSpec, MetadataSpec, SiteSpec, TocEndpointSpec, TocSpec
+from src.classes.spec_scraper import SpecScraper
+
+
+# Markup of the WordPress "LightNovel" theme (div.bigcontent, div.eplister, div.epcontent...),
+# with the Madara chapter markup as fallback. The base URL comes from the book URL, so the same
+# spec serves every site built on the theme.
+LIGHTNOVEL_THEME_SPEC = SiteSpec(
+    name="lightnovel-theme",
+    base_url="",
+    metadata=MetadataSpec(
+        container='div.bigcontent',
+        title='h1.entry-title',
+        # The author is the 3rd span of the info block
+        author='div.info-content span',
+        author_index=2,
+        description='div.entry-content',
+        cover_attrs=('data-src', 'src'),
+        regions=('div.bigcontent', 'div.entry-content')
+    ),
+    toc=TocSpec(
+        mode="links",
+        items=('div.eplister a',),
+        # The theme lists the latest chapter first
+        reverse=True,
+        # Madara-style chapter list: a small HTML fragment instead of the whole book page
+        endpoint=TocEndpointSpec(
+            format="html",
+            url_template='{book_url}/ajax/chapters/',
+            method="POST",
+            items=('li.wp-manga-chapter a',),
+            reverse=True
+        ),
+        regions=('div.eplister',)
+    ),
+    chapter=ChapterSpec(
+        title='div.cat-series',
+        content=('div.epcontent.entry-content', 'div.reading-content div.text-left', 'div.entry-content'),
+        junk='script, style, ins, .adsbygoogle',
+        regions=('div.cat-series', 'div.entry-content', 'div.reading-content')
+    )
+)
+
+
+class LightNovelThemeBook(SpecScraper):
+    """Scraper for any site running the LightNovel/Madara WordPress themes."""
+    spec = LIGHTNOVEL_THEME_SPEC
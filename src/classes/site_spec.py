@@ -0,0 +1,185 @@
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import soupsieve
+
+from src.utils.html_parser import RegionFilter
+
+
+@lru_cache(maxsize=512)
+def compile_selector(selector: str) -> soupsieve.SoupSieve:
+    """Compiles a CSS selector once per process (soupsieve otherwise re-parses it on every select)."""
+    return soupsieve.compile(selector)
+
+
+def select_one(node, selector: Optional[str]):
+    if not selector or node is None:
+        return None
+    return compile_selector(selector).select_one(node)
+
+
+def select(node, selector: Optional[str]) -> list:
+    if not selector or node is None:
+        return []
+    return compile_selector(selector).select(node)
+
+
+@dataclass(frozen=True)
+class MetadataSpec:
+    """
+    Book page. `title`, `author` and `cover` are looked up inside `container`;
+    `description` is looked up in the whole (restricted) page.
+    """
+    container: str
+    title: str
+    author: str
+    description: str
+    cover: str = "img"
+    cover_attrs: Tuple[str, ...] = ("src",)
+    author_attr: Optional[str] = None   # read an attribute instead of the text
+    author_index: int = 0               # nth match of `author`
+    regions: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class TocEndpointSpec:
+    """
+    Fast chapter-list source, tried before parsing the whole book page. Formats:
+    - **html**: small HTML fragment (e.g. Madara's `ajax/chapters/`); links are the href of `items`.
+    - **json**: JSON document; the list is at the dotted `list_key` path, URLs at `href_key`.
+    - **embedded_json**: JSON array embedded in the book page script (`pattern` captures it),
+      read with a regex instead of building a tree.
+
+    `url_template` accepts `{book_url}` and `{base}`; None means the book page itself.
+    """
+    format: str = "html"
+    url_template: Optional[str] = None
+    method: str = "GET"
+    items: Tuple[str, ...] = ()
+    list_key: Optional[str] = None
+    href_key: str = "url"
+    pattern: Optional[str] = None
+    reverse: bool = False               # list is newest first
+
+    FORMATS = ("html", "json", "embedded_json")
+
+
+@dataclass(frozen=True)
+class TocPagesSpec:
+    """
+    Paginated chapter index. Page 1 is read first; the highest page number among the `last_page`
+    links (from `?page=N` or the link text) gives the page count, and the rest are fetched concurrently.
+    `url_template` accepts `{base}`, `{slug}`, `{book_url}` and `{page}`.
+    """
+    url_template: str
+    items: Tuple[str, ...]
+    last_page: str
+    first_page: int = 1
+    regions: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class TocSpec:
+    """
+    Table of contents. Modes:
+    - **links**: chapter URLs are the `href_attr` of `items` (joined with SiteSpec.base_url).
+    - **count**: `items` are only counted; URLs come from `url_template`.
+    - **range**: no page is fetched; URLs come from `url_template` for the requested range.
+
+    `items` are tried in order until one matches. `url_template` accepts `{base}`, `{slug}` and `{n}`.
+    `reverse` is for lists ordered newest first. An `endpoint` and then `pages` are tried before the
+    book page; in range mode they turn the generated URLs into the real, validated list.
+    `volumes` selects the site's volume containers on the book page (their `items` are the volume's
+    chapters, `volume_title` their name), used to split large jobs along the site's own volumes.
+    `poll_marker` selects what changes on the book page when chapters are published, for sites whose
+    book page has no chapter list (e.g. the chapter count); the new-chapter watcher compares its text.
+    """
+    mode: str = "links"
+    items: Tuple[str, ...] = ()
+    href_attr: str = "href"
+    url_template: Optional[str] = None
+    slug_strip: Optional[str] = None    # regex removed from the book slug (e.g. a trailing id)
+    reverse: bool = False
+    endpoint: Optional[TocEndpointSpec] = None
+    pages: Optional[TocPagesSpec] = None
+    volumes: Optional[str] = None
+    volume_title: Optional[str] = None
+    poll_marker: Optional[str] = None
+    regions: Tuple[str, ...] = ()
+
+    MODES = ("links", "count", "range")
+
+
+@dataclass(frozen=True)
+class ChapterSpec:
+    """
+    Chapter page. `content` selectors are tried in order. Junk is removed before extraction:
+    elements matching `junk`, paragraphs containing any `junk_text` marker and the first paragraph
+    when it contains a `junk_first_paragraph` marker (disclaimers: the story text may quote them).
+    `paragraphs_only` keeps only the visible, non-trivial <p> tags of the content.
+    """
+    content: Tuple[str, ...]
+    title: Optional[str] = None
+    default_title: str = "Untitled Chapter"
+    junk: Optional[str] = None
+    junk_text: Tuple[str, ...] = ()
+    junk_first_paragraph: Tuple[str, ...] = ()
+    paragraphs_only: bool = False
+    regions: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class SiteSpec:
+    """
+    Declarative description of a novel site, executed by SpecScraper.
+    A mirror of an existing site is `dataclasses.replace(spec, base_url=...)`.
+    An empty `base_url` means "the scheme and host of the book URL" (theme-level specs).
+    """
+    name: str
+    base_url: str
+    metadata: MetadataSpec
+    toc: TocSpec
+    chapter: ChapterSpec
+    encoding: str = "utf-8"
+    timeout: int = 10
+
+    def selectors(self) -> Tuple[str, ...]:
+        meta, toc, chapter = self.metadata, self.toc, self.chapter
+        candidates = (
+            meta.container, meta.title, meta.author, meta.description, meta.cover,
+            *toc.items, toc.volumes, toc.volume_title, toc.poll_marker,
+            *(toc.endpoint.items if toc.endpoint else ()),
+            *((*toc.pages.items, toc.pages.last_page) if toc.pages else ()),
+            *chapter.content, chapter.title, chapter.junk
+        )
+        return tuple(s for s in candidates if s)
+
+    def compile(self) -> "SiteSpec":
+        """Validates and precompiles every selector (called once when the scraper class is defined)."""
+        if self.toc.mode not in TocSpec.MODES:
+            raise ValueError(f"[{self.name}] Unknown TOC mode: {self.toc.mode!r}")
+        if self.toc.mode != "range" and not self.toc.items:
+            raise ValueError(f"[{self.name}] TOC mode {self.toc.mode!r} needs item selectors.")
+        if self.toc.mode != "links" and not self.toc.url_template:
+            raise ValueError(f"[{self.name}] TOC mode {self.toc.mode!r} needs a url_template.")
+        endpoint = self.toc.endpoint
+        if endpoint:
+            if endpoint.format not in TocEndpointSpec.FORMATS:
+                raise ValueError(f"[{self.name}] Unknown TOC endpoint format: {endpoint.format!r}")
+            if endpoint.format == "embedded_json":
+                if not endpoint.pattern:
+                    raise ValueError(f"[{self.name}] Embedded JSON endpoints need a pattern.")
+                re.compile(endpoint.pattern)
+            elif not endpoint.url_template:
+                raise ValueError(f"[{self.name}] TOC endpoint format {endpoint.format!r} needs a url_template.")
+
+        for selector in self.selectors():
+            compile_selector(selector)
+        for regions in (self.metadata.regions, self.toc.regions, self.chapter.regions,
+                        self.toc.pages.regions if self.toc.pages else ()):
+            RegionFilter(regions)
+        if self.toc.slug_strip:
+            re.compile(self.toc.slug_strip)
+        return self
@@ -0,0 +1,539 @@
+import concurrent.futures
+import hashlib
+import json
+import re
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+
+import requests
+
+from src.classes.base_book import BaseScraper
+from src.config import get_settings
+from src.classes.site_spec import SiteSpec, TocEndpointSpec, select, select_one
+from src.schemas.novel_schema import BookMetadata, ChapterContent
+from src.services.metrics_service import MetricsService
+from src.services.mirror_router import MirrorRouter
+from src.services.rate_limiter import DomainRateLimiter
+from src.services.registry import ScraperRegistry
+from src.services.toc_cache import TocCache
+from src.utils.exceptions import ScraperParsingException
+from src.utils.html_parser import make_soup
+from src.utils.logger import logger
+
+
+class SpecScraper(BaseScraper):
+    """
+    Generic scraper driven by a declarative SiteSpec (fetch -> restricted parse -> select -> clean).
+    Subclasses only set `spec`; its selectors are compiled when the subclass is defined.
+    """
+    spec: Optional[SiteSpec] = None
+
+    # { host: { "failures": int, "until": float } } - consecutive structural failures of the fast TOC
+    # endpoint (missing route, empty list). After TOC_ENDPOINT_MAX_FAILURES the host skips it until `until`.
+    _endpoint_failures: Dict[str, dict] = {}
+    _endpoint_lock = threading.Lock()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.spec is not None:
+            cls.spec.compile()
+
+    def __init__(self, main_url: str, chapters_quantity: int, start_chapter: int):
+        super().__init__(main_url, chapters_quantity, start_chapter)
+        parsed = urlparse(main_url)
+        self._base_url = self.spec.base_url or f"{parsed.scheme}://{parsed.netloc}"
+        # Metadata and TOC usually live on the same page: download it once per job
+        self._main_page: Optional[bytes] = None
+        self._main_page_lock = threading.Lock()
+        # Min seconds between two index page requests to the domain (background polls), None for jobs
+        self._index_interval: Optional[float] = None
+
+    def _get(self, url: str):
+        response = self._session.get(url, timeout=self.spec.timeout)
+        response.raise_for_status()
+        return response
+
+    def _get_main_page(self) -> bytes:
+        with self._main_page_lock:
+            if self._main_page is None:
+                self._main_page = self._get(self._main_url).content
+            return self._main_page
+
+    @staticmethod
+    def _text(node) -> Optional[str]:
+        return node.get_text(strip=True) if node is not None else None
+
+    def get_book_metadata(self) -> BookMetadata:
+        meta = self.spec.metadata
+
+        try:
+            soup = make_soup(self._get_main_page(), meta.regions, encoding=self.spec.encoding)
+
+            header = select_one(soup, meta.container)
+            if not header:
+                logger.error(f"[{self.class_name}] Book header not found at {self._main_url}. Site layout might have changed.")
+                raise ScraperParsingException("Could not find the book header. Site layout might have changed.")
+
+            title = self._text(select_one(header, meta.title)) or "Unknown Title"
+
+            author = None
+            author_tags = select(header, meta.author)
+            if len(author_tags) > meta.author_index:
+                author_tag = author_tags[meta.author_index]
+                author = author_tag.get(meta.author_attr) if meta.author_attr else self._text(author_tag)
+
+            description = self._text(select_one(soup, meta.description)) or "No description available."
+
+            cover_link = None
+            img_tag = select_one(header, meta.cover)
+            if img_tag is not None:
+                cover_link = next((img_tag.get(attr) for attr in meta.cover_attrs if img_tag.get(attr)), None)
+            if not cover_link:
+                logger.warning(f"[{self.class_name}] No cover image found for this novel.")
+
+            logger.info(f"[{self.class_name}] Metadata extracted: '{title}' by '{author}'")
+
+            return BookMetadata(
+                book_title=title,
+                book_author=author or "Unknown Author",
+                book_description=description,
+                book_cover_link=cover_link
+            )
+        except Exception as e:
+            logger.error(f"[{self.class_name}] Error fetching metadata: {e}", exc_info=True)
+            raise e
+
+    def _slug(self) -> str:
+        slug = self._main_url.strip('/').split('/')[-1]
+        if self.spec.toc.slug_strip:
+            slug = re.sub(self.spec.toc.slug_strip, '', slug)
+        return slug
+
+    def _chapter_url(self, number: int) -> str:
+        return self.spec.toc.url_template.format(base=self._base_url, slug=self._slug(), n=number)
+
+    @classmethod
+    def _endpoint_disabled(cls, host: str) -> bool:
+        with cls._endpoint_lock:
+            entry = cls._endpoint_failures.get(host)
+            return entry is not None and entry["until"] > time.time()
+
+    @classmethod
+    def _record_endpoint_result(cls, host: str, supported: bool):
+        settings = get_settings()
+        with cls._endpoint_lock:
+            if supported:
+                cls._endpoint_failures.pop(host, None)
+                return
+            entry = cls._endpoint_failures.setdefault(host, {"failures": 0, "until": 0.0})
+            entry["failures"] += 1
+            if entry["failures"] >= settings.TOC_ENDPOINT_MAX_FAILURES:
+                # Retried after a while: one more failure disables it again
+                entry["failures"] = settings.TOC_ENDPOINT_MAX_FAILURES - 1
+                entry["until"] = time.time() + settings.TOC_ENDPOINT_RETRY_SECONDS
+                logger.info(f"[{cls.__name__}] Fast chapter list disabled on {host} for {settings.TOC_ENDPOINT_RETRY_SECONDS}s.")
+
+    def _extract_endpoint_links(self, endpoint: TocEndpointSpec, raw: bytes) -> List[str]:
+        if endpoint.format == "html":
+            soup = make_soup(raw, encoding=self.spec.encoding)
+            anchors = []
+            for selector in endpoint.items:
+                anchors = select(soup, selector)
+                if anchors:
+                    break
+            hrefs = [a.get('href') for a in anchors]
+        else:
+            if endpoint.format == "embedded_json":
+                match = re.search(endpoint.pattern, raw.decode(self.spec.encoding, errors="replace"), re.DOTALL)
+                data = json.loads(match.group(1)) if match else []
+            else:
+                data = json.loads(raw)
+                for key in (endpoint.list_key.split('.') if endpoint.list_key else ()):
+                    data = data.get(key, []) if isinstance(data, dict) else []
+            hrefs = [item.get(endpoint.href_key) for item in data if isinstance(item, dict)]
+
+        links = [urljoin(self._base_url, href) for href in hrefs if href]
+        if endpoint.reverse:
+            links.reverse()
+        return links
+
+    def _endpoint_chapter_links(self) -> Optional[List[str]]:
+        """
+        Chapter URLs from the spec's fast TOC endpoint, or None when the site has no such
+        endpoint (or it failed) and the book page must be parsed instead.
+        """
+        endpoint = self.spec.toc.endpoint
+        host = urlparse(self._main_url).netloc.lower()
+        if not endpoint or self._endpoint_disabled(host):
+            return None
+
+        started = time.perf_counter()
+        try:
+            if endpoint.url_template:
+                url = endpoint.url_template.format(book_url=self._main_url.rstrip('/'), base=self._base_url)
+                response = self._session.request(
+                    endpoint.method, url,
+                    headers={"X-Requested-With": "XMLHttpRequest", "Referer": self._main_url},
+                    timeout=self.spec.timeout
+                )
+                if response.status_code in (400, 404, 405):
+                    self._record_endpoint_result(host, supported=False)
+                    logger.info(f"[{self.class_name}] No fast chapter list on {host} ({response.status_code}). Using the book page.")
+                    return None
+                response.raise_for_status()
+                raw = response.content
+                downloaded = len(raw)
+            else:
+                # Data embedded in the book page: only extra bytes count as downloaded
+                downloaded = 0 if self._main_page is not None else None
+                raw = self._get_main_page()
+                downloaded = len(raw) if downloaded is None else downloaded
+
+            links = self._extract_endpoint_links(endpoint, raw)
+        except Exception as e:
+            logger.warning(f"[{self.class_name}] Fast chapter list failed ({e}). Using the book page.")
+            return None
+
+        if not links:
+            if endpoint.url_template:
+                self._record_endpoint_result(host, supported=False)
+            logger.info(f"[{self.class_name}] Fast chapter list on {host} is empty. Using the book page.")
+            return None
+
+        if endpoint.url_template:
+            self._record_endpoint_result(host, supported=True)
+
+        # Embedded data rides on the book page: it saves parsing, not a download
+        source = "endpoint" if endpoint.url_template else "embedded"
+        MetricsService.record_toc_metric(
+            ScraperRegistry.domain_key(self._main_url), source, downloaded, time.perf_counter() - started, len(links)
+        )
+        logger.info(f"[{self.class_name}] Chapter list loaded from the fast endpoint ({len(links)} chapters, {downloaded} bytes).")
+        return links
+
+    def _fetch_index_page_links(self, page: int) -> List[str]:
+        links, _ = self._read_index_page(page)
+        return links
+
+    def _read_index_page(self, page: int) -> Tuple[List[str], int]:
+        """Returns the chapter links of one index page and the highest page number it links to."""
+        pages = self.spec.toc.pages
+        url = pages.url_template.format(
+            base=self._base_url, slug=self._slug(), book_url=self._main_url.rstrip('/'), page=page
+        )
+        if self._index_interval:
+            DomainRateLimiter.acquire(ScraperRegistry.domain_key(self._main_url), self._index_interval)
+        soup = make_soup(self._get_routed(url), pages.regions, encoding=self.spec.encoding)
+
+        anchors = []
+        for selector in pages.items:
+            anchors = select(soup, selector)
+            if anchors:
+                break
+        links = [urljoin(self._base_url, a.get('href')) for a in anchors if a.get('href')]
+
+        last_page = page
+        for anchor in select(soup, pages.last_page):
+            match = re.search(r'[?&]page=(\d+)', anchor.get('href') or '')
+            number = match.group(1) if match else anchor.get_text(strip=True)
+            if number.isdigit():
+                last_page = max(last_page, int(number))
+        return links, last_page
+
+    def _paginated_chapter_links(self) -> Optional[List[str]]:
+        """
+        Full chapter list from the paginated index: page 1 gives the page count,
+        the other pages are fetched concurrently and concatenated in order.
+        """
+        pages = self.spec.toc.pages
+        if not pages:
+            return None
+
+        started = time.perf_counter()
+        try:
+            links, last_page = self._read_index_page(pages.first_page)
+            remaining = list(range(pages.first_page + 1, last_page + 1))
+            if remaining:
+                workers = max(1, min(self.settings.TOC_PAGE_WORKERS, len(remaining)))
+                with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                    for page_links in executor.map(self._fetch_index_page_links, remaining):
+                        links.extend(page_links)
+        except Exception as e:
+            logger.warning(f"[{self.class_name}] Paginated chapter index failed ({e}).")
+            return None
+
+        if not links:
+            return None
+
+        MetricsService.record_toc_metric(
+            ScraperRegistry.domain_key(self._main_url), "pages", 0, time.perf_counter() - started, len(links)
+        )
+        logger.info(f"[{self.class_name}] Chapter index read: {len(links)} chapters over {last_page - pages.first_page + 1} pages.")
+        return links
+
+    def _discover_chapters(self) -> Tuple[Optional[int], Optional[List[str]]]:
+        """
+        Returns (total, links) for the book. `links` is None when only the count is known
+        (URLs come from the template) and `total` is None when nothing could be discovered (range mode).
+        Results are shared through the TocCache.
+        """
+        cached = TocCache.get(self._main_url)
+        if cached:
+            logger.info(f"[{self.class_name}] Using cached chapter list ({cached['total']} chapters).")
+            return cached["total"], cached["links"]
+
+        # One discovery per book at a time: a job started while the /generate pre-flight (or another
+        # job) still reads the index waits for it and reuses its result
+        with TocCache.discovery_lock(self._main_url):
+            cached = TocCache.get(self._main_url)
+            if cached:
+                return cached["total"], cached["links"]
+            return self._discover_uncached()
+
+    def _discover_uncached(self) -> Tuple[Optional[int], Optional[List[str]]]:
+        toc = self.spec.toc
+        links = self._endpoint_chapter_links()
+        if links is None:
+            links = self._paginated_chapter_links()
+
+        items = []
+        if links is None:
+            if toc.mode == "range":
+                return None, None
+
+            started = time.perf_counter()
+            page = self._get_main_page()
+            soup = make_soup(page, toc.regions, encoding=self.spec.encoding)
+            for selector in toc.items:
+                items = select(soup, selector)
+                if items:
+                    break
+            if toc.reverse:
+                items.reverse()
+            if toc.mode == "links":
+                links = [urljoin(self._base_url, item.get(toc.href_attr)) for item in items if item.get(toc.href_attr)]
+            MetricsService.record_toc_metric(
+                ScraperRegistry.domain_key(self._main_url), "html", len(page), time.perf_counter() - started,
+                len(links) if links is not None else len(items)
+            )
+
+        total = len(links) if links is not None else len(items)
+        if total:
+            TocCache.set(self._main_url, total, links)
+        return total, links
+
+    def get_total_chapters(self) -> Optional[int]:
+        return self._discover_chapters()[0]
+
+    def has_paginated_index(self) -> bool:
+        return self.spec.toc.pages is not None
+
+    def get_volumes(self) -> Optional[List[Tuple[str, int]]]:
+        toc = self.spec.toc
+        if not toc.volumes:
+            return None
+
+        soup = make_soup(self._get_main_page(), toc.regions, encoding=self.spec.encoding)
+        volumes = []
+        for number, container in enumerate(select(soup, toc.volumes), start=1):
+            items = []
+            for selector in toc.items:
+                items = select(container, selector)
+                if items:
+                    break
+            if items:
+                volumes.append((self._text(select_one(container, toc.volume_title)) or f"Volume {number}", len(items)))
+        if toc.reverse:
+            volumes.reverse()
+
+        # Only trust the grouping if it covers exactly the discovered chapter list
+        total = self.get_total_chapters()
+        if not volumes or sum(count for _, count in volumes) != total:
+            logger.info(f"[{self.class_name}] Site volumes unavailable or inconsistent with the chapter list.")
+            return None
+        return volumes
+
+    def get_chapters_link(self) -> list:
+        """Retrieves the chapter links of the requested range and validates it."""
+        if self._start_chapter < 1:
+            logger.error(f"[{self.class_name}] Invalid start chapter: {self._start_chapter}")
+            raise ValueError("Start chapter must be 1 or greater.")
+
+        end_chapter = self._start_chapter + self._chapters_quantity - 1
+        total_available, links = self._discover_chapters()
+
+        if total_available is None:
+            # Nothing to validate against: generate the requested range
+            logger.info(f"[{self.class_name}] Generating {self._chapters_quantity} links starting from chapter {self._start_chapter}")
+            return [self._chapter_url(n) for n in range(self._start_chapter, end_chapter + 1)]
+
+        logger.info(f"[{self.class_name}] Total chapters available on site: {total_available}")
+
+        if total_available == 0:
+            logger.error(f"[{self.class_name}] No chapters found on the page.")
+            raise ValueError("No chapters found.")
+
+        if self._start_chapter > total_available:
+            logger.error(f"[{self.class_name}] Range error: Start ({self._start_chapter}) > Total ({total_available})")
+            raise ValueError(
+                f"Requested start chapter ({self._start_chapter}) is greater "
+                f"than the total available chapters ({total_available})."
+            )
+
+        end_chapter = min(end_chapter, total_available)
+
+        if links is not None:
+            chapter_urls = links[self._start_chapter - 1:end_chapter]
+        else:
+            chapter_urls = [self._chapter_url(n) for n in range(self._start_chapter, end_chapter + 1)]
+
+        logger.info(f"[{self.class_name}] Queued {len(chapter_urls)} chapters for download (Range: {self._start_chapter}-{end_chapter})")
+        return chapter_urls
+
+    def _toc_fingerprint(self, page: bytes) -> str:
+        """
+        Hash of the part of the book page the chapter list depends on: the TOC items (or embedded
+        list), else the `poll_marker` text. Ads, view counters and nonces elsewhere on the page are
+        not a change. The whole page is hashed only when neither can be found.
+        """
+        toc = self.spec.toc
+        parts = []
+        if toc.endpoint and not toc.endpoint.url_template:
+            try:
+                parts = self._extract_endpoint_links(toc.endpoint, page)
+            except Exception:
+                parts = []
+
+        if not parts and (toc.items or toc.poll_marker):
+            regions = (*toc.regions, toc.poll_marker) if toc.regions and toc.poll_marker else toc.regions
+            soup = make_soup(page, regions, encoding=self.spec.encoding)
+            for selector in toc.items:
+                items = select(soup, selector)
+                if items:
+                    parts = [f"{item.get(toc.href_attr) or ''} {item.get_text(strip=True)}" for item in items]
+                    break
+            if not parts:
+                parts = [node.get_text(" ", strip=True) for node in select(soup, toc.poll_marker)]
+
+        data = "\n".join(parts).encode("utf-8") if parts else page
+        return hashlib.sha1(data).hexdigest()
+
+    def poll_chapters(self, validators: Optional[dict] = None,
+                      interval: Optional[float] = None) -> Tuple[Optional[List[str]], dict]:
+        """
+        Conditional GET of the book page with the previous poll's ETag / Last-Modified. Servers that
+        send neither are compared by a hash of the chapter list region (see _toc_fingerprint). Only a
+        changed list triggers a chapter discovery, which reuses the page just downloaded; its paginated
+        index pages (if any) are spaced by `interval` seconds per domain.
+        """
+        validators = validators or {}
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+        response = self._session.get(self._main_url, headers=headers, timeout=self.spec.timeout)
+        if response.status_code == 304:
+            return None, validators
+        response.raise_for_status()
+
+        page = response.content
+        current = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "toc_sha1": self._toc_fingerprint(page)
+        }
+        if current["toc_sha1"] == validators.get("toc_sha1"):
+            return None, current
+
+        with self._main_page_lock:
+            self._main_page = page
+        TocCache.invalidate(self._main_url)
+        self._index_interval = interval
+        try:
+            total, links = self._discover_chapters()
+        finally:
+            self._index_interval = None
+        if links is None and total is not None:
+            links = [self._chapter_url(n) for n in range(1, total + 1)]
+        return links, current
+
+    def get_chapter_content(self, url: str) -> ChapterContent:
+        return self.parse_chapter(self.fetch_chapter(url), url)
+
+    def fetch_chapter(self, url: str) -> bytes:
+        """Downloads the raw chapter page (retries and rate limits are handled by _fetch_with_retry)."""
+        return self._get_routed(url)
+
+    def _get_routed(self, url: str) -> bytes:
+        """
+        GET of a chapter or index page. Hosts registered with mirrors are served by the healthiest,
+        fastest one; connection errors and 5xx take a mirror out of rotation, so a retry fails over.
+        """
+        if not MirrorRouter.is_mirrored(url):
+            return self._get(url).content
+
+        target = MirrorRouter.route(url)
+        started = time.perf_counter()
+        try:
+            response = self._session.get(target, timeout=self.spec.timeout)
+            if response.status_code >= 500:
+                MirrorRouter.record_failure(target)
+            response.raise_for_status()
+        except requests.exceptions.HTTPError:
+            raise
+        except requests.exceptions.RequestException:
+            MirrorRouter.record_failure(target)
+            raise
+        MirrorRouter.record_success(target, time.perf_counter() - started)
+        return response.content
+
+    @staticmethod
+    def _is_visible_paragraph(paragraph) -> bool:
+        style = paragraph.get('style', '')
+        if 'display: none' in style or 'visibility: hidden' in style:
+            return False
+        return len(paragraph.get_text(strip=True)) >= 3
+
+    @classmethod
+    def parse_chapter(cls, html: bytes, url: str) -> ChapterContent:
+        """Extracts and cleans the title and body of a chapter page (runs in ParsePool workers too)."""
+        chapter = cls.spec.chapter
+        soup = make_soup(html, chapter.regions, encoding=cls.spec.encoding)
+
+        title = cls._text(select_one(soup, chapter.title)) or chapter.default_title
+
+        container = None
+        for selector in chapter.content:
+            container = select_one(soup, selector)
+            if container is not None:
+                break
+
+        if container is None:
+            # Empty content makes the base class retry (challenge pages, layout changes...)
+            logger.warning(f"[{cls.__name__}] Content not found for chapter URL: {url}")
+            return ChapterContent(title=title, content="")
+
+        for junk in select(container, chapter.junk):
+            junk.decompose()
+
+        if chapter.junk_text:
+            for paragraph in container.find_all('p'):
+                if any(marker in paragraph.get_text() for marker in chapter.junk_text):
+                    paragraph.decompose()
+
+        if chapter.junk_first_paragraph:
+            first = container.find('p')
+            if first is not None and any(marker in first.get_text() for marker in chapter.junk_first_paragraph):
+                first.decompose()
+
+        if chapter.paragraphs_only:
+            paragraphs = [p for p in container.find_all('p') if cls._is_visible_paragraph(p)]
+            if paragraphs:
+                return ChapterContent(title=title, content="".join(str(p) for p in paragraphs))
+            logger.warning(f"[{cls.__name__}] No valid paragraphs found. Falling back to full container text.")
+
+        return ChapterContent(title=title, content=container.decode_contents())
@@ -12,10 +12,116 @@ class Settings(BaseSettings):
     
     # Scraper Config
     MAX_CHAPTERS_LIMIT: int = 1000
+    MAX_SHARDED_CHAPTERS_LIMIT: int = 5000  # Limit for jobs split into volumes
+    VOLUME_WORKERS: int = 2  # Volumes of a sharded job downloaded/built concurrently
+    BATCH_MAX_ITEMS: int = 20  # Novels per /generate/batch request
+    BATCH_MAX_DOMAINS: int = 3  # Domains a job group works on at the same time (one novel per domain)
+    PARTIAL_MIN_CHAPTERS: int = 10  # Finished leading chapters before a running job announces a partial download
     DEFAULT_TIMEOUT: int = 15
     MAX_WORKERS: int = 2
     PROXY_URL: Optional[str] = None
     PROXY_URL_FALLBACK: Optional[str] = None
+
+    # Search (fan-out over several sources)
+    SEARCH_SOURCE_TIMEOUT: float = 8.0  # Deadline of each source; late sources are reported as timed out
+    SEARCH_WORKERS: int = 8  # Threads for blocking search fallbacks (anti-bot challenges)
+    SEARCH_CACHE_TTL: int = 300  # Seconds results are served as fresh. 0 disables the cache
+    SEARCH_CACHE_STALE_TTL: int = 3600  # Age up to which stale results are served while being refreshed
+    SEARCH_CACHE_MAX_ENTRIES: int = 1000
+
+    # Catalog index (crawled listing pages, used by /search/suggest)
+    CATALOG_INDEX_PATH: str = "data/catalog.json"
+    # Opt-in: every crawl reads up to CATALOG_MAX_PAGES listing pages per source
+    CATALOG_CRAWL_HOURS: int = 0  # How often the catalogs are crawled (e.g. 24). 0 disables the crawler
+    CATALOG_CRAWL_ON_STARTUP: bool = False  # Also crawl at startup when the index is empty (needs a persistent data/)
+    CATALOG_MAX_PAGES: int = 50  # Listing pages crawled per source
+    CATALOG_DOMAIN_INTERVAL: float = 5.0  # Min seconds between two listing pages of the same domain
+    CATALOG_SUGGEST_MIN_SIMILARITY: float = 0.3  # Trigram similarity needed by a title without a prefix match
+
+    # HTML parsing backend used by make_soup ('lxml' or 'html.parser')
+    HTML_PARSER_BACKEND: str = "lxml"
+
+    # Chapter lists (TOC)
+    TOC_CACHE_TTL: int = 900  # Seconds a discovered chapter list is reused. 0 disables the cache
+    TOC_PAGE_WORKERS: int = 4  # Concurrent fetches of paginated chapter indexes
+    TOC_ENDPOINT_MAX_FAILURES: int = 3  # Consecutive missing/empty fast chapter lists before a host stops using it
+    TOC_ENDPOINT_RETRY_SECONDS: int = 3600  # How long such a host uses the book page instead
+    TOC_PREFLIGHT_TIMEOUT: int = 10  # Max seconds /generate waits for the chapter count before accepting a job
+
+    # Novel details (/books/details)
+    DETAILS_CACHE_TTL: int = 3600  # Seconds a novel's metadata is reused. 0 disables the cache
+    DETAILS_TIMEOUT: int = 15  # Max seconds a lookup waits for the source
+    DETAILS_CONCURRENCY: int = 4  # Concurrent lookups of a batch
+    DETAILS_BATCH_MAX_ITEMS: int = 50
+
+    # Stored artifacts (EPUB + chapter manifest) used by incremental updates
+    ARTIFACT_STORE_DIR: str = "data/artifacts"
+    ARTIFACT_TTL_DAYS: int = 30  # Artifacts not updated for this long are deleted. 0 keeps them forever
+
+    # Graceful shutdown (SIGTERM): running jobs are drained, then interrupted with their checkpoints kept
+    SHUTDOWN_DRAIN_SECONDS: int = 20  # Keep under the platform's kill timeout (30s on Render)
+    SHUTDOWN_INTERRUPT_GRACE: int = 5  # Wait for interrupted jobs to stop after the chapters in flight
+    TASK_STATE_PATH: str = "data/tasks.json"  # Finished tasks saved at shutdown, restored at startup
+
+    # Checkpoints of the jobs in progress (resumed after a crash or redeploy)
+    CHECKPOINT_DIR: str = "data/checkpoints"
+    CHECKPOINT_MAX_AGE_HOURS: int = 24  # Older interrupted jobs are dropped instead of resumed
+    CHECKPOINT_MAX_RESUMES: int = 3  # A job interrupted this many times is dropped (e.g. it keeps running out of memory)
+    RESUME_ON_STARTUP: bool = True
+
+    # Background refill of the chapters a job stored as error placeholders
+    REFILL_STORE_PATH: str = "data/refills.json"  # Pending refills, kept across restarts
+    REFILL_TICK_SECONDS: int = 60  # How often due refills run. 0 disables the refill
+    REFILL_DELAY_SECONDS: int = 120  # Wait before the first attempt (doubled after every failed one)
+    REFILL_MAX_ATTEMPTS: int = 5
+    REFILL_DOMAIN_INTERVAL: float = 2.0  # Min seconds between two refill requests to the same domain
+
+    # New-chapter watcher (subscribed novels polled in the background)
+    WATCH_STORE_PATH: str = "data/watches.json"
+    WATCH_TICK_SECONDS: int = 60  # How often due subscriptions are polled. 0 disables the watcher
+    WATCH_INTERVAL_SECONDS: int = 3600  # Poll interval per novel (±20% jitter)
+    WATCH_DOMAIN_INTERVAL: float = 5.0  # Min seconds between two background requests to the same domain
+    WATCH_PREFETCH_MAX: int = 20  # New chapters prefetched per poll
+
+    # Chapter cache (prefetched chapters served to the next job)
+    CHAPTER_CACHE_TTL: int = 604800  # 7 days
+    CHAPTER_CACHE_MAX_ENTRIES: int = 2000  # 0 disables the cache
+
+    # Chapter reading API (/books/chapters) and its read-ahead
+    READER_PREFETCH_MIN: int = 1  # Chapters read ahead when the reading pace is unknown
+    READER_PREFETCH_MAX: int = 10
+    READER_PREFETCH_HORIZON: int = 120  # Seconds of reading the read-ahead tries to cover
+    READER_SESSION_GAP: int = 1800  # A pause longer than this starts a new reading session
+    READER_PREFETCH_WORKERS: int = 2
+    READER_PREFETCH_DOMAIN_INTERVAL: float = 1.0  # Min seconds between two read-ahead requests to a domain
+
+    # Chapter parsing (process pool for large jobs, in-process for small ones)
+    PARSE_PROCESS_WORKERS: int = 2  # 0 always parses in-process
+    PARSE_POOL_MIN_CHAPTERS: int = 50
+    PARSE_BATCH_SIZE: int = 10
+
+    # HTTP Sessions (pooled per domain, shared across jobs)
+    SESSION_POOL_SIZE: Optional[int] = None  # Defaults to MAX_WORKERS
+    HTTP_POOL_CONNECTIONS: int = 10
+    HTTP_POOL_MAXSIZE: int = 10
+    DNS_CACHE_TTL: int = 300  # Seconds. 0 disables the DNS cache
+
+    # Startup warm-up of pooled sessions (optional)
+    WARMUP_ON_STARTUP: bool = False
+    WARMUP_KEEPALIVE_SECONDS: int = 240  # 0 disables the periodic keep-alive
+
+    # Anti-bot clearance (cf_clearance & co.) persisted per domain/proxy
+    CLEARANCE_STORE_PATH: str = "data/clearance.json"
+    CLEARANCE_DEFAULT_TTL: int = 1800  # Lifetime for clearance session cookies without expiry
+
+    # Mirror routing (hosts registered as mirrors of each other)
+    MIRROR_FAILURE_THRESHOLD: int = 2  # Consecutive failures before a mirror is taken out of rotation
+    MIRROR_RECOVERY_SECONDS: int = 60  # Time out of rotation before a mirror is tried again
+    MIRROR_HEALTHCHECK_SECONDS: int = 120  # Interval of the background mirror health checks. 0 disables
+
+    # Circuit Breaker (per domain)
+    CIRCUIT_FAILURE_THRESHOLD: int = 5
+    CIRCUIT_RECOVERY_TIMEOUT: int = 120
     
     model_config = SettingsConfigDict(env_file=".env")
 
@@ -1,3 +1,4 @@
+import asyncio
 import time
 import uvicorn
 import requests
@@ -16,6 +17,20 @@ from src.utils.logger import logger
 from src.config import get_settings
 from src.services.registry import ScraperRegistry
 from src.services.cleanup_service import cleanup_stale_files
+from src.services.artifact_store import ArtifactStore
+from src.services.circuit_breaker import CircuitBreakerRegistry
+from src.services.session_manager import SessionManager
+from src.services.warmup_service import WarmupService
+from src.services.parse_pool import ParsePool
+from src.services.metrics_service import MetricsService
+from src.services.mirror_router import MirrorRouter
+from src.services.watch_service import WatchService
+from src.services.chapter_cache import ChapterCache
+from src.services.search_cache import SearchCache
+from src.services.catalog_index import CatalogIndex
+from src.services.refill_service import RefillService
+from src.services.shutdown_service import ShutdownService
+from src.services.task_manager import TaskManager
 
 
 # --- LOAD SETTINGS ---
@@ -71,18 +86,71 @@ async def lifespan(app: FastAPI):
     scheduler = AsyncIOScheduler()
     # Run cleanup every hour (3600s)
     scheduler.add_job(cleanup_stale_files, 'interval', seconds=3600)
+    scheduler.add_job(ArtifactStore.cleanup, 'interval', seconds=3600)
     scheduler.start()
     logger.info("🕒 Scheduler started: File cleanup job scheduled (every 1h).")
 
     # Discover and register scrapers
     ScraperRegistry.auto_discover()
+
+    # SIGTERM starts draining the jobs; finished tasks of the last run are served again
+    ShutdownService.install_signal_handlers()
+    TaskManager.load_state(settings.TASK_STATE_PATH)
+
+    # Jobs interrupted by the last shutdown or crash pick up where they stopped
+    resume_task = None
+    if settings.RESUME_ON_STARTUP:
+        resume_task = asyncio.create_task(book_routes.resume_interrupted_jobs())
+
+    # Optional non-blocking warm-up of pooled sessions for every registered domain
+    warmup_task = None
+    if settings.WARMUP_ON_STARTUP:
+        warmup_task = asyncio.create_task(WarmupService.warm_up_all())
+        if settings.WARMUP_KEEPALIVE_SECONDS > 0:
+            scheduler.add_job(WarmupService.keep_alive, 'interval', seconds=settings.WARMUP_KEEPALIVE_SECONDS)
+            logger.info(f"🔥 Session keep-alive scheduled (every {settings.WARMUP_KEEPALIVE_SECONDS}s).")
+
+    # New-chapter watcher (polls subscribed novels, prefetches what appeared)
+    if settings.WATCH_TICK_SECONDS > 0:
+        scheduler.add_job(WatchService.poll_due, 'interval', seconds=settings.WATCH_TICK_SECONDS)
+        logger.info(f"👀 New-chapter watcher scheduled (every {settings.WATCH_TICK_SECONDS}s).")
+
+    # Periodic health/latency checks of registered mirror hosts
+    if settings.MIRROR_HEALTHCHECK_SECONDS > 0 and ScraperRegistry.get_mirror_groups():
+        scheduler.add_job(MirrorRouter.check_all, 'interval', seconds=settings.MIRROR_HEALTHCHECK_SECONDS)
+        logger.info(f"🔀 Mirror health checks scheduled (every {settings.MIRROR_HEALTHCHECK_SECONDS}s).")
+
+    # Retries of the chapters finished jobs stored as error placeholders
+    if settings.REFILL_TICK_SECONDS > 0:
+        scheduler.add_job(RefillService.run_due, 'interval', seconds=settings.REFILL_TICK_SECONDS)
+        logger.info(f"🩹 Failed-chapter refill scheduled (every {settings.REFILL_TICK_SECONDS}s).")
+
+    # Optional catalog crawler feeding the /search/suggest index. The first crawl waits for the first
+    # scheduled run: on an ephemeral disk the index is empty on every boot
+    if settings.CATALOG_CRAWL_HOURS > 0:
+        scheduler.add_job(CatalogIndex.crawl_all, 'interval', hours=settings.CATALOG_CRAWL_HOURS)
+        if settings.CATALOG_CRAWL_ON_STARTUP and not CatalogIndex.stats():
+            scheduler.add_job(CatalogIndex.crawl_all)
+        logger.info(f"📚 Catalog crawler scheduled (every {settings.CATALOG_CRAWL_HOURS}h).")
     
     yield
+
+    # Drain (or interrupt and checkpoint) the running jobs, then save the finished tasks
+    await ShutdownService.shutdown()
+
+    if warmup_task and not warmup_task.done():
+        warmup_task.cancel()
+    if resume_task and not resume_task.done():
+        resume_task.cancel()
     
     # Shutdown: Stop Scheduler
     scheduler.shutdown()
     logger.info("🛑 Scheduler shut down.")
 
+    # Close pooled HTTP sessions and parser processes
+    SessionManager.reset()
+    ParsePool.shutdown()
+
 # Initialize the FastAPI application with professional metadata
 tags_metadata = [
     {
@@ -167,10 +235,18 @@ app.include_router(search_routes.router)  # Search stays public
 @app.get("/", tags=["Health"])
 def health_check():
     return {
-        "status": "online",
+        "status": "draining" if ShutdownService.is_draining() else "online",
         "message": f"{settings.APP_NAME} is running smoothly",
         "timestamp": time.time(),
-        "docs": "/docs"
+        "docs": "/docs",
+        "circuits": CircuitBreakerRegistry.snapshot(),
+        "sessions": SessionManager.stats(),
+        "warmup": WarmupService.readiness(),
+        "toc": MetricsService.get_toc_summary(),
+        "mirrors": MirrorRouter.snapshot(),
+        "chapter_cache": ChapterCache.stats(),
+        "search_cache": SearchCache.stats(),
+        "catalog": CatalogIndex.stats()
     }
 
 # --- DEBUG PROXY ROUTE ---
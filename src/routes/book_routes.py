@@ -3,12 +3,16 @@ import tempfile
 import os
 import re
 import json
+from typing import List, Optional
 
 from fastapi import APIRouter, HTTPException, Query, BackgroundTasks, Request, status
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from sse_starlette.sse import EventSourceResponse
 
-from src.schemas.novel_schema import TaskStartResponse, ErrorMessage
+from src.schemas.novel_schema import (
+    BatchGenerateRequest, BatchStartResponse, ChapterReadResponse, DetailsBatchRequest, DetailsBatchResponse, ErrorMessage,
+    NovelDetails, TaskStartResponse, WatchInfo
+)
 
 
 
@@ -17,6 +21,18 @@ from src.utils.logger import logger
 from src.config import get_settings
 from src.services.task_manager import TaskManager
 from src.services.epub_builder import EpubBuilder
+from src.services.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from src.services.toc_cache import TocCache
+from src.services.artifact_store import ArtifactStore
+from src.services.watch_service import WatchService
+from src.services.volume_service import VolumeService
+from src.services.details_service import NovelDetailsService
+from src.services.reader_service import ReaderService
+from src.services.partial_book import PartialBook
+from src.services.refill_service import RefillService
+from src.services.checkpoint_store import CheckpointStore
+from src.services.shutdown_service import ShutdownService
+from src.utils.exceptions import ChapterLimitException, CircuitOpenException, JobInterruptedException, NovelNotFoundException
 
 
 router = APIRouter(prefix="/books", tags=["Books"])
@@ -24,12 +40,22 @@ settings = get_settings()
 
 # --- BACKGROUND WORKER ---
 
-async def background_epub_generation(task_id: str, url: str, qty: int, start: int):
+async def background_epub_generation(task_id: str, url: str, qty: int, start: int, artifact_id: Optional[str] = None):
     """
     Background task that performs scraping and epub generation.
     Updates status in TaskManager.
+    With `artifact_id` (update jobs) the chapters of that stored artifact are reused
+    and the artifact is replaced by the new build.
+    Finished chapters are checkpointed (CheckpointStore) until the job is over, so a resumed job skips them.
     """
+    if ShutdownService.is_draining():
+        # Queued when the server began shutting down: its checkpoint resumes it after the restart
+        logger.info(f"[{task_id}] Not started (shutting down).")
+        await TaskManager.interrupt_task(task_id)
+        return
+
     logger.info(f"[{task_id}] Background task started.")
+    await TaskManager.update_progress(task_id, 0)
     
     # Define a sync callback wrapper to update async TaskManager
     # Because BaseScraper is sync, we might need a way to run async code.
@@ -69,9 +95,18 @@ async def background_epub_generation(task_id: str, url: str, qty: int, start: in
                     loop
                 )
 
+            reuse = ArtifactStore.load_chapters(artifact_id) if artifact_id else {}
+            # Chapters finished before a crash or redeploy interrupted this job
+            reuse.update(CheckpointStore.load_chapters(task_id))
             service = service_class()
             scraper = service.get_book_instance(url, qty, start)
-            return scraper.scrape_novel(progress_callback=update_progress_bridge)
+            # Finished leading chapters can be downloaded while the job goes on
+            partial = PartialBook()
+            TaskManager.set_partial(task_id, partial)
+            return scraper.scrape_novel(
+                progress_callback=update_progress_bridge, reuse=reuse, partial=partial,
+                chapter_callback=lambda _, chapter: CheckpointStore.add(task_id, chapter)
+            )
 
         logger.info(f"[{task_id}] Step 3: Run Executor")
         # Execute scraping in thread pool
@@ -81,30 +116,173 @@ async def background_epub_generation(task_id: str, url: str, qty: int, start: in
         # Build EPUB
         await TaskManager.update_progress(task_id, 98)
         result_buffer = EpubBuilder.create_epub(novel_data)
+        epub_bytes = result_buffer if isinstance(result_buffer, bytes) else result_buffer.getvalue()
         
         logger.info(f"[{task_id}] Step 5: Save File")
         # We use delete=False so we can serve it later.
         # It's important to cleanup later.
         with tempfile.NamedTemporaryFile(delete=False, suffix=".epub", mode="wb") as tmp:
-            if isinstance(result_buffer, bytes):
-                tmp.write(result_buffer)
-            else:
-                tmp.write(result_buffer.getbuffer())
+            tmp.write(epub_bytes)
             tmp_path = tmp.name
+
+        # Keep a copy with its chapter manifest for later incremental updates
+        artifact_id = await loop.run_in_executor(
+            None, ArtifactStore.save, epub_bytes, novel_data, url, start, artifact_id
+        )
             
         # Filename
         book_title = novel_data.metadata.book_title
         filename_raw = f"{book_title}.epub"
         filename_clean = re.sub(r'[^\w\s.-]', '', filename_raw).strip() or "novel.epub"
         
-        await TaskManager.complete_task(task_id, tmp_path, filename_clean)
+        # Chapters stored as error placeholders are retried in the background (see RefillService)
+        manifest = ArtifactStore.get_manifest(artifact_id) or {}
+        missing = sum(1 for entry in manifest.get("chapters", []) if entry.get("error"))
+        await TaskManager.complete_task(
+            task_id, tmp_path, filename_clean, artifact_id,
+            artifact_revision=manifest.get("revision"), missing_chapters=missing
+        )
+        if missing:
+            RefillService.schedule(artifact_id, url, task_id)
+        CheckpointStore.discard(task_id)
+        WatchService.mark_seen(url)
         logger.info(f"[{task_id}] Task finished successfully.")
 
+    except JobInterruptedException:
+        await TaskManager.interrupt_task(task_id)
+
+    except Exception as e:
+        logger.error(f"[{task_id}] Task failed: {e}", exc_info=True)
+        CheckpointStore.discard(task_id)
+        await TaskManager.fail_task(task_id, str(e))
+
+
+async def background_volume_generation(task_id: str, url: str, qty: int, start: int,
+                                       volume_size: Optional[int], site_volumes: bool):
+    """
+    Background task of a sharded job: volumes are scraped and built concurrently (see VolumeService)
+    and saved as one zip bundle, downloadable whole or volume by volume.
+    """
+    logger.info(f"[{task_id}] Background volume task started.")
+    try:
+        service_class = ScraperRegistry.get_service(url)
+        if not service_class:
+            await TaskManager.fail_task(task_id, "Unsupported domain.")
+            return
+
+        loop = asyncio.get_running_loop()
+
+        def blocking_scraping():
+            def update_progress_bridge(pct):
+                asyncio.run_coroutine_threadsafe(TaskManager.update_progress(task_id, pct), loop)
+
+            scraper = service_class().get_book_instance(url, qty, start)
+            return VolumeService.scrape_volumes(scraper, start, volume_size, site_volumes, update_progress_bridge)
+
+        metadata, volumes, bundle = await loop.run_in_executor(None, blocking_scraping)
+
+        with tempfile.NamedTemporaryFile(delete=False, prefix=VolumeService.BUNDLE_PREFIX, suffix=".zip", mode="wb") as tmp:
+            tmp.write(bundle)
+            tmp_path = tmp.name
+
+        filename = VolumeService.filename(metadata.book_title, ".zip")
+        await TaskManager.complete_task(task_id, tmp_path, filename, volumes=volumes)
+        WatchService.mark_seen(url)
+        logger.info(f"[{task_id}] Task finished successfully ({len(volumes)} volumes).")
+
     except Exception as e:
         logger.error(f"[{task_id}] Task failed: {e}", exc_info=True)
         await TaskManager.fail_task(task_id, str(e))
 
 
+async def background_batch_generation(items: List[tuple]):
+    """
+    Runs the items of a job group: one lane per domain, each working through its novels in order, with
+    at most BATCH_MAX_DOMAINS lanes at a time. Domains progress side by side while no source sees more
+    than one of the group's jobs (and its chapter workers) at once.
+    Items are (task_id, url, qty, start[, artifact_id]); each one reports through its own task.
+    """
+    lanes: dict = {}
+    for item in items:
+        lanes.setdefault(ScraperRegistry.domain_key(item[1]), []).append(item)
+
+    slots = asyncio.Semaphore(max(1, settings.BATCH_MAX_DOMAINS))
+
+    async def run_lane(lane: List[tuple]):
+        async with slots:
+            for task_id, url, qty, start, *artifact_id in lane:
+                await background_epub_generation(task_id, url, qty, start, *artifact_id)
+
+    logger.info(f"[Batch] Running {len(items)} novels over {len(lanes)} domains.")
+    await asyncio.gather(*(run_lane(lane) for lane in lanes.values()))
+
+
+async def resume_interrupted_jobs():
+    """
+    Startup: requeues the jobs the last shutdown or crash interrupted (see CheckpointStore) under their
+    task id, so clients can reconnect to their SSE stream. They run like a job group, one per domain at a time.
+    """
+    items = []
+    for job in CheckpointStore.pending():
+        if not ScraperRegistry.get_service(job["url"]):
+            CheckpointStore.discard(job["task_id"])
+            continue
+        CheckpointStore.mark_resumed(job)
+        await TaskManager.create_task(task_id=job["task_id"])
+        items.append((job["task_id"], job["url"], job["qty"], job["start"], job["artifact_id"]))
+
+    if items:
+        logger.info(f"[Resume] ♻️ Resuming {len(items)} interrupted jobs.")
+        await background_batch_generation(items)
+
+
+async def resolve_total_chapters(service_class, url: str) -> Optional[int]:
+    """
+    Real chapter count of a book when it is cheap to know before accepting the job: from the TocCache,
+    or a bounded read of a paginated index (the job reuses its result). None otherwise: the job
+    checks the range itself once it has the chapter list.
+    """
+    total = TocCache.get_total(url)
+    if total is not None:
+        return total
+
+    scraper = service_class().get_book_instance(url, 1, 1)
+    if not scraper.has_paginated_index():
+        return None
+
+    try:
+        loop = asyncio.get_running_loop()
+        # On timeout the read goes on in its thread and fills the TocCache; the job waits for it
+        discovery = loop.run_in_executor(None, scraper.get_total_chapters)
+        total = await asyncio.wait_for(asyncio.shield(discovery), timeout=settings.TOC_PREFLIGHT_TIMEOUT)
+    except Exception as e:
+        logger.warning(f"[Generate] Chapter count unavailable for {url}: {e!r}")
+        return None
+    return total if isinstance(total, int) else None
+
+
+def ensure_accepting_jobs():
+    """New jobs are refused while the server drains for a shutdown (another instance takes them)."""
+    if ShutdownService.is_draining():
+        raise HTTPException(
+            status_code=503,
+            detail="The server is restarting. Retry in a few seconds.",
+            headers={"Retry-After": str(settings.SHUTDOWN_DRAIN_SECONDS)}
+        )
+
+
+def ensure_circuit_closed(url: str):
+    """Fail fast while the source is banning us (see CircuitBreakerRegistry)."""
+    breaker = CircuitBreakerRegistry.get(url)
+    if breaker.state == CircuitBreaker.OPEN:
+        retry_after = breaker.retry_after()
+        raise HTTPException(
+            status_code=503,
+            detail=f"Source '{breaker.domain}' is temporarily blocking requests. Retry in {retry_after:.0f}s.",
+            headers={"Retry-After": str(int(retry_after) + 1)}
+        )
+
+
 # --- ENDPOINTS ---
 
 @router.post(
@@ -114,6 +292,7 @@ async def background_epub_generation(task_id: str, url: str, qty: int, start: in
     responses={
         400: {"model": ErrorMessage, "description": "Invalid parameters or unsupported domain"},
         401: {"model": ErrorMessage, "description": "Unauthorized - Missing or Invalid Token"},
+        503: {"model": ErrorMessage, "description": "Source is temporarily blocking requests (circuit open), or the server is restarting"},
         202: {"description": "Task accepted and started in background"}
     }
 )
@@ -132,8 +311,10 @@ async def start_generation_task(
             }
         }
     ),
-    qty: int = Query(default=1, ge=1, le=settings.MAX_CHAPTERS_LIMIT, description="Number of chapters to download", openapi_examples={"Default": {"value": 1}, "Batch": {"value": 5}}),
-    start: int = Query(default=1, ge=1, description="Starting chapter number", openapi_examples={"Beginning": {"value": 1}})
+    qty: int = Query(default=1, ge=1, le=settings.MAX_SHARDED_CHAPTERS_LIMIT, description=f"Number of chapters to download (over {settings.MAX_CHAPTERS_LIMIT} only when split into volumes)", openapi_examples={"Default": {"value": 1}, "Batch": {"value": 5}}),
+    start: int = Query(default=1, ge=1, description="Starting chapter number", openapi_examples={"Beginning": {"value": 1}}),
+    volume_size: Optional[int] = Query(default=None, ge=10, description="Split the job into volumes of this many chapters"),
+    site_volumes: bool = Query(default=False, description="Split the job along the site's own volumes (when it has them)")
 ):
     """
     **Start EPUB Generation Task**
@@ -142,19 +323,295 @@ async def start_generation_task(
     
     - **Security**: Requires a valid Internal JWT in the `Authorization` header.
     - **Flow**: Returns a `task_id` immediately. The client should listen to the SSE endpoint `/books/events/{task_id}` for progress updates.
+    - **Circuit Breaker**: Returns `503` (with `Retry-After`) while the source domain is blocking us.
+    - **Shutdown**: Returns `503` (with `Retry-After`) while the server drains for a restart.
+    - **Range Check**: Returns `400` when `start` is past the real number of chapters, if it is already known
+      (or read from a paginated chapter index within `TOC_PREFLIGHT_TIMEOUT`). Otherwise the job checks it and fails.
+    - **Volumes**: With `volume_size` or `site_volumes` the job produces one EPUB per volume, built concurrently and
+      delivered as a zip bundle (`/books/download/{task_id}`) or one by one (`/books/download/{task_id}/volumes/{n}`).
     """
+    ensure_accepting_jobs()
+    sharded = volume_size is not None or site_volumes
+    if qty > settings.MAX_CHAPTERS_LIMIT and not sharded:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Jobs over {settings.MAX_CHAPTERS_LIMIT} chapters must be split into volumes (volume_size or site_volumes)."
+        )
+
     # Quick Validation
-    if not ScraperRegistry.get_service(url):
+    service_class = ScraperRegistry.get_service(url)
+    if not service_class:
          raise HTTPException(status_code=400, detail="Unsupported domain.")
 
+    ensure_circuit_closed(url)
+
+    # Reject impossible ranges before any chapter is fetched
+    total = await resolve_total_chapters(service_class, url)
+    if total is not None and start > total:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Requested start chapter ({start}) is greater than the total available chapters ({total})."
+        )
+
     task_id = await TaskManager.create_task()
     
     # Add to Background Tasks
-    background_tasks.add_task(background_epub_generation, task_id, url, qty, start)
+    if sharded:
+        background_tasks.add_task(background_volume_generation, task_id, url, qty, start, volume_size, site_volumes)
+    else:
+        CheckpointStore.begin(task_id, url, qty, start)
+        background_tasks.add_task(background_epub_generation, task_id, url, qty, start)
     
     return {"task_id": task_id, "message": "Generation started", "status_url": f"/books/events/{task_id}"}
 
 
+@router.post(
+    "/generate/batch",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=BatchStartResponse,
+    responses={
+        400: {"model": ErrorMessage, "description": "An item has an unsupported domain"},
+        401: {"model": ErrorMessage, "description": "Unauthorized - Missing or Invalid Token"},
+        503: {"model": ErrorMessage, "description": "The server is restarting"},
+        202: {"description": "Job group accepted and started in background"}
+    }
+)
+async def start_batch_generation(request: BatchGenerateRequest, background_tasks: BackgroundTasks):
+    """
+    **Start a Batch of EPUB Generations**
+
+    Generates several novels (e.g. a reading list) as one job group.
+
+    - **Scheduling**: Novels of different domains run side by side; novels of the same domain run one after
+      another, so the group never multiplies the load (and rate limits) on a source.
+    - **Progress**: `/books/events/{batch_id}` streams the aggregate progress and the state of every item.
+    - **Download**: Each item is downloaded with its own `task_id` (`/books/download/{task_id}`).
+    """
+    ensure_accepting_jobs()
+    for item in request.items:
+        if not ScraperRegistry.get_service(str(item.url)):
+            raise HTTPException(status_code=400, detail=f"Unsupported domain: {item.url}")
+
+    items = []
+    for item in request.items:
+        url = str(item.url)
+        items.append((await TaskManager.create_task(url=url), url, item.qty, item.start))
+        CheckpointStore.begin(items[-1][0], url, item.qty, item.start)
+    batch_id = await TaskManager.create_batch([task_id for task_id, *_ in items])
+
+    background_tasks.add_task(background_batch_generation, items)
+
+    return {
+        "batch_id": batch_id,
+        "task_ids": [task_id for task_id, *_ in items],
+        "message": f"Batch of {len(items)} novels started",
+        "status_url": f"/books/events/{batch_id}"
+    }
+
+
+@router.post(
+    "/update",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=TaskStartResponse,
+    responses={
+        400: {"model": ErrorMessage, "description": "The artifact's source is no longer supported"},
+        401: {"model": ErrorMessage, "description": "Unauthorized - Missing or Invalid Token"},
+        404: {"model": ErrorMessage, "description": "Artifact not found (or expired)"},
+        503: {"model": ErrorMessage, "description": "Source is temporarily blocking requests (circuit open), or the server is restarting"},
+        202: {"description": "Update task accepted and started in background"}
+    }
+)
+async def start_update_task(
+    background_tasks: BackgroundTasks,
+    artifact_id: str = Query(..., description="Artifact returned by a completed generation (the `artifact_id` of its SSE event)")
+):
+    """
+    **Update a Previously Generated EPUB**
+
+    Rebuilds a stored artifact with the chapters its book gained since it was generated.
+
+    - **Bandwidth**: Only new chapters (or chapters whose URL changed, or that failed last time) are downloaded;
+      the others are reused from the stored EPUB.
+    - **Range**: From the artifact's start chapter up to the latest chapter (max `MAX_CHAPTERS_LIMIT`).
+    - **Flow**: Same as `/generate`; the completed artifact keeps its `artifact_id`.
+    """
+    ensure_accepting_jobs()
+    manifest = ArtifactStore.get_manifest(artifact_id)
+    if not manifest:
+        raise HTTPException(status_code=404, detail="Artifact not found or expired.")
+
+    url = manifest["source_url"]
+    if not ScraperRegistry.get_service(url):
+        raise HTTPException(status_code=400, detail="Unsupported domain.")
+    ensure_circuit_closed(url)
+
+    task_id = await TaskManager.create_task()
+    CheckpointStore.begin(task_id, url, settings.MAX_CHAPTERS_LIMIT, manifest["start"], artifact_id)
+    background_tasks.add_task(
+        background_epub_generation, task_id, url, settings.MAX_CHAPTERS_LIMIT, manifest["start"], artifact_id
+    )
+
+    return {"task_id": task_id, "message": "Update started", "status_url": f"/books/events/{task_id}"}
+
+
+@router.get(
+    "/details",
+    response_model=NovelDetails,
+    responses={
+        400: {"model": ErrorMessage, "description": "Unsupported domain"},
+        401: {"model": ErrorMessage, "description": "Unauthorized - Missing or Invalid Token"},
+        404: {"model": ErrorMessage, "description": "Novel not found"},
+        502: {"model": ErrorMessage, "description": "The source failed or its layout changed"},
+        503: {"model": ErrorMessage, "description": "Source is temporarily blocking requests (circuit open)"},
+        504: {"model": ErrorMessage, "description": "The source did not answer in time"}
+    }
+)
+async def get_novel_details(url: str = Query(..., description="The full URL of the novel series")):
+    """
+    **Novel Details**
+
+    Metadata (title, author, synopsis, cover) and the real chapter count of a novel, without starting a task.
+
+    - **Cache**: Repeated lookups are served from the details cache (`cached: true`); the chapter count is shared
+      with `/generate`, so a card shown right before a generation costs the job nothing.
+    """
+    if not ScraperRegistry.get_service(url):
+        raise HTTPException(status_code=400, detail="Unsupported domain.")
+    ensure_circuit_closed(url)
+
+    try:
+        return await NovelDetailsService.fetch(url)
+    except NovelNotFoundException as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except CircuitOpenException as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(int(e.retry_after) + 1)})
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="The source did not answer in time.")
+    except Exception as e:
+        logger.error(f"[Details] Lookup failed for {url}: {e}", exc_info=True)
+        raise HTTPException(status_code=502, detail="Could not read the novel details from the source.")
+
+
+@router.post(
+    "/details/batch",
+    response_model=DetailsBatchResponse,
+    responses={401: {"model": ErrorMessage, "description": "Unauthorized - Missing or Invalid Token"}}
+)
+async def get_novel_details_batch(request: DetailsBatchRequest):
+    """
+    **Batch Novel Details**
+
+    Looks several novels up concurrently (e.g. a reading list). Always `200`: every item carries its own `status`
+    (`ok`, `not_found`, `unsupported`, `blocked`, `timeout` or `error`), in request order.
+    """
+    return {"items": await NovelDetailsService.fetch_many([str(url) for url in request.urls])}
+
+
+@router.get(
+    "/chapters",
+    response_model=ChapterReadResponse,
+    responses={
+        400: {"model": ErrorMessage, "description": "Unsupported domain"},
+        401: {"model": ErrorMessage, "description": "Unauthorized - Missing or Invalid Token"},
+        404: {"model": ErrorMessage, "description": "No such chapter"},
+        502: {"model": ErrorMessage, "description": "The source failed or its layout changed"},
+        503: {"model": ErrorMessage, "description": "Source is temporarily blocking requests (circuit open)"}
+    }
+)
+async def read_chapter(
+    url: str = Query(..., description="The full URL of the novel series"),
+    n: int = Query(..., ge=1, description="Chapter number")
+):
+    """
+    **Read One Chapter**
+
+    Returns the cleaned content of a chapter, for reading in the browser instead of downloading an EPUB.
+
+    - **Read-ahead**: Every read prefetches the following chapters in the background (more of them for fast
+      sequential reading), so the next page is usually served from the chapter cache (`cached: true`).
+    """
+    if not ScraperRegistry.get_service(url):
+        raise HTTPException(status_code=400, detail="Unsupported domain.")
+    ensure_circuit_closed(url)
+
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, ReaderService.read, url, n)
+    except ChapterLimitException as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except CircuitOpenException as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(int(e.retry_after) + 1)})
+    except Exception as e:
+        logger.error(f"[Reader] Chapter {n} of {url} failed: {e}", exc_info=True)
+        raise HTTPException(status_code=502, detail="Could not read the chapter from the source.")
+
+
+@router.post(
+    "/watch",
+    response_model=WatchInfo,
+    responses={400: {"model": ErrorMessage, "description": "Unsupported domain"}}
+)
+async def watch_novel(url: str = Query(..., description="The full URL of the novel series to watch")):
+    """
+    **Watch a Novel for New Chapters**
+
+    The novel is polled in the background (conditional requests, jittered, rate limited per domain).
+    New chapters are listed here and prefetched, so the next `/generate` or `/update` serves them locally.
+    """
+    if not ScraperRegistry.get_service(url):
+        raise HTTPException(status_code=400, detail="Unsupported domain.")
+    return WatchService.subscribe(url)
+
+
+@router.get("/watch", response_model=List[WatchInfo])
+async def list_watched_novels():
+    """**List Watched Novels** with the chapters that appeared since their last completed job."""
+    return WatchService.list_all()
+
+
+@router.delete(
+    "/watch",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={404: {"model": ErrorMessage, "description": "Novel is not watched"}}
+)
+async def unwatch_novel(url: str = Query(..., description="The full URL of the watched novel")):
+    """**Stop Watching a Novel**"""
+    if not WatchService.unsubscribe(url):
+        raise HTTPException(status_code=404, detail="Novel is not watched.")
+
+
+def task_payload(task_id: str, task: Optional[dict]) -> dict:
+    """SSE view of one task (also used for the items of a job group)."""
+    if task is None:
+        return {"task_id": task_id, "status": "expired", "progress": 100}
+
+    payload = {"status": task["status"], "progress": task["progress"]}
+    if task.get("url"):
+        payload = {"task_id": task_id, "url": task["url"], **payload}
+
+    if task["status"] == "completed":
+        payload["download_url"] = f"/books/download/{task_id}"
+        payload["artifact_id"] = task.get("artifact_id")
+        if task.get("artifact_revision"):
+            payload["artifact_revision"] = task["artifact_revision"]
+            payload["missing_chapters"] = task.get("missing_chapters", 0)
+            payload["artifact_url"] = f"/books/artifacts/{task['artifact_id']}"
+        if task.get("volumes"):
+            payload["volumes"] = [
+                {**volume, "download_url": f"/books/download/{task_id}/volumes/{volume['number']}"}
+                for volume in task["volumes"]
+            ]
+
+    if task["status"] == "failed":
+        payload["error"] = task.get("error")
+
+    partial = task.get("partial")
+    if partial is not None and partial.ready:
+        payload["partial_chapters"] = partial.ready
+        payload["partial_download_url"] = f"/books/download/{task_id}?partial=1"
+    return payload
+
+
 @router.get(
     "/events/{task_id}",
     response_class=EventSourceResponse,
@@ -172,7 +629,16 @@ async def get_progress_events(request: Request, task_id: str):
     - **Events**:
         - `update`: JSON data `{ "status": "processing", "progress": 50 }`
         - `error`: JSON data `{ "message": "error details" }`
+        - **Interrupted**: Status `interrupted` when a server shutdown stopped the job; it resumes under the
+          same `task_id` after the restart (reconnect to this stream).
         - **Completion**: When status is `completed`, data includes `download_url`.
+        - `partial_available`: Sent once when the first `PARTIAL_MIN_CHAPTERS` chapters are done, with
+          `{ "chapters": n, "download_url": ".../download/{task_id}?partial=1" }`; later updates carry `partial_chapters`.
+        - `artifact_upgraded`: After completion, while failed chapters are being refilled in the background,
+          sent when the artifact was patched: `{ "artifact_id", "revision", "missing_chapters", "download_url" }`
+          (`download_url` is the artifact's, `/books/artifacts/{artifact_id}`: it works after the task was downloaded).
+        - **Job groups**: For a `batch_id`, data is the aggregate status/progress plus an `items` list
+          with the same fields per novel (and its `task_id`).
     """
     async def event_generator():
         # Check initial validity
@@ -183,8 +649,9 @@ async def get_progress_events(request: Request, task_id: str):
             }
             return
 
-        last_status = None
-        last_progress = -1
+        last_payload = None
+        partial_announced = False
+        completed_revision = None
 
         while True:
             # If client disconnects
@@ -194,32 +661,55 @@ async def get_progress_events(request: Request, task_id: str):
             task = TaskManager.get_task(task_id)
             if not task:
                 break
-                
-            status = task["status"]
-            progress = task["progress"]
-            
-            # Yield update if something changed
-            if status != last_status or progress != last_progress:
+
+            if task.get("items") is not None:
+                # Job group: aggregate progress plus the state of every item
+                batch = TaskManager.get_batch_state(task_id)
                 payload = {
-                    "status": status, 
-                    "progress": progress
+                    "status": batch["status"],
+                    "progress": batch["progress"],
+                    "items": [task_payload(item_id, item) for item_id, item in batch["items"]]
+                }
+            else:
+                payload = task_payload(task_id, task)
+            status = payload["status"]
+            # Read before the revision: a refill ending right after still has its upgrade reported
+            refilling = status == "completed" and task.get("missing_chapters") \
+                and RefillService.is_pending(task.get("artifact_id"))
+
+            partial = task.get("partial")
+            if not partial_announced and partial is not None and status == "processing" \
+                    and partial.ready >= min(settings.PARTIAL_MIN_CHAPTERS, partial.total or 1):
+                partial_announced = True
+                yield {
+                    "event": "partial_available",
+                    "data": json.dumps({"chapters": partial.ready, "download_url": payload["partial_download_url"]})
                 }
-                
-                if status == "completed":
-                    payload["download_url"] = f"/books/download/{task_id}"
-                
-                if status == "failed":
-                    payload["error"] = task.get("error")
-                
+
+            revision = task.get("artifact_revision")
+            if status == "completed" and revision:
+                if completed_revision is not None and revision != completed_revision:
+                    yield {
+                        "event": "artifact_upgraded",
+                        "data": json.dumps({
+                            "artifact_id": task["artifact_id"],
+                            "revision": revision,
+                            "missing_chapters": task.get("missing_chapters", 0),
+                            "download_url": payload["artifact_url"]
+                        })
+                    }
+                completed_revision = revision
+
+            # Yield update if something changed
+            if payload != last_payload:
                 yield {
                     "event": "update",
                     "data": json.dumps(payload)
                 }
-                
-                last_status = status
-                last_progress = progress
+                last_payload = payload
 
-            if status in ["completed", "failed"]:
+            # A completed task with failed chapters keeps streaming until its refill is over
+            if status in ["completed", "failed", "interrupted"] and not refilling:
                 break
             
             await asyncio.sleep(0.5)
@@ -239,22 +729,45 @@ async def get_progress_events(request: Request, task_id: str):
         500: {"model": ErrorMessage, "description": "File system error"}
     }
 )
-async def download_book(task_id: str, background_tasks: BackgroundTasks):
+async def download_book(
+    task_id: str,
+    background_tasks: BackgroundTasks,
+    partial: bool = Query(default=False, description="While the job runs, download the chapters finished so far")
+):
     """
     **Download Generated EPUB**
 
-    Retrieves the final EPUB file for a completed task.
+    Retrieves the final EPUB file for a completed task (the zip bundle of every volume for sharded jobs).
     
-    - **Cleanup**: The file is scheduled for deletion after successful download.
+    - **Partial**: With `partial=1` a running (or failed) job returns an EPUB of its chapters finished so far,
+      from chapter 1 up to the first one still missing. A completed job returns its final file.
+    - **Cleanup**: The file is scheduled for deletion after successful download (not after a partial download).
+      While failed chapters are being refilled the task itself is kept, so its SSE stream still reports the
+      upgrade; the upgraded book is then at `/books/artifacts/{artifact_id}`.
     - **Security**: Protected by JWT.
     """
     task = TaskManager.get_task(task_id)
+    if partial and task and task["status"] != "completed":
+        partial_book = task.get("partial")
+        build = await asyncio.get_running_loop().run_in_executor(None, partial_book.build) if partial_book else None
+        if not build:
+            raise HTTPException(status_code=404, detail="No finished chapters yet.")
+        chapters, epub_bytes = build
+        filename = VolumeService.filename(f"{partial_book.metadata.book_title} (1-{chapters})", ".epub")
+        return Response(
+            content=epub_bytes,
+            media_type="application/epub+zip",
+            headers={"Content-Disposition": f"attachment; filename=\"{filename}\""}
+        )
+
     if not task or task["status"] != "completed":
         raise HTTPException(status_code=404, detail="File not ready or task not found.")
         
     file_path = task.get("file_path")
     filename = task.get("filename", "novel.epub")
     
+    if not file_path and task.get("artifact_id"):
+        raise HTTPException(status_code=404, detail=f"Already downloaded. Get it at /books/artifacts/{task['artifact_id']}.")
     if not file_path or not os.path.exists(file_path):
         raise HTTPException(status_code=500, detail="File lost on server.")
 
@@ -262,11 +775,79 @@ async def download_book(task_id: str, background_tasks: BackgroundTasks):
     # We delay cleanup a bit or just rely on OS temp cleanup if we were purely temp.
     # Since we use NamedTemporaryFile with delete=False, we MUST manual clean.
     # BackgroundTasks runs AFTER response.
-    background_tasks.add_task(TaskManager.cleanup_task, task_id)
+    if RefillService.is_pending(task.get("artifact_id")):
+        background_tasks.add_task(TaskManager.release_file, task_id)
+    else:
+        background_tasks.add_task(TaskManager.cleanup_task, task_id)
     
     return FileResponse(
         path=file_path, 
         filename=filename, 
-        media_type="application/epub+zip",
+        media_type="application/zip" if task.get("volumes") else "application/epub+zip",
         headers={"Content-Disposition": f"attachment; filename=\"{filename}\""}
-    )
\ No newline at end of file
+    )
+
+
+@router.get(
+    "/download/{task_id}/volumes/{number}",
+    responses={
+        200: {"content": {"application/epub+zip": {}}, "description": "Returns one volume of a sharded job."},
+        404: {"model": ErrorMessage, "description": "Task, file or volume not found"}
+    }
+)
+async def download_volume(task_id: str, number: int):
+    """
+    **Download One Volume**
+
+    Retrieves a single EPUB of a completed sharded job. The bundle stays available for the other volumes
+    (it is removed once downloaded whole, or by the stale file cleanup).
+    """
+    task = TaskManager.get_task(task_id)
+    if not task or task["status"] != "completed" or not task.get("volumes"):
+        raise HTTPException(status_code=404, detail="File not ready or task not found.")
+
+    volume = next((v for v in task["volumes"] if v["number"] == number), None)
+    file_path = task.get("file_path")
+    if not volume or not file_path or not os.path.exists(file_path):
+        raise HTTPException(status_code=404, detail="Volume not found.")
+
+    content = await asyncio.get_running_loop().run_in_executor(
+        None, VolumeService.read_volume, file_path, volume["filename"]
+    )
+    return Response(
+        content=content,
+        media_type="application/epub+zip",
+        headers={"Content-Disposition": f"attachment; filename=\"{volume['filename']}\""}
+    )
+
+@router.get(
+    "/artifacts/{artifact_id}",
+    response_class=FileResponse,
+    responses={
+        200: {"content": {"application/epub+zip": {}}, "description": "Returns the latest revision of a stored artifact."},
+        404: {"model": ErrorMessage, "description": "Artifact not found (or expired)"}
+    }
+)
+async def download_artifact(artifact_id: str):
+    """
+    **Download a Stored Artifact**
+
+    Retrieves the latest revision of a generated EPUB by its `artifact_id`, e.g. after a background refill
+    replaced its failed chapters (SSE event `artifact_upgraded`). The artifact is kept (see `ARTIFACT_TTL_DAYS`).
+    The revision is returned in the `X-Artifact-Revision` header.
+    """
+    manifest = ArtifactStore.get_manifest(artifact_id)
+    path = ArtifactStore.get_path(artifact_id)
+    if not manifest or not path:
+        raise HTTPException(status_code=404, detail="Artifact not found or expired.")
+
+    filename = VolumeService.filename(manifest["title"], ".epub")
+    return FileResponse(
+        path=path,
+        filename=filename,
+        media_type="application/epub+zip",
+        headers={
+            "Content-Disposition": f"attachment; filename=\"{filename}\"",
+            "X-Artifact-Revision": str(manifest.get("revision", 1))
+        }
+    )
@@ -1,12 +1,14 @@
+import json
+from typing import Optional, Union
+
 from fastapi import APIRouter, HTTPException, Query
+from sse_starlette.sse import EventSourceResponse
 
-from src.schemas.novel_schema import SearchResponse, ErrorMessage
+from src.schemas.novel_schema import SearchResponse, MultiSearchResponse, SuggestResponse, ErrorMessage
 from src.utils.logger import logger
 
-from src.services.centralnovel_service import CentralNovelService
-from src.services.novelsbr_service import NovelsBrService
-from src.services.pandanovel_service import PandaNovelService
-from src.services.royalroad_service import RoyalRoadService
+from src.services.search_service import SearchService
+from src.services.catalog_index import CatalogIndex
 
 
 router = APIRouter(prefix="/search", tags=["Search"])
@@ -14,15 +16,17 @@ router = APIRouter(prefix="/search", tags=["Search"])
 
 @router.get(
     "/", 
-    response_model=SearchResponse,
+    response_model=Union[SearchResponse, MultiSearchResponse],
     responses={
+        200: {"content": {"text/event-stream": {}}, "description": "Results (SSE with `stream=true`)"},
         400: {"model": ErrorMessage, "description": "Invalid source or parameters"},
         500: {"model": ErrorMessage, "description": "Internal search error"}
     }
 )
-def search_novel(
-    source: str = Query(..., description="The source site (royal, panda, novelsbr, central)"),
-    query: str = Query(..., min_length=2, description="The search term (min 2 chars)")
+async def search_novel(
+    source: str = Query(..., description="The source site (royal, panda, novelsbr, central), a comma-separated list, or `all`"),
+    query: str = Query(..., min_length=2, description="The search term (min 2 chars)"),
+    stream: bool = Query(default=False, description="Stream each source's results (SSE) as soon as they arrive")
 ):
     """
     **Unified Novel Search**
@@ -30,55 +34,79 @@ def search_novel(
     Searches for novels across supported platforms.
     
     - **Sources**: `royal` (RoyalRoad), `panda` (PandaNovel), `novelsbr` (NovelsBr), `central` (CentralNovel).
+    - **Fan-out**: `all` or `royal,panda` searches the sources concurrently, each with its own deadline;
+      sources that time out or fail are reported with their `status` and the others are still returned.
+    - **Streaming**: With `stream=true` every source is sent as a `result` event when it finishes, then `done`.
     - **Public Endpoint**: No authentication required.
     """
     # Log the incoming request details
     logger.info(f"🔍 Incoming search request | Source: {source} | Query: {query}")
-    
-    source_key = source.lower().strip()
-    
-    # Mapping sources to their respective CLASSES
-    providers = {
-        "central": CentralNovelService,
-        "novelsbr": NovelsBrService,
-        "panda": PandaNovelService,
-        "royal": RoyalRoadService,
-    }
 
     # Validation for supported sources
-    if source_key not in providers:
-        available_sources = list(providers.keys())
-        logger.warning(f"⚠️ Unsupported source requested: {source}. Available: {available_sources}")
-        raise HTTPException(
-            status_code=400, 
-            detail=f"Invalid source. Available options: {available_sources}"
-        )
-
     try:
-        # 1. Select the correct service class
-        service_class = providers[source_key]
-        
-        # 2. Instantiate the service (initializes session and headers)
-        service_instance = service_class()
-        
-        # 3. Execute search
-        results = service_instance.search(query)
-        
+        sources = SearchService.resolve_sources(source)
+    except ValueError as e:
+        logger.warning(f"⚠️ Unsupported source requested: {source}.")
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if stream:
+        async def event_generator():
+            total = 0
+            async for outcome in SearchService.iter_search(sources, query):
+                total += outcome["results_count"]
+                yield {"event": "result", "data": json.dumps(outcome)}
+            yield {"event": "done", "data": json.dumps({"query": query, "results_count": total})}
+
+        return EventSourceResponse(event_generator())
+
+    single = len(sources) == 1 and "," not in source and source.strip().lower() != "all"
+    outcomes = await SearchService.search_many(sources, query)
+
+    if single:
+        outcome = outcomes[0]
+        if outcome["status"] != "ok":
+            logger.error(f"❌ Search Route Error for query '{query}': {outcome['status']} {outcome['error'] or ''}")
+            raise HTTPException(
+                status_code=500, 
+                detail="An error occurred during search. Please check the logs for more details."
+            )
         # Log success with the number of results found
-        logger.info(f"✅ Search successful | Source: {source_key} | Results found: {len(results)}")
-        
-        # 4. Return validated response matching the SearchResponse schema
+        logger.info(f"✅ Search successful | Source: {outcome['source']} | Results found: {outcome['results_count']}")
         return {
-            "source": source_key,
-            "results_count": len(results),
-            "results": results
+            "source": outcome["source"],
+            "results_count": outcome["results_count"],
+            "results": outcome["results"]
         }
-        
-    except Exception as e:
-        # Log the error with full traceback (exc_info=True) for easier debugging
-        logger.error(f"❌ Search Route Error for query '{query}': {str(e)}", exc_info=True)
-        
-        raise HTTPException(
-            status_code=500, 
-            detail="An error occurred during search. Please check the logs for more details."
-        )
+
+    total = sum(outcome["results_count"] for outcome in outcomes)
+    logger.info(
+        f"✅ Fan-out search done | Results found: {total} | "
+        + ", ".join(f"{o['source']}={o['status']}({o['results_count']})" for o in outcomes)
+    )
+    return {"query": query, "results_count": total, "sources": outcomes}
+
+
+@router.get(
+    "/suggest",
+    response_model=SuggestResponse,
+    responses={400: {"model": ErrorMessage, "description": "Invalid source"}}
+)
+def suggest_novels(
+    query: str = Query(..., min_length=1, description="What the user typed so far"),
+    source: Optional[str] = Query(default=None, description="Restrict to one source (royal, panda, novelsbr, central)"),
+    limit: int = Query(default=10, ge=1, le=50, description="Max suggestions")
+):
+    """
+    **Title Autocomplete**
+
+    Answers from the local catalog index (built in the background from the sources' listing pages),
+    without contacting any site. Matches title and word prefixes and tolerates typos.
+    Novels missing from the crawled catalogs are only found by the regular search.
+
+    - **Public Endpoint**: No authentication required.
+    """
+    if source and source.strip().lower() not in SearchService.PROVIDERS:
+        raise HTTPException(status_code=400, detail=f"Invalid source. Available options: {list(SearchService.PROVIDERS)}")
+
+    results = CatalogIndex.suggest(query, source.strip().lower() if source else None, limit)
+    return {"query": query, "results_count": len(results), "results": results}
@@ -23,6 +23,36 @@ class SearchResponse(BaseModel):
     results: List[NovelSearchResult]
 
 
+class SourceSearchResult(BaseModel):
+    """Outcome of one source in a fan-out search."""
+    source: str
+    status: str = Field(..., description="ok, timeout or error")
+    results_count: int
+    results: List[NovelSearchResult]
+    duration_ms: int
+    error: Optional[str] = None
+    cached: bool = Field(default=False, description="Served from the search cache")
+
+
+class MultiSearchResponse(BaseModel):
+    """Schema for a search over several sources (partial when some of them failed or timed out)."""
+    query: str
+    results_count: int
+    sources: List[SourceSearchResult]
+
+
+class SuggestResult(NovelSearchResult):
+    """Autocomplete entry from the local catalog index."""
+    source: str
+
+
+class SuggestResponse(BaseModel):
+    """Schema for /search/suggest (answered from the catalog index, no network access)."""
+    query: str
+    results_count: int
+    results: List[SuggestResult]
+
+
 # --- DOWNLOAD / EPUB SCHEMAS ---
 
 class TaskStartResponse(BaseModel):
@@ -32,6 +62,17 @@ class TaskStartResponse(BaseModel):
     status_url: str = Field(..., description="URL to listen for progress events (SSE)")
 
 
+class WatchInfo(BaseModel):
+    """State of a novel watched for new chapters."""
+    url: str
+    known_chapters: int = Field(..., description="Chapters seen on the last poll")
+    new_chapters: List[str] = Field(default_factory=list, description="Chapters that appeared since the last completed job")
+    prefetched: int = Field(0, description="New chapters already downloaded (served instantly)")
+    last_checked_at: Optional[float] = None
+    next_check_at: float
+    last_error: Optional[str] = None
+
+
 class EpubRequest(BaseModel):
     """
     Schema for EPUB generation request. 
@@ -42,6 +83,19 @@ class EpubRequest(BaseModel):
     start: int = Field(default=1, ge=1, description="Starting chapter number")
 
 
+class BatchGenerateRequest(BaseModel):
+    """Several novels generated as one job group (e.g. a user's reading list)."""
+    items: List[EpubRequest] = Field(..., min_length=1, max_length=settings.BATCH_MAX_ITEMS)
+
+
+class BatchStartResponse(BaseModel):
+    """Response schema for starting a job group."""
+    batch_id: str = Field(..., description="ID of the job group (aggregate progress on its SSE stream)")
+    task_ids: List[str] = Field(..., description="One task per item, in request order (downloads use these IDs)")
+    message: str
+    status_url: str = Field(..., description="SSE stream with aggregate and per-item progress")
+
+
 class BookMetadata(BaseModel):
     """Schema for the book metadata extracted before/during generation."""
     book_title: str
@@ -50,6 +104,43 @@ class BookMetadata(BaseModel):
     book_cover_link: Optional[str] = None
 
 
+class NovelDetails(BookMetadata):
+    """Novel card returned by /books/details."""
+    url: str
+    total_chapters: Optional[int] = Field(None, description="Real number of chapters (None when the source does not tell)")
+    cached: bool = Field(False, description="Served from the details cache")
+
+
+class DetailsBatchRequest(BaseModel):
+    """Several novels looked up at once."""
+    urls: List[HttpUrl] = Field(..., min_length=1, max_length=settings.DETAILS_BATCH_MAX_ITEMS)
+
+
+class DetailsBatchItem(BaseModel):
+    """Outcome of one novel of a batch lookup."""
+    url: str
+    status: str = Field(..., description="ok, not_found, unsupported, blocked, timeout or error")
+    details: Optional[NovelDetails] = None
+    error: Optional[str] = None
+
+
+class DetailsBatchResponse(BaseModel):
+    """Schema for a batch lookup (in request order)."""
+    items: List[DetailsBatchItem]
+
+
+class ChapterReadResponse(BaseModel):
+    """One chapter served by the reading API (/books/chapters)."""
+    url: str = Field(..., description="The novel URL")
+    n: int = Field(..., description="Chapter number")
+    chapter_url: str
+    title: str
+    content: str = Field(..., description="Cleaned chapter HTML")
+    total_chapters: Optional[int] = None
+    cached: bool = Field(False, description="Served from the chapter cache")
+    prefetching: int = Field(0, description="Following chapters queued for read-ahead by this read")
+
+
 # --- ERROR SCHEMAS ---
 
 class ErrorMessage(BaseModel):
@@ -69,9 +160,11 @@ class Chapter(BaseModel):
     index: int
     title: str
     content: str  # HTML content
+    url: Optional[str] = None  # Source page (recorded in the artifact manifest)
+    document: Optional[bytes] = None  # Rendered XHTML reused as-is from a previous artifact
 
 class Novel(BaseModel):
     """Represents the complete novel data ready for export."""
     metadata: BookMetadata
     chapters: List[Chapter]
-    cover_image_bytes: Optional[bytes] = None  # Raw bytes of the cover image
\ No newline at end of file
+    cover_image_bytes: Optional[bytes] = None  # Raw bytes of the cover image
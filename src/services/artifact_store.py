@@ -0,0 +1,205 @@
+import html
+import json
+import os
+import re
+import threading
+import time
+import uuid
+import zipfile
+from typing import Dict, List, Optional
+
+from src.config import get_settings
+from src.schemas.novel_schema import Chapter, Novel
+from src.utils.constants import EPUB_STRINGS
+from src.utils.logger import logger
+
+
+class ArtifactStore:
+    """
+    Keeps generated EPUBs together with a manifest of their chapters, so an update job only
+    downloads the chapters a book gained (or whose URL changed) since the artifact was built.
+
+    Layout: `<ARTIFACT_STORE_DIR>/<artifact_id>.epub` and `<artifact_id>.json` (the manifest).
+    """
+    MANIFEST_VERSION = 1
+    _ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+    _lock = threading.Lock()
+
+    @classmethod
+    def _dir(cls) -> str:
+        return get_settings().ARTIFACT_STORE_DIR
+
+    @classmethod
+    def _paths(cls, artifact_id: str) -> Optional[tuple]:
+        # Artifact ids come from clients: never let them escape the store directory
+        if not artifact_id or not cls._ID_PATTERN.match(artifact_id):
+            return None
+        base = os.path.join(cls._dir(), artifact_id)
+        return f"{base}.epub", f"{base}.json"
+
+    @classmethod
+    def save(cls, epub_bytes: bytes, novel: Novel, source_url: str, start: int,
+             artifact_id: Optional[str] = None) -> str:
+        """Stores (or replaces, when `artifact_id` is given) an artifact. Returns its id."""
+        artifact_id = artifact_id or uuid.uuid4().hex
+        epub_path, manifest_path = cls._paths(artifact_id)
+        now = time.time()
+        previous = cls.get_manifest(artifact_id) or {}
+
+        manifest = {
+            "version": cls.MANIFEST_VERSION,
+            "artifact_id": artifact_id,
+            "source_url": source_url,
+            "start": start,
+            "title": novel.metadata.book_title,
+            "created_at": previous.get("created_at", now),
+            "updated_at": now,
+            # Bumped on every rebuild or refill: clients holding an older revision can fetch the new one
+            "revision": previous.get("revision", 0) + 1,
+            "chapters": [
+                {
+                    "index": chapter.index,
+                    "url": chapter.url,
+                    "title": chapter.title,
+                    "file": f"chap_{chapter.index}.xhtml",
+                    # Error placeholders are downloaded again by the next update
+                    "error": chapter.document is None and chapter.content == EPUB_STRINGS["error_content"]
+                }
+                for chapter in novel.chapters
+            ]
+        }
+
+        with cls._lock:
+            os.makedirs(cls._dir(), exist_ok=True)
+            # Write-then-rename: a reader never sees a half-written artifact
+            for path, data, mode in ((epub_path, epub_bytes, "wb"), (manifest_path, json.dumps(manifest), "w")):
+                tmp_path = f"{path}.tmp"
+                with open(tmp_path, mode) as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+
+        logger.info(f"[ArtifactStore] Saved {artifact_id} ({len(novel.chapters)} chapters) for {source_url}")
+        return artifact_id
+
+    @classmethod
+    def get_manifest(cls, artifact_id: str) -> Optional[dict]:
+        paths = cls._paths(artifact_id)
+        if not paths or not os.path.exists(paths[0]) or not os.path.exists(paths[1]):
+            return None
+        try:
+            with open(paths[1], "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"[ArtifactStore] Unreadable manifest for {artifact_id}: {e}")
+            return None
+
+    @classmethod
+    def get_path(cls, artifact_id: str) -> Optional[str]:
+        paths = cls._paths(artifact_id)
+        return paths[0] if paths and os.path.exists(paths[0]) else None
+
+    @classmethod
+    def failed_chapters(cls, artifact_id: str) -> List[dict]:
+        """Manifest entries of the chapters stored as error placeholders."""
+        manifest = cls.get_manifest(artifact_id)
+        if not manifest:
+            return []
+        return [entry for entry in manifest["chapters"] if entry.get("error") and entry.get("url")]
+
+    @classmethod
+    def patch_chapters(cls, artifact_id: str, chapters: List[Chapter]) -> Optional[int]:
+        """
+        Replaces the pages of placeholder chapters with `chapters` (matched by index; `document` set)
+        without rebuilding the book: only their zip entries and their titles in the table of contents change.
+        Returns the artifact's new revision, or None when it no longer exists.
+        """
+        manifest = cls.get_manifest(artifact_id)
+        if not manifest or not chapters:
+            return None
+        epub_path, manifest_path = cls._paths(artifact_id)
+        entries = {entry["index"]: entry for entry in manifest["chapters"]}
+        patched = {
+            entries[chapter.index]["file"]: (entries[chapter.index], chapter)
+            for chapter in chapters if chapter.index in entries and chapter.document
+        }
+        if not patched:
+            return None
+
+        def retitle(data: bytes) -> bytes:
+            # nav.xhtml / toc.ncx still list the placeholder title ("Error Chapter N")
+            text = data.decode("utf-8")
+            for entry, chapter in patched.values():
+                text = text.replace(f">{html.escape(entry['title'], quote=False)}<",
+                                    f">{html.escape(chapter.title, quote=False)}<")
+            return text.encode("utf-8")
+
+        with cls._lock:
+            tmp_path = f"{epub_path}.tmp"
+            with zipfile.ZipFile(epub_path) as source, zipfile.ZipFile(tmp_path, "w") as target:
+                # Same entries, same order and compression (the stored `mimetype` entry stays first)
+                for info in source.infolist():
+                    name = info.filename.rsplit("/", 1)[-1]
+                    if name in patched:
+                        data = patched[name][1].document
+                    elif name.endswith((".ncx", "nav.xhtml")):
+                        data = retitle(source.read(info))
+                    else:
+                        data = source.read(info)
+                    target.writestr(info, data)
+            os.replace(tmp_path, epub_path)
+
+            for entry, chapter in patched.values():
+                entry["title"] = chapter.title
+                entry["error"] = False
+            manifest["revision"] = manifest.get("revision", 1) + 1
+            manifest["updated_at"] = time.time()
+            tmp_path = f"{manifest_path}.tmp"
+            with open(tmp_path, "w") as f:
+                f.write(json.dumps(manifest))
+            os.replace(tmp_path, manifest_path)
+
+        logger.info(f"[ArtifactStore] Patched {len(patched)} chapters of {artifact_id} (revision {manifest['revision']})")
+        return manifest["revision"]
+
+    @classmethod
+    def load_chapters(cls, artifact_id: str) -> Dict[str, Chapter]:
+        """
+        Chapters of a stored artifact that can be reused, keyed by source URL.
+        Their `document` is the rendered XHTML read back from the EPUB, so they are never downloaded again.
+        """
+        manifest = cls.get_manifest(artifact_id)
+        if not manifest:
+            return {}
+
+        reusable = {}
+        with zipfile.ZipFile(cls.get_path(artifact_id)) as archive:
+            # ebooklib writes the chapters under the package folder (EPUB/ by default)
+            by_file = {name.rsplit("/", 1)[-1]: name for name in archive.namelist()}
+            for entry in manifest["chapters"]:
+                name = by_file.get(entry["file"])
+                if not entry.get("url") or entry.get("error") or not name:
+                    continue
+                reusable[entry["url"]] = Chapter(
+                    index=entry["index"], title=entry["title"], content="",
+                    url=entry["url"], document=archive.read(name)
+                )
+        return reusable
+
+    @classmethod
+    def cleanup(cls, max_age_days: Optional[int] = None):
+        """Deletes artifacts not updated for ARTIFACT_TTL_DAYS (scheduled job)."""
+        max_age_days = get_settings().ARTIFACT_TTL_DAYS if max_age_days is None else max_age_days
+        if max_age_days <= 0 or not os.path.isdir(cls._dir()):
+            return
+        cutoff = time.time() - max_age_days * 86400
+        removed = 0
+        for name in os.listdir(cls._dir()):
+            path = os.path.join(cls._dir(), name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    removed += name.endswith(".epub")
+            except OSError:
+                continue
+        if removed:
+            logger.info(f"[ArtifactStore] Removed {removed} expired artifacts.")
@@ -1,8 +1,11 @@
+import asyncio
 import os
-import cloudscraper
 from abc import ABC, abstractmethod
+from typing import Optional
 from dotenv import load_dotenv
 from src.utils.logger import logger
+from src.services.session_manager import SessionManager
+from src.utils.exceptions import SearchFailedException
 
 
 class BaseService(ABC):
@@ -17,28 +20,20 @@ class BaseService(ABC):
 
         # Child class name for precise logging (e.g., RoyalRoadService)
         self.service_name = self.__class__.__name__
-        
-        # Shared session using cloudscraper to bypass Cloudflare/Wordfence.
-        self._session = cloudscraper.create_scraper(
-            browser={
-                'browser': 'chrome',
-                'platform': 'windows',
-                'desktop': True
-            }
-        )
 
+        # Set by `search` when it returned [] because of an error rather than because nothing matched
+        self.last_search_error: Optional[Exception] = None
+        
         # Proxy configuration via Environment Variable
         proxy_url = os.environ.get("PROXY_URL")
         if proxy_url:
-            self._session.proxies = {
-                "http": proxy_url,
-                "https": proxy_url
-            }
             logger.info(f"[{self.service_name}] Proxy enabled for search service.")
         else:
             logger.warning(f"[{self.service_name}] No proxy detected for search. Using direct IP.")
-        
-        logger.debug(f"[{self.service_name}] Cloudscraper session initialized.")
+
+        # Pooled session shared with every other service/scraper instance (cheap to create).
+        # Cloudflare/Wordfence bypass is handled by the pooled cloudscraper sessions.
+        self._session = SessionManager.get_session(self.service_name, proxy_url)
 
     @abstractmethod
     def search(self, query: str) -> list:
@@ -48,6 +43,35 @@ class BaseService(ABC):
         logger.info(f"[{self.service_name}] Starting search for query: '{query}'")
         pass
 
+    async def asearch(self, query: str) -> list:
+        """
+        Non-blocking search, used by the search routes. Sources implement it over the pooled async
+        client (`self._session.aget`) and fall back to the blocking `search` in a worker thread when
+        an anti-bot challenge needs cloudscraper. Unlike `search`, failures raise.
+
+        Default: the blocking search in a worker thread.
+        """
+        return await self._blocking_search(query, "No async search")
+
+    async def _blocking_search(self, query: str, reason: str) -> list:
+        """
+        Blocking fallback of `asearch` (cloudscraper solves what the async client cannot).
+        Raises SearchFailedException when `search` swallowed an error, so it is not cached as "no results".
+        """
+        logger.info(f"[{self.service_name}] {reason}: searching '{query}' with the blocking session.")
+        self.last_search_error = None
+        results = await asyncio.to_thread(self.search, query)
+        if self.last_search_error is not None:
+            raise SearchFailedException(f"{self.service_name} search failed: {self.last_search_error}")
+        return results
+
+    def catalog_page(self, page: int) -> Optional[list]:
+        """
+        One page (1-based) of the site's novel listing, as search results, for the catalog crawler.
+        An empty list ends the crawl; None means the site has no crawlable listing.
+        """
+        return None
+
     @abstractmethod
     def get_book_instance(self, url: str, qty: int, start: int):
         """
@@ -0,0 +1,229 @@
+import bisect
+import json
+import os
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+from src.config import get_settings
+from src.services.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from src.services.rate_limiter import DomainRateLimiter
+from src.services.registry import ScraperRegistry
+from src.services.search_cache import SearchCache
+from src.services.search_service import SearchService
+from src.utils.logger import logger
+
+
+class _TitleIndex:
+    """Immutable lookup structures over the catalog titles (rebuilt after every crawl)."""
+
+    def __init__(self, items: List[dict]):
+        self.items = items
+        self.titles = [SearchCache.normalize(item["title"]) for item in items]
+        self.grams: Dict[str, List[int]] = {}
+        words = []
+        for position, title in enumerate(self.titles):
+            for gram in _trigrams(title):
+                self.grams.setdefault(gram, []).append(position)
+            words.extend((word, position) for word in set(title.split()))
+        # Sorted (word, position) pairs: word prefixes are a bisect away
+        self.words = sorted(words)
+
+
+def _trigrams(text: str) -> set:
+    # Per word, padded like pg_trgm: "  c", " ch", "chi", ... "en "
+    grams = set()
+    for word in text.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class CatalogIndex:
+    """
+    Local title index of the sources' catalogs, for autocomplete without any network access.
+    A scheduled crawler walks each source's listing pages (BaseService.catalog_page) under the
+    per-domain rate limit; titles are indexed by word prefix and by trigram (typo tolerant).
+
+    The crawled catalogs are persisted (CATALOG_INDEX_PATH) so restarts do not start empty.
+    """
+    # { source: { "crawled_at": float, "items": [ { "title", "url", "cover", "chapters_count" } ] } }
+    _catalogs: Dict[str, dict] = {}
+    _index: _TitleIndex = _TitleIndex([])
+    _loaded = False
+    _lock = threading.RLock()
+
+    @classmethod
+    def _path(cls) -> str:
+        return get_settings().CATALOG_INDEX_PATH
+
+    @classmethod
+    def _ensure_loaded(cls):
+        # Caller must hold the lock
+        if cls._loaded:
+            return
+        cls._loaded = True
+        path = cls._path()
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    cls._catalogs = json.load(f)
+                logger.info(f"[CatalogIndex] Loaded {sum(len(c['items']) for c in cls._catalogs.values())} titles.")
+            except Exception as e:
+                logger.warning(f"[CatalogIndex] Could not load {path}: {e}")
+                cls._catalogs = {}
+        cls._rebuild()
+
+    @classmethod
+    def _save(cls):
+        # Caller must hold the lock. Write-then-rename so a crash never leaves a truncated file.
+        path = cls._path()
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(cls._catalogs, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"[CatalogIndex] Failed to persist the catalog: {e}")
+
+    @classmethod
+    def _rebuild(cls):
+        # Caller must hold the lock. Readers keep using the previous index until the swap.
+        items = [
+            {**item, "source": source}
+            for source, catalog in cls._catalogs.items()
+            for item in catalog["items"]
+        ]
+        cls._index = _TitleIndex(items)
+
+    @classmethod
+    def crawl(cls, source: str) -> Optional[int]:
+        """
+        Walks one source's listing pages. Returns the titles indexed (None: no crawlable listing).
+        A crawl interrupted by an error or an open circuit only adds to the previous catalog of the source.
+        """
+        settings = get_settings()
+        service = SearchService.PROVIDERS[source]()
+        base_url = service.BASE_URL
+        domain = ScraperRegistry.domain_key(base_url)
+
+        collected: Dict[str, dict] = {}
+        complete = True
+        for page in range(1, settings.CATALOG_MAX_PAGES + 1):
+            if CircuitBreakerRegistry.get(base_url).state == CircuitBreaker.OPEN:
+                logger.warning(f"[CatalogIndex] Circuit open for {domain}: crawl stopped at page {page}.")
+                complete = False
+                break
+            DomainRateLimiter.acquire(domain, settings.CATALOG_DOMAIN_INTERVAL)
+            try:
+                items = service.catalog_page(page)
+            except Exception as e:
+                logger.warning(f"[CatalogIndex] {source} listing page {page} failed: {e!r}")
+                complete = False
+                break
+            if items is None:
+                return None
+            before = len(collected)
+            for item in items:
+                if item.get("url") and item.get("title"):
+                    collected.setdefault(item["url"], {
+                        "title": item["title"],
+                        "url": item["url"],
+                        "cover": item.get("cover"),
+                        "chapters_count": item.get("chapters_count") or "N/A"
+                    })
+            # An empty page, or one repeating what we already have, is past the end of the listing
+            if len(collected) == before:
+                break
+
+        if not collected:
+            return 0
+        with cls._lock:
+            cls._ensure_loaded()
+            previous = cls._catalogs.get(source)
+            if complete or not previous:
+                cls._catalogs[source] = {"crawled_at": time.time(), "items": list(collected.values())}
+            else:
+                # Partial crawl: refresh what was read, keep the rest of the last full catalog
+                merged = {item["url"]: item for item in previous["items"]}
+                merged.update(collected)
+                cls._catalogs[source] = {"crawled_at": previous["crawled_at"], "items": list(merged.values())}
+            total = len(cls._catalogs[source]["items"])
+            cls._rebuild()
+            cls._save()
+        logger.info(f"[CatalogIndex] 📚 Indexed {total} titles from {source}{'' if complete else ' (partial crawl merged)'}.")
+        return total
+
+    @classmethod
+    def crawl_all(cls):
+        """Scheduled job: refreshes every source that has a crawlable listing."""
+        for source in SearchService.PROVIDERS:
+            try:
+                cls.crawl(source)
+            except Exception as e:
+                logger.error(f"[CatalogIndex] Crawl of {source} failed: {e}", exc_info=True)
+
+    @classmethod
+    def suggest(cls, query: str, source: Optional[str] = None, limit: int = 10) -> List[dict]:
+        """
+        Autocomplete over the indexed titles: whole-title prefix first, then word prefixes,
+        then trigram similarity (CATALOG_SUGGEST_MIN_SIMILARITY) for misspelled queries.
+        """
+        with cls._lock:
+            cls._ensure_loaded()
+        index = cls._index
+        normalized = SearchCache.normalize(query)
+        if not normalized or not index.items:
+            return []
+
+        scores: Dict[int, float] = {}
+
+        # Trigram similarity: share of the query's trigrams found in the title (long titles are not penalised)
+        query_grams = _trigrams(normalized)
+        shared = Counter(position for gram in query_grams for position in index.grams.get(gram, ()))
+        for position, count in shared.items():
+            scores[position] = count / len(query_grams)
+
+        # Titles with a word starting with the last (possibly unfinished) query word
+        last_word = normalized.split()[-1]
+        start = bisect.bisect_left(index.words, (last_word, -1))
+        prefixed = set()
+        while start < len(index.words) and index.words[start][0].startswith(last_word):
+            prefixed.add(index.words[start][1])
+            start += 1
+
+        min_similarity = get_settings().CATALOG_SUGGEST_MIN_SIMILARITY
+        ranked = []
+        for position in prefixed | set(scores):
+            if source and index.items[position]["source"] != source:
+                continue
+            score = scores.get(position, 0.0)
+            if index.titles[position].startswith(normalized):
+                score += 2.0
+            elif position in prefixed:
+                score += 1.0
+            elif score < min_similarity:
+                continue
+            ranked.append((-score, len(index.titles[position]), position))
+
+        ranked.sort()
+        return [dict(index.items[position]) for _, _, position in ranked[:limit]]
+
+    @classmethod
+    def stats(cls) -> dict:
+        with cls._lock:
+            cls._ensure_loaded()
+            return {
+                source: {"titles": len(catalog["items"]), "crawled_at": catalog["crawled_at"]}
+                for source, catalog in cls._catalogs.items()
+            }
+
+    @classmethod
+    def reset(cls):
+        """Forgets the in-memory index (the file is re-read on next access)."""
+        with cls._lock:
+            cls._catalogs = {}
+            cls._index = _TitleIndex([])
+            cls._loaded = False
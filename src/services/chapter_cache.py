@@ -0,0 +1,64 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from src.config import get_settings
+from src.schemas.novel_schema import ChapterContent
+from src.utils.logger import logger
+
+
+class ChapterCache:
+    """
+    Bounded LRU cache of parsed chapters, keyed by chapter URL.
+    Filled by the new-chapter watcher (prefetch), read by every job before downloading a chapter,
+    so an update requested after the watcher saw the new chapters is served locally.
+    """
+    # { url: (ChapterContent, expires_at) } in least-recently-used order
+    _entries: "OrderedDict[str, tuple]" = OrderedDict()
+    _hits = 0
+    _misses = 0
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, url: str) -> Optional[ChapterContent]:
+        with cls._lock:
+            entry = cls._entries.get(url)
+            if entry and entry[1] > time.time():
+                cls._entries.move_to_end(url)
+                cls._hits += 1
+                return entry[0]
+            if entry:
+                del cls._entries[url]
+            cls._misses += 1
+            return None
+
+    @classmethod
+    def contains(cls, url: str) -> bool:
+        with cls._lock:
+            entry = cls._entries.get(url)
+            return bool(entry and entry[1] > time.time())
+
+    @classmethod
+    def set(cls, url: str, chapter: ChapterContent):
+        settings = get_settings()
+        if settings.CHAPTER_CACHE_MAX_ENTRIES <= 0:
+            return
+        with cls._lock:
+            cls._entries[url] = (chapter, time.time() + settings.CHAPTER_CACHE_TTL)
+            cls._entries.move_to_end(url)
+            while len(cls._entries) > settings.CHAPTER_CACHE_MAX_ENTRIES:
+                cls._entries.popitem(last=False)
+        logger.debug(f"[ChapterCache] Cached chapter {url}")
+
+    @classmethod
+    def stats(cls) -> dict:
+        with cls._lock:
+            return {"entries": len(cls._entries), "hits": cls._hits, "misses": cls._misses}
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._entries.clear()
+            cls._hits = 0
+            cls._misses = 0
@@ -0,0 +1,148 @@
+import json
+import os
+import re
+import shutil
+import threading
+import time
+from typing import Dict, List, Optional, Set
+
+from src.config import get_settings
+from src.schemas.novel_schema import Chapter
+from src.utils.constants import EPUB_STRINGS
+from src.utils.logger import logger
+
+
+class CheckpointStore:
+    """
+    Durable record of the jobs in progress, so a crash or a redeploy does not lose them:
+    the job's parameters are written when it is accepted and every finished chapter is appended
+    as soon as it is downloaded. On startup the interrupted jobs are requeued under their task id
+    and their checkpointed chapters are reused instead of being downloaded again.
+
+    Layout: `<CHECKPOINT_DIR>/<task_id>/job.json` and `chapters.jsonl` (one chapter per line).
+    """
+    _ID_PATTERN = re.compile(r"^[0-9a-f-]{36}$")
+    # Chapter URLs already checkpointed per task (reused chapters are called back again)
+    _saved: Dict[str, Set[str]] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def _dir(cls) -> str:
+        return get_settings().CHECKPOINT_DIR
+
+    @classmethod
+    def _task_dir(cls, task_id: str) -> Optional[str]:
+        if not cls._ID_PATTERN.match(task_id or ""):
+            return None
+        return os.path.join(cls._dir(), task_id)
+
+    @classmethod
+    def _write_job(cls, job: dict):
+        task_dir = cls._task_dir(job["task_id"])
+        if not task_dir:
+            return
+        try:
+            os.makedirs(task_dir, exist_ok=True)
+            # Write-then-rename: a crash never leaves a truncated job file
+            tmp_path = os.path.join(task_dir, "job.json.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(job, f)
+            os.replace(tmp_path, os.path.join(task_dir, "job.json"))
+        except OSError as e:
+            logger.warning(f"[CheckpointStore] Could not record job {job['task_id']}: {e}")
+
+    @classmethod
+    def begin(cls, task_id: str, url: str, qty: int, start: int, artifact_id: Optional[str] = None):
+        """Records an accepted job (queued or running)."""
+        cls._write_job({
+            "task_id": task_id, "url": url, "qty": qty, "start": start, "artifact_id": artifact_id,
+            "created_at": time.time(), "resumes": 0
+        })
+
+    @classmethod
+    def mark_resumed(cls, job: dict):
+        cls._write_job({**job, "resumes": job.get("resumes", 0) + 1})
+
+    @classmethod
+    def add(cls, task_id: str, chapter: Chapter):
+        """Chapter callback of a running job. Placeholders and chapters taken from an artifact are skipped."""
+        if chapter.document is not None or chapter.content == EPUB_STRINGS["error_content"] or not chapter.url:
+            return
+        task_dir = cls._task_dir(task_id)
+        if not task_dir:
+            return
+        line = json.dumps({"url": chapter.url, "title": chapter.title, "content": chapter.content})
+        with cls._lock:
+            saved = cls._saved.setdefault(task_id, set())
+            if chapter.url in saved or not os.path.isdir(task_dir):
+                return
+            try:
+                with open(os.path.join(task_dir, "chapters.jsonl"), "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+                    # Flushed to the OS: survives the process being killed (OOM, redeploy)
+                    f.flush()
+            except OSError as e:
+                logger.warning(f"[CheckpointStore] Could not checkpoint a chapter of {task_id}: {e}")
+                return
+            saved.add(chapter.url)
+
+    @classmethod
+    def load_chapters(cls, task_id: str) -> Dict[str, Chapter]:
+        """Checkpointed chapters of a job keyed by URL (the `reuse` of BaseScraper.scrape_novel)."""
+        task_dir = cls._task_dir(task_id)
+        path = os.path.join(task_dir, "chapters.jsonl") if task_dir else None
+        if not path or not os.path.exists(path):
+            return {}
+        chapters = {}
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    data = json.loads(line)
+                except ValueError:
+                    # The last line of a job killed mid-write
+                    continue
+                chapters[data["url"]] = Chapter(index=0, title=data["title"], content=data["content"], url=data["url"])
+        with cls._lock:
+            cls._saved.setdefault(task_id, set()).update(chapters)
+        return chapters
+
+    @classmethod
+    def discard(cls, task_id: str):
+        """The job is over (completed or failed): its checkpoint is no longer needed."""
+        with cls._lock:
+            cls._saved.pop(task_id, None)
+        task_dir = cls._task_dir(task_id)
+        if task_dir:
+            shutil.rmtree(task_dir, ignore_errors=True)
+
+    @classmethod
+    def pending(cls) -> List[dict]:
+        """
+        Jobs interrupted by the last shutdown or crash, oldest first. Jobs older than CHECKPOINT_MAX_AGE_HOURS,
+        or already resumed CHECKPOINT_MAX_RESUMES times (e.g. a job that keeps running out of memory), are dropped.
+        """
+        settings = get_settings()
+        if not os.path.isdir(cls._dir()):
+            return []
+        cutoff = time.time() - settings.CHECKPOINT_MAX_AGE_HOURS * 3600
+        jobs = []
+        for task_id in os.listdir(cls._dir()):
+            task_dir = cls._task_dir(task_id)
+            if not task_dir:
+                continue
+            try:
+                with open(os.path.join(task_dir, "job.json"), "r", encoding="utf-8") as f:
+                    job = json.load(f)
+            except (OSError, ValueError):
+                job = None
+            if not job or job["created_at"] < cutoff or job.get("resumes", 0) >= settings.CHECKPOINT_MAX_RESUMES:
+                logger.warning(f"[CheckpointStore] Dropping interrupted job {task_id}.")
+                cls.discard(task_id)
+                continue
+            jobs.append(job)
+        return sorted(jobs, key=lambda job: job["created_at"])
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._saved.clear()
@@ -0,0 +1,169 @@
+import threading
+import time
+from typing import Dict, Optional
+
+from src.config import get_settings
+from src.services.registry import ScraperRegistry
+from src.utils.logger import logger
+
+
+class CircuitBreaker:
+    """
+    Tracks consecutive ban-like responses (HTTP 403/429) for one domain.
+
+    States:
+    - **closed**: requests flow normally.
+    - **open**: the domain is banning us; requests fail fast until `recovery_timeout` elapses.
+    - **half_open**: a single probe request is allowed (the others wait for its outcome, see
+      `wait_for_request`); success closes the circuit, failure re-opens it.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, domain: str, failure_threshold: int, recovery_timeout: float):
+        self.domain = domain
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_started_at: Optional[float] = None
+        self._lock = threading.Lock()
+        # Notified when a probe reports back (waiters of wait_for_request)
+        self._changed = threading.Condition(self._lock)
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._refresh_state()
+            return self._state
+
+    def _refresh_state(self):
+        # Caller must hold the lock
+        if self._state == self.OPEN and time.time() - self._opened_at >= self.recovery_timeout:
+            self._state = self.HALF_OPEN
+            self._probe_started_at = None
+            logger.info(f"[CircuitBreaker] {self.domain} is HALF-OPEN. Allowing a probe request.")
+
+    def _try_acquire(self) -> bool:
+        # Caller must hold the lock
+        self._refresh_state()
+        if self._state == self.CLOSED:
+            return True
+        # A probe that never reported back (e.g. parsing error) expires after recovery_timeout
+        probe_expired = self._probe_started_at is None or time.time() - self._probe_started_at >= self.recovery_timeout
+        if self._state == self.HALF_OPEN and probe_expired:
+            self._probe_started_at = time.time()
+            return True
+        return False
+
+    def allow_request(self) -> bool:
+        """Returns True if a request may be sent to the domain right now."""
+        with self._lock:
+            return self._try_acquire()
+
+    def wait_for_request(self, timeout: Optional[float] = None) -> bool:
+        """
+        Like allow_request, but while a half-open probe is in flight it waits for the probe's outcome
+        instead of refusing. Returns False only when the circuit is (or goes back to) OPEN, or when
+        nothing was decided within `timeout` (default: recovery_timeout, after which a probe expires).
+        """
+        deadline = time.time() + (self.recovery_timeout if timeout is None else timeout)
+        with self._changed:
+            while not self._try_acquire():
+                remaining = deadline - time.time()
+                if self._state == self.OPEN or remaining <= 0:
+                    return False
+                self._changed.wait(min(remaining, 1.0))
+            return True
+
+    def retry_after(self) -> float:
+        """Seconds until the circuit will allow a probe again (0 if not open)."""
+        with self._lock:
+            self._refresh_state()
+            if self._state != self.OPEN:
+                return 0.0
+            return max(0.0, self.recovery_timeout - (time.time() - self._opened_at))
+
+    def record_success(self):
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info(f"[CircuitBreaker] {self.domain} recovered. Circuit CLOSED.")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._opened_at = None
+            self._probe_started_at = None
+            self._changed.notify_all()
+
+    def record_failure(self):
+        with self._lock:
+            self._refresh_state()
+            self._failures += 1
+
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    logger.warning(
+                        f"[CircuitBreaker] 🚫 {self.domain} circuit OPEN after {self._failures} failures. "
+                        f"Pausing requests for {self.recovery_timeout:.0f}s."
+                    )
+                self._state = self.OPEN
+                self._opened_at = time.time()
+                self._probe_started_at = None
+            self._changed.notify_all()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            self._refresh_state()
+            retry_after = 0.0
+            if self._state == self.OPEN:
+                retry_after = max(0.0, self.recovery_timeout - (time.time() - self._opened_at))
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "retry_after_s": round(retry_after, 1)
+            }
+
+
+class CircuitBreakerRegistry:
+    """
+    Process-wide registry of circuit breakers, one per registered domain.
+    Shared by every job so a ban detected by one job protects the others.
+    """
+    _breakers: Dict[str, CircuitBreaker] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def domain_for(url: str) -> str:
+        """Maps a URL to its registered domain (falls back to the URL host)."""
+        return ScraperRegistry.domain_key(url)
+
+    @classmethod
+    def get(cls, url_or_domain: str) -> CircuitBreaker:
+        domain = cls.domain_for(url_or_domain) if "/" in url_or_domain else url_or_domain.lower()
+        with cls._lock:
+            breaker = cls._breakers.get(domain)
+            if breaker is None:
+                settings = get_settings()
+                breaker = CircuitBreaker(
+                    domain,
+                    failure_threshold=settings.CIRCUIT_FAILURE_THRESHOLD,
+                    recovery_timeout=settings.CIRCUIT_RECOVERY_TIMEOUT
+                )
+                cls._breakers[domain] = breaker
+            return breaker
+
+    @classmethod
+    def snapshot(cls) -> Dict[str, dict]:
+        """State of every known circuit, for the health endpoint."""
+        for domain in ScraperRegistry.get_registered_domains():
+            cls.get(domain)
+        with cls._lock:
+            breakers = list(cls._breakers.values())
+        return {b.domain: b.snapshot() for b in breakers}
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._breakers.clear()
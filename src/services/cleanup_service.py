@@ -25,7 +25,9 @@ def cleanup_stale_files(max_age_seconds: int = 3600):
         # Since tempfile.NamedTemporaryFile creates random names, we just look for .epub suffix if we set it.
         # In book_routes we used suffix=".epub".
         
-        for p in Path(tmp_dir).glob("*.epub"):
+        # Volume bundles of sharded jobs (see VolumeService.BUNDLE_PREFIX)
+        stale_candidates = list(Path(tmp_dir).glob("*.epub")) + list(Path(tmp_dir).glob("novel_volumes_*.zip"))
+        for p in stale_candidates:
             try:
                 # Check modification time
                 mtime = p.stat().st_mtime
@@ -39,7 +41,7 @@ def cleanup_stale_files(max_age_seconds: int = 3600):
                 pass
                 
         if count > 0:
-            logger.info(f"[Cleanup] Removed {count} stale EPUB files. Errors: {errors}")
+            logger.info(f"[Cleanup] Removed {count} stale EPUB/bundle files. Errors: {errors}")
         else:
             logger.info("[Cleanup] No stale files found.")
             
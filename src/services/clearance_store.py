@@ -0,0 +1,192 @@
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+from src.config import get_settings
+from src.utils.logger import logger
+
+
+class ClearanceStore:
+    """
+    Persistent store of anti-bot clearance per (domain, proxy).
+
+    Keeps the cookie jar of sessions that solved a challenge (e.g. `cf_clearance`) together with the
+    User-Agent the clearance is bound to, so new sessions, jobs and restarts reuse it instead of
+    solving the challenge (or warming up) again.
+    """
+    CLEARANCE_COOKIES = ("cf_clearance", "__cf_bm", "wordfence_verifiedHuman")
+
+    # { "domain|proxy": { "user_agent": str, "cookies": [ {...} ], "expires_at": float, "version": int } }
+    _entries: Dict[str, dict] = {}
+    _loaded = False
+    _lock = threading.RLock()
+
+    @staticmethod
+    def _key(domain: str, proxy_url: Optional[str]) -> str:
+        return f"{domain}|{proxy_url or 'direct'}"
+
+    @classmethod
+    def _path(cls) -> str:
+        return get_settings().CLEARANCE_STORE_PATH
+
+    @classmethod
+    def _ensure_loaded(cls):
+        # Caller must hold the lock
+        if cls._loaded:
+            return
+        cls._loaded = True
+        path = cls._path()
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                cls._entries = json.load(f)
+            logger.info(f"[ClearanceStore] Loaded clearance for {len(cls._entries)} domain/proxy pairs.")
+        except Exception as e:
+            logger.warning(f"[ClearanceStore] Could not load {path}: {e}")
+            cls._entries = {}
+
+    @classmethod
+    def _save(cls):
+        # Caller must hold the lock. Write-then-rename so a crash never leaves a truncated file.
+        path = cls._path()
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(cls._entries, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"[ClearanceStore] Failed to persist clearance: {e}")
+
+    @classmethod
+    def get(cls, domain: str, proxy_url: Optional[str] = None) -> Optional[dict]:
+        """Returns the stored entry with expired cookies dropped (None if it has expired)."""
+        now = time.time()
+        with cls._lock:
+            cls._ensure_loaded()
+            entry = cls._entries.get(cls._key(domain, proxy_url))
+            if not entry or entry["expires_at"] <= now:
+                return None
+            cookies = [c for c in entry["cookies"] if not c.get("expires") or c["expires"] > now]
+            return {**entry, "cookies": cookies}
+
+    @classmethod
+    def has_clearance(cls, domain: str, proxy_url: Optional[str] = None) -> bool:
+        """True while a stored clearance (solved challenge or successful warm-up) is still valid."""
+        return cls.get(domain, proxy_url) is not None
+
+    @classmethod
+    def get_user_agent(cls, domain: str, proxy_url: Optional[str] = None) -> Optional[str]:
+        entry = cls.get(domain, proxy_url)
+        return entry["user_agent"] if entry else None
+
+    @classmethod
+    def sync(cls, session, domain: str, proxy_url: Optional[str] = None) -> bool:
+        """
+        Loads the stored cookies and User-Agent into `session` if they are newer than what it has.
+        Returns True if anything was applied.
+        """
+        entry = cls.get(domain, proxy_url)
+        if not entry or vars(session).get("_clearance_version", 0) >= entry["version"]:
+            return False
+
+        for cookie in entry["cookies"]:
+            session.cookies.set(
+                cookie["name"], cookie["value"],
+                domain=cookie.get("domain") or "", path=cookie.get("path") or "/",
+                expires=cookie.get("expires"), secure=cookie.get("secure", False)
+            )
+        if entry.get("user_agent"):
+            session.headers["User-Agent"] = entry["user_agent"]
+
+        session._clearance_version = entry["version"]
+        logger.debug(f"[ClearanceStore] Applied stored clearance (v{entry['version']}) for {domain}.")
+        return True
+
+    @classmethod
+    def capture(cls, session, response, domain: str, proxy_url: Optional[str] = None):
+        """
+        Stores the session's cookie jar if it now holds a (new) clearance cookie.
+        Called after every pooled request; cheap when nothing changed.
+        """
+        user_agent = response.request.headers.get("User-Agent") if getattr(response, "request", None) else None
+        if not isinstance(user_agent, str):
+            return
+
+        cookies = [
+            {
+                "name": c.name, "value": c.value, "domain": c.domain, "path": c.path,
+                "expires": c.expires, "secure": c.secure
+            }
+            for c in session.cookies
+        ]
+        clearance = {c["name"]: c["value"] for c in cookies if c["name"] in cls.CLEARANCE_COOKIES}
+        if not clearance:
+            return
+
+        # Session cookies carry no expiry: keep them for a bounded time only
+        default_expiry = time.time() + get_settings().CLEARANCE_DEFAULT_TTL
+        for c in cookies:
+            c["expires"] = c["expires"] or default_expiry
+        expires_at = min(c["expires"] for c in cookies if c["name"] in cls.CLEARANCE_COOKIES)
+
+        key = cls._key(domain, proxy_url)
+        with cls._lock:
+            cls._ensure_loaded()
+            current = cls._entries.get(key)
+            if current and current["user_agent"] == user_agent:
+                stored = {c["name"]: c["value"] for c in current["cookies"] if c["name"] in cls.CLEARANCE_COOKIES}
+                if stored == clearance:
+                    return
+
+            version = cls._store(key, user_agent, cookies, expires_at)
+
+        session._clearance_version = version
+        logger.info(f"[ClearanceStore] 🍪 Stored new clearance for {domain} ({'proxy' if proxy_url else 'direct'}).")
+
+    @classmethod
+    def mark_warm(cls, domain: str, user_agent: str, proxy_url: Optional[str] = None):
+        """
+        Records a successful warm-up for sites that do not issue clearance cookies.
+        The warm-up is then skipped until CLEARANCE_DEFAULT_TTL elapses or the site rejects us.
+        """
+        key = cls._key(domain, proxy_url)
+        with cls._lock:
+            cls._ensure_loaded()
+            current = cls._entries.get(key)
+            cookies = current["cookies"] if current and current["user_agent"] == user_agent else []
+            cls._store(key, user_agent, cookies, time.time() + get_settings().CLEARANCE_DEFAULT_TTL)
+
+    @classmethod
+    def _store(cls, key: str, user_agent: str, cookies: list, expires_at: float) -> int:
+        # Caller must hold the lock
+        current = cls._entries.get(key)
+        version = (current["version"] + 1) if current else 1
+        cls._entries[key] = {
+            "user_agent": user_agent,
+            "cookies": cookies,
+            "expires_at": expires_at,
+            "updated_at": time.time(),
+            "version": version
+        }
+        cls._save()
+        return version
+
+    @classmethod
+    def invalidate(cls, domain: str, proxy_url: Optional[str] = None):
+        """Drops a clearance the site rejected, so the next request triggers a fresh warm-up."""
+        with cls._lock:
+            cls._ensure_loaded()
+            if cls._entries.pop(cls._key(domain, proxy_url), None):
+                cls._save()
+                logger.warning(f"[ClearanceStore] Clearance for {domain} was rejected and has been discarded.")
+
+    @classmethod
+    def reset(cls):
+        """Forgets the in-memory state (the file is re-read on next access)."""
+        with cls._lock:
+            cls._entries = {}
+            cls._loaded = False
@@ -0,0 +1,125 @@
+import asyncio
+import threading
+import time
+from typing import Dict, List, Optional
+
+import requests
+
+from src.config import get_settings
+from src.services.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from src.services.registry import ScraperRegistry
+from src.services.toc_cache import TocCache
+from src.utils.exceptions import CircuitOpenException, NovelNotFoundException
+from src.utils.logger import logger
+
+
+class NovelDetailsService:
+    """
+    Cheap novel card: metadata and real chapter count, without starting a generation task.
+    Metadata is cached per book (DETAILS_CACHE_TTL); the chapter count comes from the TocCache
+    (shared with /generate and the jobs), and both are read from the same book page.
+    """
+    # { "host/path": (details, expires_at) }
+    _entries: Dict[str, tuple] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return TocCache._key(url)
+
+    @classmethod
+    def get_cached(cls, url: str) -> Optional[dict]:
+        with cls._lock:
+            entry = cls._entries.get(cls._key(url))
+            if entry and entry[1] > time.time():
+                return dict(entry[0])
+            if entry:
+                del cls._entries[cls._key(url)]
+            return None
+
+    @classmethod
+    def get_details(cls, url: str) -> dict:
+        """
+        Blocking lookup (call from a worker thread). Raises ValueError for unsupported domains,
+        CircuitOpenException while the source blocks us and NovelNotFoundException on 404.
+        """
+        cached = cls.get_cached(url)
+        if cached is not None:
+            return {**cached, "cached": True}
+
+        service_class = ScraperRegistry.get_service(url)
+        if not service_class:
+            raise ValueError("Unsupported domain.")
+        breaker = CircuitBreakerRegistry.get(url)
+        if breaker.state == CircuitBreaker.OPEN:
+            raise CircuitOpenException(breaker.domain, breaker.retry_after())
+
+        scraper = service_class().get_book_instance(url, 1, 1)
+        try:
+            metadata = scraper.get_book_metadata()
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                raise NovelNotFoundException(f"Novel not found at {url}")
+            if e.response is not None and e.response.status_code in (403, 429):
+                breaker.record_failure()
+            raise
+
+        try:
+            total = scraper.get_total_chapters()
+        except Exception as e:
+            # The card is still useful without the count
+            logger.warning(f"[NovelDetails] Chapter count unavailable for {url}: {e!r}")
+            total = None
+
+        details = {"url": url, **metadata.model_dump(), "total_chapters": total}
+        ttl = get_settings().DETAILS_CACHE_TTL
+        if ttl > 0:
+            with cls._lock:
+                cls._entries[cls._key(url)] = (details, time.time() + ttl)
+        return {**details, "cached": False}
+
+    @classmethod
+    async def fetch(cls, url: str) -> dict:
+        """Async lookup: cache hits are answered inline, misses run in a worker thread."""
+        cached = cls.get_cached(url)
+        if cached is not None:
+            return {**cached, "cached": True}
+        loop = asyncio.get_running_loop()
+        return await asyncio.wait_for(
+            loop.run_in_executor(None, cls.get_details, url), timeout=get_settings().DETAILS_TIMEOUT
+        )
+
+    @classmethod
+    async def fetch_many(cls, urls: List[str]) -> List[dict]:
+        """
+        Concurrent lookups (at most DETAILS_CONCURRENCY at a time), in request order.
+        Never raises: each item has a `status` (ok, not_found, unsupported, blocked, timeout, error).
+        """
+        slots = asyncio.Semaphore(max(1, get_settings().DETAILS_CONCURRENCY))
+
+        async def lookup(url: str) -> dict:
+            if not ScraperRegistry.get_service(url):
+                return {"url": url, "status": "unsupported", "details": None, "error": "Unsupported domain."}
+            async with slots:
+                try:
+                    return {"url": url, "status": "ok", "details": await cls.fetch(url), "error": None}
+                except asyncio.TimeoutError:
+                    status, error = "timeout", "The source did not answer in time."
+                except NovelNotFoundException as e:
+                    status, error = "not_found", str(e)
+                except CircuitOpenException as e:
+                    status, error = "blocked", str(e)
+                except Exception as e:
+                    logger.warning(f"[NovelDetails] Lookup failed for {url}: {e!r}")
+                    status, error = "error", str(e)
+                return {"url": url, "status": status, "details": None, "error": error}
+
+        # The same novel asked twice is looked up once
+        unique = list(dict.fromkeys(urls))
+        outcomes = dict(zip(unique, await asyncio.gather(*(lookup(url) for url in unique))))
+        return [outcomes[url] for url in urls]
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._entries.clear()
@@ -1,7 +1,7 @@
 import io
 import time
 from ebooklib import epub
-from src.schemas.novel_schema import Novel
+from src.schemas.novel_schema import Chapter, Novel
 from src.utils.constants import EPUB_HTML_TEMPLATE, EPUB_STRINGS
 from src.utils.logger import logger
 
@@ -11,6 +11,11 @@ class EpubBuilder:
     Follows Single Responsibility Principle (SRP).
     """
 
+    @staticmethod
+    def render_chapter(chapter: Chapter) -> bytes:
+        """XHTML page of one chapter."""
+        return EPUB_HTML_TEMPLATE.format(title=chapter.title, content=chapter.content).encode('utf-8')
+
     @staticmethod
     def create_epub(novel: Novel) -> io.BytesIO:
         """
@@ -55,13 +60,8 @@ class EpubBuilder:
             file_name = f'chap_{chapter_data.index}.xhtml'
             chapter = epub.EpubHtml(title=chapter_data.title, file_name=file_name, lang='en')
             
-            # Ensure content is string
-            content_str = chapter_data.content
-            
-            chapter.set_content(EPUB_HTML_TEMPLATE.format(
-                title=chapter_data.title,
-                content=content_str
-            ).encode('utf-8'))
+            # Chapters of an updated artifact (or of a partial build) keep their previously rendered page
+            chapter.set_content(chapter_data.document or EpubBuilder.render_chapter(chapter_data))
             
             book.add_item(chapter)
             epub_chapters.append(chapter)
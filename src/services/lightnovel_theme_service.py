@@ -0,0 +1,199 @@
+import asyncio
+import random
+import time
+from typing import Optional, Type
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup
+from src.services.base_service import BaseService
+from src.classes.lightnovel_theme_book import LightNovelThemeBook
+from src.utils.logger import logger
+from src.services.clearance_store import ClearanceStore
+
+
+class LightNovelThemeService(BaseService):
+    """
+    Service for WordPress sites built on the LightNovel/Madara themes (Central Novel and many others).
+    Handles the theme's search page behind Cloudflare/Wordfence and hands out theme scrapers.
+
+    A new site using the theme is registered in one line:
+        ScraperRegistry.register("example-novels.com")(LightNovelThemeService.for_site("https://example-novels.com"))
+    """
+    BASE_URL: Optional[str] = None
+    DOMAIN: Optional[str] = None
+    BOOK_CLASS: Type[LightNovelThemeBook] = LightNovelThemeBook
+
+    # Professional Real Browser User-Agents (Chrome 120+)
+    REAL_USER_AGENTS = [
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0"
+    ]
+
+    def __init__(self):
+        super().__init__()
+
+    @classmethod
+    def for_site(cls, base_url: str) -> Type["LightNovelThemeService"]:
+        """Builds the service class of one theme site (to be passed to ScraperRegistry.register)."""
+        base_url = base_url.rstrip('/')
+        domain = urlparse(base_url).hostname.removeprefix("www.")
+        class_name = "".join(part.capitalize() for part in domain.replace("-", ".").split(".")) + "Service"
+        return type(class_name, (cls,), {"BASE_URL": base_url, "DOMAIN": domain})
+
+    def search(self, query: str) -> list:
+        """
+        Performs a novel search using session warm-up, randomized UAs, 
+        and header sanitization to bypass cloudflare blocks on hosted environments.
+        The warm-up is skipped while a stored clearance (see ClearanceStore) is valid.
+        """
+        search_url = f"{self.BASE_URL}/"
+        params = {'s': query.strip()}
+        proxy_url = self._session.proxies.get("https")
+
+        # Reuse the User-Agent a stored clearance is bound to (a different UA invalidates it)
+        current_ua = ClearanceStore.get_user_agent(self.DOMAIN, proxy_url) or random.choice(self.REAL_USER_AGENTS)
+        
+        headers = self._search_headers(current_ua)
+
+        # SANITIZATION: Remove any headers that identify the Render/AWS infrastructure
+        # This is crucial for avoiding 403 blocks on PaaS.
+        for header in ['X-Amzn-Trace-Id', 'Via', 'X-Forwarded-For', 'X-Real-Ip']:
+            self._session.headers.pop(header, None)
+        
+        try:
+            # 1. SESSION WARM-UP (only when no stored clearance is available)
+            warmed_up = not ClearanceStore.has_clearance(self.DOMAIN, proxy_url)
+            if warmed_up:
+                self._warm_up(current_ua)
+
+            logger.info(f"[{self.service_name}] Executing search for: '{query}'")
+
+            # 2. SEARCH REQUEST
+            response = self._session.get(
+                search_url, 
+                params=params, 
+                headers=headers, 
+                timeout=20
+            )
+
+            if response.status_code == 403:
+                # The stored clearance was rejected: drop it, warm up again and retry once
+                logger.warning(f"[{self.service_name}] 403 Forbidden with stored clearance. Warming up again...")
+                ClearanceStore.invalidate(self.DOMAIN, proxy_url)
+                current_ua = random.choice(self.REAL_USER_AGENTS)
+                headers["User-Agent"] = current_ua
+                self._warm_up(current_ua)
+                warmed_up = True
+                response = self._session.get(search_url, params=params, headers=headers, timeout=20)
+
+            if response.status_code == 403:
+                logger.error(f"[{self.service_name}] 403 Forbidden - Fingerprint rejected by {self.DOMAIN}.")
+                self.last_search_error = RuntimeError(f"403 Forbidden by {self.DOMAIN}")
+                return []
+
+            response.raise_for_status()
+            if warmed_up:
+                ClearanceStore.mark_warm(self.DOMAIN, current_ua, proxy_url)
+            
+            results = self._parse_articles(response.text)
+            if not results:
+                logger.warning(f"[{self.service_name}] No results found for '{query}'.")
+                return []
+
+            logger.info(f"[{self.service_name}] Found {len(results)} results.")
+            return results
+            
+        except Exception as e:
+            logger.error(f"[{self.service_name}] Search failed: {str(e)}", exc_info=True)
+            self.last_search_error = e
+            return []
+
+    async def asearch(self, query: str) -> list:
+        """
+        Non-blocking search (see BaseService.asearch): same warm-up and headers as `search`, but the
+        "human" pause is an asyncio.sleep instead of a blocked thread. A 403/503 goes to the blocking
+        search, which re-solves the challenge with cloudscraper.
+        """
+        proxy_url = self._session.proxies.get("https")
+        current_ua = ClearanceStore.get_user_agent(self.DOMAIN, proxy_url) or random.choice(self.REAL_USER_AGENTS)
+
+        warmed_up = not ClearanceStore.has_clearance(self.DOMAIN, proxy_url)
+        if warmed_up:
+            logger.info(f"[{self.service_name}] Warming up async client for: {current_ua[:30]}...")
+            await self._session.aget(self.BASE_URL, headers={"User-Agent": current_ua}, timeout=15)
+            await asyncio.sleep(random.uniform(2.5, 5.0))
+
+        response = await self._session.aget(
+            f"{self.BASE_URL}/", params={'s': query.strip()}, headers=self._search_headers(current_ua), timeout=20
+        )
+        if response.status_code in (403, 503):
+            return await self._blocking_search(query, f"HTTP {response.status_code}")
+        response.raise_for_status()
+        if warmed_up:
+            ClearanceStore.mark_warm(self.DOMAIN, current_ua, proxy_url)
+
+        results = self._parse_articles(response.text)
+        logger.info(f"[{self.service_name}] Found {len(results)} results.")
+        return results
+
+    def _search_headers(self, user_agent: str) -> dict:
+        # Comprehensive headers mimicking a modern browser
+        return {
+            "User-Agent": user_agent,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9,pt-BR;q=0.8,pt;q=0.7",
+            "Accept-Encoding": "gzip, deflate, br",
+            "Referer": f"{self.BASE_URL}/",
+            "Connection": "keep-alive",
+            "Upgrade-Insecure-Requests": "1",
+            "Sec-Ch-Ua": '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
+            "Sec-Ch-Ua-Mobile": "?0",
+            "Sec-Ch-Ua-Platform": '"Windows"',
+            "Sec-Fetch-Dest": "document",
+            "Sec-Fetch-Mode": "navigate",
+            "Sec-Fetch-Site": "same-origin",
+            "Sec-Fetch-User": "?1",
+        }
+
+    def _parse_articles(self, html: str) -> list:
+        """Search result page -> result dicts."""
+        soup = BeautifulSoup(html, 'html.parser')
+        results = []
+
+        # Search results: LightNovel theme articles, Madara result rows as fallback
+        articles = soup.select('article.maindet') or soup.select('div.c-tabs-item__content')
+        
+        for article in articles:
+            title_tag = article.find(['h2', 'h3'])
+            link_tag = title_tag.find('a') if title_tag else None
+            img_tag = article.find('img')
+            chapter_span = article.select_one('span.nchapter, span.chapter')
+
+            if title_tag and link_tag:
+                # Handle lazy-loaded images (common in WordPress)
+                cover_url = img_tag.get('data-src') or img_tag.get('src') if img_tag else None
+                
+                results.append({
+                    "title": title_tag.get_text(strip=True),
+                    "url": link_tag.get('href'),
+                    "cover": cover_url,
+                    "chapters_count": chapter_span.get_text(strip=True) if chapter_span else "N/A"
+                })
+        return results
+
+    def _warm_up(self, user_agent: str):
+        """Hits the homepage with the given UA to establish cookies, then waits like a human reader."""
+        logger.info(f"[{self.service_name}] Warming up session for: {user_agent[:30]}...")
+        self._session.get(self.BASE_URL, headers={"User-Agent": user_agent}, timeout=15)
+
+        # Random wait to simulate human reading time
+        time.sleep(random.uniform(2.5, 5.0))
+
+    def get_book_instance(self, url: str, qty: int, start: int) -> LightNovelThemeBook:
+        """
+        Returns the theme scraper for the book.
+        """
+        logger.info(f"[{self.service_name}] Instantiating {self.BOOK_CLASS.__name__} for URL: {url}")
+        return self.BOOK_CLASS(url, qty, start)
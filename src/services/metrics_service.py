@@ -2,11 +2,22 @@ import json
 import os
 import time
 import functools
+import threading
 from datetime import datetime
+from typing import Dict, Optional
 from src.config import get_settings
+from src.utils.exceptions import JobInterruptedException
 
 class MetricsService:
     FILE_PATH = "benchmarks.jsonl"
+    TOC_FILE_PATH = "toc_metrics.jsonl"
+
+    # Per-domain TOC totals since startup (see record_toc_metric)
+    _toc_stats: Dict[str, dict] = {}
+    # Last observed size and load time of the full TOC page per domain (baselines for what fast endpoints save)
+    _toc_page_bytes: Dict[str, int] = {}
+    _toc_page_duration: Dict[str, float] = {}
+    _toc_lock = threading.Lock()
 
     @classmethod
     def record_scrape_metric(cls, 
@@ -47,6 +58,70 @@ class MetricsService:
         except Exception as e:
             print(f"[MetricsService] Failed to record metric: {e}")
 
+    @classmethod
+    def record_toc_metric(cls,
+                          domain: str,
+                          source: str,
+                          bytes_downloaded: int,
+                          duration_seconds: float,
+                          chapters_count: int):
+        """
+        Records how a chapter list was obtained: `source` is "endpoint" (fast JSON/AJAX request),
+        "embedded" (JSON embedded in the book page, which is downloaded anyway), "pages" (paginated
+        chapter index) or "html" (full book page). Endpoint records include the bytes and time saved
+        against the last observed HTML page of the same domain; embedded data saves parsing only.
+        """
+        with cls._toc_lock:
+            if source == "html":
+                cls._toc_page_bytes[domain] = bytes_downloaded
+                cls._toc_page_duration[domain] = duration_seconds
+            bytes_saved, time_saved = 0, 0.0
+            if source == "endpoint":
+                baseline_bytes = cls._toc_page_bytes.get(domain)
+                baseline_duration = cls._toc_page_duration.get(domain)
+                bytes_saved = max(0, baseline_bytes - bytes_downloaded) if baseline_bytes else 0
+                time_saved = max(0.0, baseline_duration - duration_seconds) if baseline_duration else 0.0
+
+            stats = cls._toc_stats.setdefault(domain, {
+                "endpoint_hits": 0, "embedded_hits": 0, "pages_hits": 0, "html_hits": 0,
+                "bytes_downloaded": 0, "bytes_saved": 0, "duration_s": 0.0, "time_saved_s": 0.0
+            })
+            stats[f"{source}_hits"] += 1
+            stats["bytes_downloaded"] += bytes_downloaded
+            stats["bytes_saved"] += bytes_saved
+            stats["duration_s"] = round(stats["duration_s"] + duration_seconds, 3)
+            stats["time_saved_s"] = round(stats["time_saved_s"] + time_saved, 3)
+
+        record = {
+            "timestamp": time.time(),
+            "domain": domain,
+            "source": source,
+            "chapters_count": chapters_count,
+            "bytes": bytes_downloaded,
+            "bytes_saved": bytes_saved,
+            "duration_s": round(duration_seconds, 3),
+            "time_saved_s": round(time_saved, 3)
+        }
+        try:
+            with open(cls.TOC_FILE_PATH, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+        except Exception as e:
+            print(f"[MetricsService] Failed to record TOC metric: {e}")
+
+    @classmethod
+    def get_toc_summary(cls, domain: Optional[str] = None) -> Dict[str, dict]:
+        with cls._toc_lock:
+            if domain:
+                return dict(cls._toc_stats.get(domain, {}))
+            return {d: dict(s) for d, s in cls._toc_stats.items()}
+
+    @classmethod
+    def reset_toc_stats(cls):
+        with cls._toc_lock:
+            cls._toc_stats.clear()
+            cls._toc_page_bytes.clear()
+            cls._toc_page_duration.clear()
+
     @classmethod
     def get_recent_benchmarks(cls, limit: int = 10):
         if not os.path.exists(cls.FILE_PATH):
@@ -88,6 +163,17 @@ def benchmark_scraper(func):
                 status="success"
             )
             return result_novel
+
+        except JobInterruptedException as e:
+            # Not a failure: the job resumes from its checkpoint after the restart
+            MetricsService.record_scrape_metric(
+                url=url,
+                chapters_count=0,
+                duration_seconds=time.time() - start_time,
+                status="interrupted",
+                error=str(e)
+            )
+            raise e
             
         except Exception as e:
             # Failure
@@ -0,0 +1,153 @@
+import random
+import threading
+import time
+from typing import Dict, Optional, Sequence
+from urllib.parse import urlparse
+
+from src.config import get_settings
+from src.services.registry import ScraperRegistry
+from src.services.session_manager import SessionManager
+from src.utils.logger import logger
+
+
+class MirrorState:
+    """Health and latency of one mirror host."""
+
+    # Weight of the latest sample in the latency moving average
+    LATENCY_ALPHA = 0.3
+
+    def __init__(self, host: str):
+        self.host = host
+        self.latency: Optional[float] = None
+        self.failures = 0
+        self.down_until = 0.0
+        self.requests = 0
+
+    def available(self, now: float) -> bool:
+        # A mirror out of rotation comes back (for a probe) once its recovery time has passed
+        return self.down_until <= now
+
+    def record_success(self, latency: float):
+        self.requests += 1
+        self.failures = 0
+        self.down_until = 0.0
+        self.latency = latency if self.latency is None else (
+            self.LATENCY_ALPHA * latency + (1 - self.LATENCY_ALPHA) * self.latency
+        )
+
+    def record_failure(self, threshold: int, recovery_seconds: float) -> bool:
+        """Returns True if the mirror has just been taken out of rotation."""
+        self.requests += 1
+        self.failures += 1
+        if self.failures >= threshold:
+            was_up = self.down_until <= time.time()
+            self.down_until = time.time() + recovery_seconds
+            return was_up
+        return False
+
+    def snapshot(self, now: float) -> dict:
+        return {
+            "healthy": self.available(now),
+            "latency_ms": round(self.latency * 1000, 1) if self.latency is not None else None,
+            "consecutive_failures": self.failures,
+            "requests": self.requests
+        }
+
+
+class MirrorRouter:
+    """
+    Spreads fetches over the equivalent hosts registered with `ScraperRegistry.register(mirrors=...)`.
+
+    Healthy mirrors are picked at random, weighted by the inverse of their measured latency
+    (faster mirrors get more traffic, slower ones still get probed). Mirrors failing repeatedly
+    are taken out of rotation for MIRROR_RECOVERY_SECONDS, so retries fail over to the others.
+    """
+    _states: Dict[str, MirrorState] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def _state(cls, host: str) -> MirrorState:
+        # Caller must hold the lock
+        state = cls._states.get(host)
+        if state is None:
+            state = cls._states[host] = MirrorState(host)
+        return state
+
+    @classmethod
+    def pick(cls, hosts: Sequence[str]) -> str:
+        now = time.time()
+        with cls._lock:
+            states = [cls._state(host) for host in hosts]
+            healthy = [s for s in states if s.available(now)]
+            if not healthy:
+                # Everything is down: use the mirror that comes back first
+                return min(states, key=lambda s: s.down_until).host
+
+            known = [s.latency for s in healthy if s.latency is not None]
+            # Unmeasured mirrors get the average latency, so they are tried early
+            default_latency = sum(known) / len(known) if known else 1.0
+            weights = [1.0 / max(s.latency if s.latency is not None else default_latency, 0.01) for s in healthy]
+        return random.choices([s.host for s in healthy], weights=weights)[0]
+
+    @classmethod
+    def route(cls, url: str) -> str:
+        """Rewrites `url` to the mirror that should serve it (unchanged for hosts without mirrors)."""
+        parsed = urlparse(url)
+        group = ScraperRegistry.get_mirrors(parsed.hostname)
+        if len(group) < 2:
+            return url
+        host = cls.pick(group)
+        return url if host == parsed.hostname else parsed._replace(netloc=host).geturl()
+
+    @classmethod
+    def is_mirrored(cls, url: str) -> bool:
+        return len(ScraperRegistry.get_mirrors(urlparse(url).hostname)) > 1
+
+    @classmethod
+    def record_success(cls, url: str, latency: float):
+        host = urlparse(url).hostname
+        with cls._lock:
+            cls._state(host).record_success(latency)
+
+    @classmethod
+    def record_failure(cls, url: str):
+        settings = get_settings()
+        host = urlparse(url).hostname
+        with cls._lock:
+            went_down = cls._state(host).record_failure(
+                settings.MIRROR_FAILURE_THRESHOLD, settings.MIRROR_RECOVERY_SECONDS
+            )
+        if went_down:
+            logger.warning(
+                f"[MirrorRouter] 🔀 {host} taken out of rotation for {settings.MIRROR_RECOVERY_SECONDS}s. "
+                f"Failing over to its mirrors."
+            )
+
+    @classmethod
+    def check_all(cls):
+        """Health check of every registered mirror (blocking: run it in a thread)."""
+        settings = get_settings()
+        session = SessionManager.get_session("MirrorRouter", settings.PROXY_URL)
+        for group in ScraperRegistry.get_mirror_groups():
+            for host in group:
+                url = f"https://{host}/"
+                start = time.perf_counter()
+                try:
+                    response = session.head(url, timeout=settings.DEFAULT_TIMEOUT, allow_redirects=True)
+                    if response.status_code >= 500:
+                        raise RuntimeError(f"HTTP {response.status_code}")
+                    cls.record_success(url, time.perf_counter() - start)
+                except Exception as e:
+                    logger.warning(f"[MirrorRouter] Health check failed for {host}: {e}")
+                    cls.record_failure(url)
+
+    @classmethod
+    def snapshot(cls) -> Dict[str, dict]:
+        now = time.time()
+        with cls._lock:
+            return {host: state.snapshot(now) for host, state in cls._states.items()}
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._states.clear()
@@ -37,7 +37,6 @@ class NovelsBrService(BaseService):
             response.encoding = 'utf-8'
 
             soup = BeautifulSoup(response.text, 'html.parser')
-            results = []
 
             # Targeting the novel cards based on your HTML structure:
             # section#content -> .content-novel -> .container -> .row -> .col-sm-12
@@ -47,42 +46,69 @@ class NovelsBrService(BaseService):
                 logger.warning(f"[{self.service_name}] No results found for '{query}'. The site structure might have changed.")
                 return []
 
-            for item in items:
-                # 1. Extract Title (h2.card-title)
-                title_tag = item.select_one('h2.card-title')
-                if not title_tag:
-                    continue
-                
-                title = title_tag.get_text(strip=True)
-
-                # 2. Extract Link (a.custom-link containing the "Ler Novel" button)
-                link_tag = item.select_one('a.custom-link')
-                path = link_tag.get("href", "") if link_tag else ""
-                full_url = f"{self.BASE_URL}{path}" if path.startswith('/') else path
-
-                # 3. Extract Cover Image (img.custom-card-img)
-                img_tag = item.select_one('img.custom-card-img')
-                cover_url = img_tag.get("src", "") if img_tag else None
-
-                # 4. Extract Author (h3.card-text small)
-                author_tag = item.select_one('h3.card-text small')
-                author = author_tag.get_text(strip=True) if author_tag else "Unknown"
-
-                results.append({
-                    "title": title,
-                    "url": full_url,
-                    "cover": cover_url,
-                    "author": author,
-                    "chapters_count": "N/A" # Search page usually doesn't show the count
-                })
-            
+            results = self._parse_cards(items)
             logger.info(f"[{self.service_name}] Search successful. Found {len(results)} items.")
             return results
 
         except Exception as e:
             logger.error(f"[{self.service_name}] Error during search for '{query}': {str(e)}", exc_info=True)
+            self.last_search_error = e
             return []
 
+    async def asearch(self, query: str) -> list:
+        """Non-blocking search over the pooled async client (see BaseService.asearch)."""
+        response = await self._session.aget(self.SEARCH_URL, params={"simplifiedField": query.strip()}, timeout=10)
+        if response.status_code in (403, 503):
+            return await self._blocking_search(query, f"HTTP {response.status_code}")
+        response.raise_for_status()
+        response.encoding = 'utf-8'
+
+        soup = BeautifulSoup(response.text, 'html.parser')
+        results = self._parse_cards(soup.select('div.content-novel div.row.g-4 div.col-sm-12'))
+        logger.info(f"[{self.service_name}] Search successful. Found {len(results)} items.")
+        return results
+
+    def catalog_page(self, page: int) -> list:
+        """Listing page of the catalog crawler (the novel list without a search term)."""
+        response = self._session.get(self.SEARCH_URL, params={"page": page}, timeout=10)
+        response.raise_for_status()
+        response.encoding = 'utf-8'
+        soup = BeautifulSoup(response.text, 'html.parser')
+        return self._parse_cards(soup.select('div.content-novel div.row.g-4 div.col-sm-12'))
+
+    def _parse_cards(self, items) -> list:
+        """Novel cards (search and listing pages) -> result dicts."""
+        results = []
+        for item in items:
+            # 1. Extract Title (h2.card-title)
+            title_tag = item.select_one('h2.card-title')
+            if not title_tag:
+                continue
+            
+            title = title_tag.get_text(strip=True)
+
+            # 2. Extract Link (a.custom-link containing the "Ler Novel" button)
+            link_tag = item.select_one('a.custom-link')
+            path = link_tag.get("href", "") if link_tag else ""
+            full_url = f"{self.BASE_URL}{path}" if path.startswith('/') else path
+
+            # 3. Extract Cover Image (img.custom-card-img)
+            img_tag = item.select_one('img.custom-card-img')
+            cover_url = img_tag.get("src", "") if img_tag else None
+
+            # 4. Extract Author (h3.card-text small)
+            author_tag = item.select_one('h3.card-text small')
+            author = author_tag.get_text(strip=True) if author_tag else "Unknown"
+
+            results.append({
+                "title": title,
+                "url": full_url,
+                "cover": cover_url,
+                "author": author,
+                "chapters_count": "N/A" # Search page usually doesn't show the count
+            })
+        return results
+
     def get_book_instance(self, url: str, qty: int, start: int) -> MyNovelsBrBook:
         """
         Returns a specialized MyNovelsBrBook instance.
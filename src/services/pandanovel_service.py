@@ -4,7 +4,11 @@ from src.classes.pandanovel_book import MyPandaNovelBook
 from src.services.registry import ScraperRegistry
 from src.utils.logger import logger
 
-@ScraperRegistry.register("pandanovel.co", "novelfire.net")
+@ScraperRegistry.register(
+    "pandanovel.co", "novelfire.net",
+    # Same books and chapter paths on every host: chapter fetches are spread/failed over between them
+    mirrors=("novelfire.noveljk.org", "novelfire.net")
+)
 class PandaNovelService(BaseService):
     """
     Service responsible for interacting with PandaNovel.
@@ -32,48 +36,64 @@ class PandaNovelService(BaseService):
             )
             response.raise_for_status()
 
-            # Limpeza básica de caracteres escapados comuns em respostas AJAX
-            raw_html = response.text.replace('\\/', '/').replace('\\"', '"')
-            soup = BeautifulSoup(raw_html, 'html.parser')
-            
-            results = []
-            items = soup.find_all("li")
-            
-            if not items:
+            results = self._parse_live_results(response.text)
+            if not results:
                 logger.warning(f"[{self.service_name}] No results found for '{query}'. Site might have changed its AJAX response format.")
                 return []
 
-            for item in items:
-                link_tag = item.find("a")
-                if not link_tag: 
-                    continue
-
-                path = link_tag.get("href", "").strip('"')
-                full_url = path if path.startswith('http') else f"{self.BASE_URL}{path}"
-                
-                img_tag = item.find("img")
-                cover_url = img_tag.get("src", "").strip('"') if img_tag else None
-                if cover_url and not cover_url.startswith('http'):
-                    cover_url = f"{self.BASE_URL}{cover_url}"
-                
-                title_tag = item.find("h4")
-                chapters_tag = item.find("span")
-
-                results.append({
-                    "title": title_tag.get_text(strip=True) if title_tag else "Unknown",
-                    "url": full_url,
-                    "cover": cover_url,
-                    "chapters_count": chapters_tag.get_text(strip=True) if chapters_tag else "N/A"
-                })
-            
             logger.info(f"[{self.service_name}] Search successful. Found {len(results)} items.")
             return results
 
         except Exception as e:
             # O exc_info=True captura o erro de parsing ou de rede detalhadamente
             logger.error(f"[{self.service_name}] Error during AJAX search for '{query}': {str(e)}", exc_info=True)
+            self.last_search_error = e
             return []
 
+    async def asearch(self, query: str) -> list:
+        """Non-blocking search over the pooled async client (see BaseService.asearch)."""
+        response = await self._session.aget(self.SEARCH_URL, params={"inputContent": query.strip()}, timeout=10)
+        if response.status_code in (403, 503):
+            return await self._blocking_search(query, f"HTTP {response.status_code}")
+        response.raise_for_status()
+
+        results = self._parse_live_results(response.text)
+        logger.info(f"[{self.service_name}] Search successful. Found {len(results)} items.")
+        return results
+
+    def _parse_live_results(self, text: str) -> list:
+        """AJAX live search response -> result dicts."""
+        # Limpeza básica de caracteres escapados comuns em respostas AJAX
+        raw_html = text.replace('\\/', '/').replace('\\"', '"')
+        soup = BeautifulSoup(raw_html, 'html.parser')
+        
+        results = []
+        items = soup.find_all("li")
+        
+        for item in items:
+            link_tag = item.find("a")
+            if not link_tag: 
+                continue
+
+            path = link_tag.get("href", "").strip('"')
+            full_url = path if path.startswith('http') else f"{self.BASE_URL}{path}"
+            
+            img_tag = item.find("img")
+            cover_url = img_tag.get("src", "").strip('"') if img_tag else None
+            if cover_url and not cover_url.startswith('http'):
+                cover_url = f"{self.BASE_URL}{cover_url}"
+            
+            title_tag = item.find("h4")
+            chapters_tag = item.find("span")
+
+            results.append({
+                "title": title_tag.get_text(strip=True) if title_tag else "Unknown",
+                "url": full_url,
+                "cover": cover_url,
+                "chapters_count": chapters_tag.get_text(strip=True) if chapters_tag else "N/A"
+            })
+        return results
+
     def get_book_instance(self, url: str, qty: int, start: int) -> MyPandaNovelBook:
         """
         Returns a specialized book instance for PandaNovel.
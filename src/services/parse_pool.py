@@ -0,0 +1,75 @@
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+from src.config import get_settings
+from src.schemas.novel_schema import ChapterContent
+from src.utils.logger import logger
+
+
+# (chapter index, chapter url, raw page bytes)
+ParseItem = Tuple[int, str, bytes]
+
+
+def _parse_batch(parse_func: Callable[[bytes, str], ChapterContent], batch: List[ParseItem]) -> List[Tuple[int, Optional[ChapterContent]]]:
+    """
+    Runs in a worker process: parses a batch of raw pages.
+    Batching amortizes the IPC (pickling) cost over several chapters.
+    """
+    results = []
+    for index, url, html in batch:
+        try:
+            results.append((index, parse_func(html, url)))
+        except Exception as e:
+            logger.error(f"[ParsePool] Failed to parse chapter {index + 1} ({url}): {e}")
+            results.append((index, None))
+    return results
+
+
+class ParsePool:
+    """
+    Process pool for CPU-bound chapter parsing (BeautifulSoup + decode_contents), so download
+    threads no longer serialize on the GIL. Small jobs keep parsing in-process.
+    """
+    _executor: Optional[ProcessPoolExecutor] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def should_use(cls, total_chapters: int) -> bool:
+        settings = get_settings()
+        return settings.PARSE_PROCESS_WORKERS > 0 and total_chapters >= settings.PARSE_POOL_MIN_CHAPTERS
+
+    @classmethod
+    def _get_executor(cls) -> ProcessPoolExecutor:
+        with cls._lock:
+            if cls._executor is None:
+                workers = get_settings().PARSE_PROCESS_WORKERS
+                # 'spawn' avoids forking a process that already runs event-loop and executor threads
+                cls._executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+                logger.info(f"[ParsePool] Process pool started with {workers} workers.")
+            return cls._executor
+
+    @classmethod
+    def submit(cls, parse_func: Callable[[bytes, str], ChapterContent], batch: List[ParseItem]) -> Future:
+        return cls._get_executor().submit(_parse_batch, parse_func, batch)
+
+    @classmethod
+    def collect(cls, future: Future, parse_func: Callable[[bytes, str], ChapterContent], batch: List[ParseItem]) -> List[Tuple[int, Optional[ChapterContent]]]:
+        """Waits for a batch; falls back to parsing in-process if the pool broke."""
+        try:
+            return future.result()
+        except Exception as e:
+            logger.warning(f"[ParsePool] Worker failed ({e}). Parsing batch of {len(batch)} in-process.")
+            return _parse_batch(parse_func, batch)
+
+    @classmethod
+    def shutdown(cls):
+        with cls._lock:
+            if cls._executor is not None:
+                cls._executor.shutdown(wait=False, cancel_futures=True)
+                cls._executor = None
+                logger.info("[ParsePool] Process pool shut down.")
@@ -0,0 +1,59 @@
+import threading
+from typing import Dict, Optional, Tuple
+
+from src.schemas.novel_schema import BookMetadata, Chapter, Novel
+from src.services.epub_builder import EpubBuilder
+
+
+class PartialBook:
+    """
+    Chapters of a running job as they finish, so the contiguous prefix (chapters 1..N with nothing
+    missing) can be delivered before the job ends. Only references to the job's chapters are kept;
+    pages are rendered when a partial download is built, and the EPUB of a given prefix is built only
+    once however often it is downloaded.
+    """
+
+    def __init__(self):
+        self.metadata: Optional[BookMetadata] = None
+        self.cover_bytes: Optional[bytes] = None
+        self.total = 0
+        self._chapters: Dict[int, Chapter] = {}  # by 0-based position in the job
+        self._ready = 0
+        self._build: Optional[Tuple[int, bytes]] = None
+        self._lock = threading.Lock()
+
+    def start(self, metadata: BookMetadata, cover_bytes: Optional[bytes], total: int):
+        with self._lock:
+            self.metadata = metadata
+            self.cover_bytes = cover_bytes
+            self.total = total
+
+    def add(self, position: int, chapter: Chapter):
+        """Chapter callback of BaseScraper.download_novel."""
+        with self._lock:
+            self._chapters[position] = chapter
+            while self._ready in self._chapters:
+                self._ready += 1
+
+    @property
+    def ready(self) -> int:
+        """Length of the finished prefix."""
+        return self._ready
+
+    def build(self) -> Optional[Tuple[int, bytes]]:
+        """(chapters, EPUB bytes) of the finished prefix, or None while chapter 1 is not done."""
+        with self._lock:
+            ready = self._ready
+            if not ready or self.metadata is None:
+                return None
+            if self._build and self._build[0] == ready:
+                return self._build
+            chapters = [self._chapters[position] for position in range(ready)]
+            metadata, cover_bytes = self.metadata, self.cover_bytes
+
+        novel = Novel(metadata=metadata, chapters=chapters, cover_image_bytes=cover_bytes)
+        build = (ready, EpubBuilder.create_epub(novel).getvalue())
+        with self._lock:
+            if not self._build or self._build[0] < ready:
+                self._build = build
+        return build
@@ -0,0 +1,37 @@
+import threading
+import time
+from typing import Dict
+
+
+class DomainRateLimiter:
+    """
+    Minimum spacing between background requests to the same domain (watcher polls and prefetches),
+    so scheduled work never bursts against a source the interactive jobs also depend on.
+    """
+    _next_allowed: Dict[str, float] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def try_acquire(cls, domain: str, interval: float) -> bool:
+        """Takes the domain's next slot if it is free now; never waits."""
+        now = time.monotonic()
+        with cls._lock:
+            if cls._next_allowed.get(domain, 0.0) > now:
+                return False
+            cls._next_allowed[domain] = now + interval
+            return True
+
+    @classmethod
+    def acquire(cls, domain: str, interval: float):
+        """Reserves the domain's next slot and sleeps until it comes."""
+        with cls._lock:
+            now = time.monotonic()
+            slot = max(now, cls._next_allowed.get(domain, 0.0))
+            cls._next_allowed[domain] = slot + interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._next_allowed.clear()
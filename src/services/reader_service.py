@@ -0,0 +1,145 @@
+import concurrent.futures
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Set
+
+from src.config import get_settings
+from src.services.chapter_cache import ChapterCache
+from src.services.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from src.services.rate_limiter import DomainRateLimiter
+from src.services.registry import ScraperRegistry
+from src.services.toc_cache import TocCache
+from src.utils.exceptions import ChapterLimitException, CircuitOpenException
+from src.utils.logger import logger
+
+
+class ReaderService:
+    """
+    Chapter-by-chapter reading. Every read is answered from the ChapterCache when possible and
+    schedules a read-ahead of the next chapters in the background, spaced by the per-domain rate limit.
+
+    The read-ahead depth follows the reader: chapters read in sequence quickly get a deeper read-ahead
+    (enough to cover READER_PREFETCH_HORIZON seconds of reading), jumps and slow reading a shallow one.
+    """
+    # { "host/path": { "last_n": int, "last_read_at": float, "interval": float | None } }
+    _sessions: "OrderedDict[str, dict]" = OrderedDict()
+    _lock = threading.Lock()
+    # Chapter URLs queued or being prefetched (never queued twice)
+    _pending: Set[str] = set()
+    _executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=get_settings().READER_PREFETCH_WORKERS, thread_name_prefix="reader"
+    )
+
+    # Sessions kept for the read-ahead heuristics (least recently read are forgotten first)
+    MAX_SESSIONS = 1000
+
+    @classmethod
+    def read_ahead_depth(cls, book_url: str, n: int, now: Optional[float] = None) -> int:
+        """Records a read of chapter `n` and returns how many following chapters to prefetch."""
+        settings = get_settings()
+        now = time.time() if now is None else now
+        key = TocCache._key(book_url)
+        with cls._lock:
+            session = cls._sessions.pop(key, None) or {"last_n": None, "last_read_at": 0.0, "interval": None}
+            elapsed = now - session["last_read_at"]
+            if session["last_n"] is not None and n == session["last_n"] + 1 and elapsed < settings.READER_SESSION_GAP:
+                # Reading pace, smoothed (EWMA) so one quick skip does not flood the source
+                previous = session["interval"]
+                session["interval"] = elapsed if previous is None else 0.5 * previous + 0.5 * elapsed
+            elif session["last_n"] != n:
+                # Jump (or a new reading session): the pace is unknown again
+                session["interval"] = None
+            session["last_n"] = n
+            session["last_read_at"] = now
+            cls._sessions[key] = session
+            while len(cls._sessions) > cls.MAX_SESSIONS:
+                cls._sessions.popitem(last=False)
+            interval = session["interval"]
+
+        if interval is None:
+            return settings.READER_PREFETCH_MIN
+        depth = math.ceil(settings.READER_PREFETCH_HORIZON / max(interval, 1.0))
+        return max(settings.READER_PREFETCH_MIN, min(settings.READER_PREFETCH_MAX, depth))
+
+    @classmethod
+    def read(cls, book_url: str, n: int) -> dict:
+        """
+        Blocking read of chapter `n` (1-based) of a book. Raises ValueError for unsupported domains,
+        ChapterLimitException when `n` is past the last chapter and CircuitOpenException while the
+        source blocks us.
+        """
+        service_class = ScraperRegistry.get_service(book_url)
+        if not service_class:
+            raise ValueError("Unsupported domain.")
+
+        depth = cls.read_ahead_depth(book_url, n)
+        scraper = service_class().get_book_instance(book_url, depth + 1, n)
+        try:
+            # Chapter n and the ones to read ahead (the list comes from the TocCache after the first read)
+            chapter_urls = scraper.get_chapters_link()
+        except ValueError as e:
+            raise ChapterLimitException(str(e))
+
+        chapter_url = chapter_urls[0]
+        chapter = ChapterCache.get(chapter_url)
+        cached = chapter is not None
+        if not cached:
+            breaker = CircuitBreakerRegistry.get(chapter_url)
+            if breaker.state == CircuitBreaker.OPEN:
+                raise CircuitOpenException(breaker.domain, breaker.retry_after())
+            chapter = scraper.get_chapter_content(chapter_url)
+            if not chapter or not chapter.content:
+                raise ValueError("Main content is empty or not found.")
+            ChapterCache.set(chapter_url, chapter)
+
+        ahead = cls._schedule_prefetch(scraper, chapter_urls[1:])
+        return {
+            "url": book_url,
+            "n": n,
+            "chapter_url": chapter_url,
+            "title": chapter.title,
+            "content": chapter.content,
+            "total_chapters": TocCache.get_total(book_url),
+            "cached": cached,
+            "prefetching": ahead
+        }
+
+    @classmethod
+    def _schedule_prefetch(cls, scraper, urls: list) -> int:
+        """Queues the chapters that are neither cached nor already queued. Returns how many were queued."""
+        with cls._lock:
+            missing = [url for url in urls if url not in cls._pending and not ChapterCache.contains(url)]
+            cls._pending.update(missing)
+        if missing:
+            cls._executor.submit(cls._prefetch, scraper, missing)
+        return len(missing)
+
+    @classmethod
+    def _prefetch(cls, scraper, urls: list):
+        settings = get_settings()
+        domain = ScraperRegistry.domain_key(urls[0])
+        try:
+            for url in urls:
+                if CircuitBreakerRegistry.get(url).state == CircuitBreaker.OPEN:
+                    break
+                DomainRateLimiter.acquire(domain, settings.READER_PREFETCH_DOMAIN_INTERVAL)
+                try:
+                    chapter = scraper.get_chapter_content(url)
+                except Exception as e:
+                    logger.warning(f"[ReaderService] Read-ahead failed for {url}: {e!r}")
+                    break
+                if chapter and chapter.content:
+                    ChapterCache.set(url, chapter)
+                with cls._lock:
+                    cls._pending.discard(url)
+        finally:
+            with cls._lock:
+                cls._pending.difference_update(urls)
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._sessions.clear()
+            cls._pending.clear()
@@ -0,0 +1,173 @@
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+from src.config import get_settings
+from src.schemas.novel_schema import Chapter
+from src.services.artifact_store import ArtifactStore
+from src.services.chapter_cache import ChapterCache
+from src.services.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from src.services.epub_builder import EpubBuilder
+from src.services.rate_limiter import DomainRateLimiter
+from src.services.registry import ScraperRegistry
+from src.services.task_manager import TaskManager
+from src.utils.constants import EPUB_STRINGS
+from src.utils.logger import logger
+
+
+class RefillService:
+    """
+    Second chance for the chapters a job could not download. Artifacts saved with error placeholders
+    are queued; a scheduled job retries those chapters once the source (or proxy) had time to recover,
+    doubling the delay between attempts, and patches the recovered pages into the stored EPUB.
+    The task that built the artifact gets the upgraded file and its new revision.
+
+    The queue is persisted (REFILL_STORE_PATH) so restarts and redeploys keep the pending refills.
+    """
+    # { artifact_id: { "source_url": str, "task_id": str | None, "attempts": int, "next_at": float } }
+    _queue: Dict[str, dict] = {}
+    _loaded = False
+    # Tasks whose refill ended, forgotten on the next tick once downloaded (their SSE stream saw the outcome)
+    _finished_tasks: List[str] = []
+    _lock = threading.Lock()
+
+    @classmethod
+    def _path(cls) -> str:
+        return get_settings().REFILL_STORE_PATH
+
+    @classmethod
+    def _ensure_loaded(cls):
+        # Caller must hold the lock
+        if cls._loaded:
+            return
+        cls._loaded = True
+        path = cls._path()
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                cls._queue = json.load(f)
+            logger.info(f"[RefillService] Loaded {len(cls._queue)} pending refills.")
+        except Exception as e:
+            logger.warning(f"[RefillService] Could not load {path}: {e}")
+            cls._queue = {}
+
+    @classmethod
+    def _save(cls):
+        # Caller must hold the lock. Write-then-rename so a crash never leaves a truncated file.
+        path = cls._path()
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(cls._queue, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"[RefillService] Failed to persist the queue: {e}")
+
+    @classmethod
+    def schedule(cls, artifact_id: str, source_url: str, task_id: Optional[str] = None):
+        settings = get_settings()
+        if settings.REFILL_MAX_ATTEMPTS <= 0:
+            return
+        with cls._lock:
+            cls._ensure_loaded()
+            cls._queue[artifact_id] = {
+                "source_url": source_url,
+                "task_id": task_id,
+                "attempts": 0,
+                "next_at": time.time() + settings.REFILL_DELAY_SECONDS
+            }
+            cls._save()
+        logger.info(f"[RefillService] Artifact {artifact_id} queued for a refill of its failed chapters.")
+
+    @classmethod
+    def is_pending(cls, artifact_id: Optional[str]) -> bool:
+        with cls._lock:
+            cls._ensure_loaded()
+            return artifact_id in cls._queue
+
+    @classmethod
+    def run_due(cls, now: Optional[float] = None):
+        """Scheduled job: one refill attempt per due artifact."""
+        settings = get_settings()
+        now = time.time() if now is None else now
+        with cls._lock:
+            finished, cls._finished_tasks = cls._finished_tasks, []
+        for task_id in finished:
+            TaskManager.forget_downloaded(task_id)
+
+        with cls._lock:
+            cls._ensure_loaded()
+            due = [(artifact_id, dict(entry)) for artifact_id, entry in cls._queue.items() if entry["next_at"] <= now]
+
+        for artifact_id, entry in due:
+            try:
+                missing = cls.refill(artifact_id, entry["source_url"], entry["task_id"])
+            except Exception as e:
+                logger.error(f"[RefillService] Refill of {artifact_id} failed: {e}", exc_info=True)
+                missing = None
+
+            attempts = entry["attempts"] + 1
+            with cls._lock:
+                if missing == 0 or attempts >= settings.REFILL_MAX_ATTEMPTS:
+                    cls._queue.pop(artifact_id, None)
+                    if entry["task_id"]:
+                        cls._finished_tasks.append(entry["task_id"])
+                    if missing:
+                        logger.warning(f"[RefillService] Giving up on {missing} chapters of {artifact_id}.")
+                elif artifact_id in cls._queue:
+                    cls._queue[artifact_id].update(
+                        attempts=attempts, next_at=now + settings.REFILL_DELAY_SECONDS * 2 ** attempts
+                    )
+                cls._save()
+
+    @classmethod
+    def refill(cls, artifact_id: str, source_url: str, task_id: Optional[str] = None) -> int:
+        """Blocking. Retries the artifact's placeholder chapters; returns how many are still missing."""
+        failed = ArtifactStore.failed_chapters(artifact_id)
+        if not failed:
+            return 0
+        service_class = ScraperRegistry.get_service(source_url)
+        if not service_class:
+            return len(failed)
+
+        settings = get_settings()
+        scraper = service_class().get_book_instance(source_url, 1, 1)
+        domain = ScraperRegistry.domain_key(source_url)
+        recovered = []
+        for entry in failed:
+            url = entry["url"]
+            content = ChapterCache.get(url)
+            if content is None:
+                if CircuitBreakerRegistry.get(url).state == CircuitBreaker.OPEN:
+                    break
+                DomainRateLimiter.acquire(domain, settings.REFILL_DOMAIN_INTERVAL)
+                try:
+                    content = scraper.get_chapter_content(url)
+                except Exception as e:
+                    logger.warning(f"[RefillService] {url} still failing: {e!r}")
+                    continue
+                if not content or not content.content or content.content == EPUB_STRINGS["error_content"]:
+                    continue
+                ChapterCache.set(url, content)
+            chapter = Chapter(index=entry["index"], title=content.title, content=content.content, url=url)
+            recovered.append(chapter.model_copy(update={"document": EpubBuilder.render_chapter(chapter)}))
+
+        missing = len(failed) - len(recovered)
+        revision = ArtifactStore.patch_chapters(artifact_id, recovered) if recovered else None
+        if revision:
+            logger.info(f"[RefillService] 🩹 Refilled {len(recovered)} chapters of {artifact_id} ({missing} still missing).")
+            if task_id:
+                TaskManager.mark_upgraded(task_id, ArtifactStore.get_path(artifact_id), revision, missing)
+        return missing
+
+    @classmethod
+    def reset(cls):
+        """Forgets the in-memory state (the file is re-read on next access)."""
+        with cls._lock:
+            cls._queue = {}
+            cls._loaded = False
+            cls._finished_tasks = []
@@ -1,17 +1,24 @@
-from typing import Type, Dict, Optional
+from typing import Type, Dict, Iterable, Optional, Tuple
+from urllib.parse import urlparse
 import importlib
 import pkgutil
 from src.utils.logger import logger
 
 class ScraperRegistry:
     _registry: Dict[str, Type] = {}
+    # host -> every equivalent mirror host of its group (see MirrorRouter)
+    _mirrors: Dict[str, Tuple[str, ...]] = {}
+    # mirror host -> domain key shared by its whole group (one session pool, breaker, rate limit)
+    _mirror_keys: Dict[str, str] = {}
 
     @classmethod
-    def register(cls, *domains: str):
+    def register(cls, *domains: str, mirrors: Iterable[str] = ()):
         """
         Decorator to register a service class for one or multiple domains.
+        `mirrors` lists hosts serving the same content under the same paths; fetches are spread
+        and failed over between them. Mirror hosts are registered too and share one domain key.
         Usage:
-            @ScraperRegistry.register("domain.com", "another-domain.com")
+            @ScraperRegistry.register("domain.com", "another-domain.com", mirrors=("domain.com", "mirror.domain.net"))
             class MyService(BaseService):
                 ...
         """
@@ -19,9 +26,24 @@ class ScraperRegistry:
             for domain in domains:
                 # Normalize domain to lowercase for consistent lookup
                 cls._registry[domain.lower()] = service_cls
+            group = tuple(host.lower() for host in mirrors)
+            key = next((host for host in group if any(d.lower() in host for d in domains)), group[0] if group else None)
+            for host in group:
+                cls._registry.setdefault(host, service_cls)
+                cls._mirrors[host] = group
+                cls._mirror_keys[host] = key
             return service_cls
         return wrapper
 
+    @classmethod
+    def get_mirrors(cls, host: str) -> Tuple[str, ...]:
+        """Mirror group of a host (empty when the host has no registered mirrors)."""
+        return cls._mirrors.get((host or "").lower(), ())
+
+    @classmethod
+    def get_mirror_groups(cls) -> list[Tuple[str, ...]]:
+        return list(dict.fromkeys(cls._mirrors.values()))
+
     @classmethod
     def get_service(cls, url: str) -> Optional[Type]:
         """
@@ -34,6 +56,29 @@ class ScraperRegistry:
                 return service_cls
         return None
 
+    @classmethod
+    def get_domain(cls, url: str) -> Optional[str]:
+        """
+        Returns the registered domain that matches the given URL (same lookup rule as get_service).
+        Every host of a mirror group returns the group's key.
+        """
+        key = cls._mirror_keys.get((urlparse(url).hostname or "").lower())
+        if key:
+            return key
+        normalized_url = url.lower()
+        for domain in cls._registry:
+            if domain in normalized_url:
+                return domain
+        return None
+
+    @classmethod
+    def domain_key(cls, url: str) -> str:
+        """
+        Key used to share per-domain state (sessions, circuit breakers...).
+        Registered domain when the URL is supported, otherwise the URL host.
+        """
+        return cls.get_domain(url) or (urlparse(url).hostname or url).lower()
+
     @classmethod
     def get_registered_domains(cls) -> list[str]:
         return list(cls._registry.keys())
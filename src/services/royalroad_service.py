@@ -31,8 +31,7 @@ class RoyalRoadService(BaseService):
             response.raise_for_status()
             
             soup = BeautifulSoup(response.text, 'html.parser')
-            results = []
-            
+
             # Selector para os itens da lista
             items = soup.select('div.fiction-list-item')
             
@@ -40,42 +39,67 @@ class RoyalRoadService(BaseService):
                 logger.warning(f"[{self.service_name}] No results found for '{query}'. This might be a search with no matches or a change in the site's CSS selectors.")
                 return []
             
-            for item in items:
-                # 1. Title and URL extraction
-                title_tag = item.select_one('h2.fiction-title a')
-                
-                # 2. Cover image extraction
-                img_tag = item.find('img')
-                cover_url = None
-                if img_tag:
-                    cover_url = img_tag.get('src') or img_tag.get('data-src')
-
-                # 3. Chapter count extraction (Logic: find list icon 'fa-list')
-                chapters_count = "N/A"
-                stats_div = item.select_one('.stats')
-                if stats_div:
-                    chapter_icon = stats_div.find('i', class_='fa-list')
-                    if chapter_icon:
-                        count_span = chapter_icon.find_next('span')
-                        if count_span:
-                            chapters_count = count_span.get_text(strip=True)
-
-                if title_tag:
-                    results.append({
-                        "title": title_tag.get_text(strip=True),
-                        "url": f"{self.BASE_URL}{title_tag.get('href')}",
-                        "cover": cover_url,
-                        "chapters_count": chapters_count
-                    })
-            
+            results = self._parse_fiction_list(items)
             logger.info(f"[{self.service_name}] Search successful. Found {len(results)} items.")
             return results
 
         except Exception as e:
             # exc_info=True garante que o Traceback completo apareça no log de erro
             logger.error(f"[{self.service_name}] Search error for query '{query}': {str(e)}", exc_info=True)
+            self.last_search_error = e
             return []
 
+    async def asearch(self, query: str) -> list:
+        """Non-blocking search over the pooled async client (see BaseService.asearch)."""
+        response = await self._session.aget(f"{self.BASE_URL}/fictions/search", params={'title': query.strip()}, timeout=10)
+        if response.status_code in (403, 503):
+            return await self._blocking_search(query, f"HTTP {response.status_code}")
+        response.raise_for_status()
+
+        soup = BeautifulSoup(response.text, 'html.parser')
+        results = self._parse_fiction_list(soup.select('div.fiction-list-item'))
+        logger.info(f"[{self.service_name}] Search successful. Found {len(results)} items.")
+        return results
+
+    def catalog_page(self, page: int) -> list:
+        """Listing page of the catalog crawler (best rated fictions, same markup as the search page)."""
+        response = self._session.get(f"{self.BASE_URL}/fictions/best-rated", params={"page": page}, timeout=10)
+        response.raise_for_status()
+        soup = BeautifulSoup(response.text, 'html.parser')
+        return self._parse_fiction_list(soup.select('div.fiction-list-item'))
+
+    def _parse_fiction_list(self, items) -> list:
+        """Fiction list items (search and listing pages) -> result dicts."""
+        results = []
+        for item in items:
+            # 1. Title and URL extraction
+            title_tag = item.select_one('h2.fiction-title a')
+            
+            # 2. Cover image extraction
+            img_tag = item.find('img')
+            cover_url = None
+            if img_tag:
+                cover_url = img_tag.get('src') or img_tag.get('data-src')
+
+            # 3. Chapter count extraction (Logic: find list icon 'fa-list')
+            chapters_count = "N/A"
+            stats_div = item.select_one('.stats')
+            if stats_div:
+                chapter_icon = stats_div.find('i', class_='fa-list')
+                if chapter_icon:
+                    count_span = chapter_icon.find_next('span')
+                    if count_span:
+                        chapters_count = count_span.get_text(strip=True)
+
+            if title_tag:
+                results.append({
+                    "title": title_tag.get_text(strip=True),
+                    "url": f"{self.BASE_URL}{title_tag.get('href')}",
+                    "cover": cover_url,
+                    "chapters_count": chapters_count
+                })
+        return results
+
     def get_book_instance(self, url: str, qty: int, start: int) -> MyRoyalRoadBook:
         """
         Implementation of the abstract factory method for Royal Road.
@@ -0,0 +1,81 @@
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from src.config import get_settings
+from src.utils.logger import logger
+
+
+class SearchCache:
+    """
+    Bounded LRU cache of provider search results, keyed by (source, normalized query).
+    An entry is fresh for SEARCH_CACHE_TTL seconds, then served stale (while SearchService refreshes
+    it in the background) until SEARCH_CACHE_STALE_TTL; past that it is a miss.
+    """
+    # { (source, query): (results, fresh_until, stale_until) } in least-recently-used order
+    _entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+    _hits = 0
+    _stale_hits = 0
+    _misses = 0
+    _lock = threading.Lock()
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        """'  Shadow   SLAVE ' and 'shadow slave' are the same search."""
+        return re.sub(r"\s+", " ", unicodedata.normalize("NFKC", query)).strip().casefold()
+
+    @classmethod
+    def get(cls, source: str, query: str) -> Optional[Tuple[list, bool]]:
+        """Returns (results, is_fresh), or None when there is nothing usable."""
+        key = (source, cls.normalize(query))
+        now = time.time()
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry and entry[2] > now:
+                cls._entries.move_to_end(key)
+                fresh = entry[1] > now
+                if fresh:
+                    cls._hits += 1
+                else:
+                    cls._stale_hits += 1
+                return list(entry[0]), fresh
+            if entry:
+                del cls._entries[key]
+            cls._misses += 1
+            return None
+
+    @classmethod
+    def set(cls, source: str, query: str, results: list):
+        settings = get_settings()
+        if settings.SEARCH_CACHE_MAX_ENTRIES <= 0 or settings.SEARCH_CACHE_TTL <= 0:
+            return
+        key = (source, cls.normalize(query))
+        now = time.time()
+        stale_ttl = max(settings.SEARCH_CACHE_STALE_TTL, settings.SEARCH_CACHE_TTL)
+        with cls._lock:
+            cls._entries[key] = (list(results), now + settings.SEARCH_CACHE_TTL, now + stale_ttl)
+            cls._entries.move_to_end(key)
+            while len(cls._entries) > settings.SEARCH_CACHE_MAX_ENTRIES:
+                cls._entries.popitem(last=False)
+        logger.debug(f"[SearchCache] Cached {len(results)} results for {source}:'{key[1]}'")
+
+    @classmethod
+    def stats(cls) -> dict:
+        with cls._lock:
+            return {
+                "entries": len(cls._entries),
+                "hits": cls._hits,
+                "stale_hits": cls._stale_hits,
+                "misses": cls._misses
+            }
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._entries.clear()
+            cls._hits = 0
+            cls._stale_hits = 0
+            cls._misses = 0
@@ -0,0 +1,146 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Type
+
+from src.config import get_settings
+from src.services.base_service import BaseService
+from src.services.centralnovel_service import CentralNovelService
+from src.services.novelsbr_service import NovelsBrService
+from src.services.pandanovel_service import PandaNovelService
+from src.services.royalroad_service import RoyalRoadService
+from src.services.search_cache import SearchCache
+from src.utils.logger import logger
+
+
+class SearchService:
+    """
+    Runs provider searches (BaseService.asearch) on a dedicated event loop, alone or fanned out
+    over several sources at once. Requests and waits are non-blocking, so concurrent searches are
+    not bounded by a thread pool; only blocking fallbacks use the SEARCH_WORKERS threads.
+    Every source has its own deadline (SEARCH_SOURCE_TIMEOUT): a slow or failing site only costs
+    its own results, the others are returned (or streamed) as soon as they arrive.
+
+    Results are cached per (source, normalized query) in the SearchCache; stale entries are answered
+    at once and refreshed in the background, and identical searches in flight share one provider call.
+    """
+    PROVIDERS: Dict[str, Type[BaseService]] = {
+        "central": CentralNovelService,
+        "novelsbr": NovelsBrService,
+        "panda": PandaNovelService,
+        "royal": RoyalRoadService,
+    }
+
+    # Blocking fallbacks (cloudscraper challenges, sources without an async search)
+    _executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=get_settings().SEARCH_WORKERS, thread_name_prefix="search"
+    )
+    # Event loop owning the searches and their pooled async clients (one background thread)
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _loop_lock = threading.Lock()
+
+    @classmethod
+    def resolve_sources(cls, source: str) -> List[str]:
+        """`all`, one source or a comma-separated list. Raises ValueError for unknown sources."""
+        keys = [key.strip().lower() for key in source.split(",") if key.strip()]
+        if keys == ["all"]:
+            return list(cls.PROVIDERS)
+        unknown = [key for key in keys if key not in cls.PROVIDERS]
+        if unknown or not keys:
+            raise ValueError(f"Invalid source. Available options: {list(cls.PROVIDERS) + ['all']}")
+        return list(dict.fromkeys(keys))
+
+    # Provider calls in flight, shared by identical concurrent searches: { (source, query): Future }
+    _inflight: Dict[Tuple[str, str], concurrent.futures.Future] = {}
+    _inflight_lock = threading.Lock()
+
+    @classmethod
+    def _io_loop(cls) -> asyncio.AbstractEventLoop:
+        # Request loops come and go (and tests run several); the searches live on one long-lived loop
+        with cls._loop_lock:
+            if cls._loop is None:
+                loop = asyncio.new_event_loop()
+                loop.set_default_executor(cls._executor)
+                threading.Thread(target=loop.run_forever, name="search-io", daemon=True).start()
+                cls._loop = loop
+            return cls._loop
+
+    @classmethod
+    async def _run(cls, source: str, query: str) -> list:
+        return await cls.PROVIDERS[source]().asearch(query)
+
+    @classmethod
+    def _fetch(cls, source: str, query: str) -> concurrent.futures.Future:
+        """Starts the provider search, or joins the identical one already running. Successes fill the cache."""
+        key = (source, query)
+        with cls._inflight_lock:
+            future = cls._inflight.get(key)
+            if future is not None:
+                return future
+            future = asyncio.run_coroutine_threadsafe(cls._run(source, query), cls._io_loop())
+            cls._inflight[key] = future
+
+        def done(finished: concurrent.futures.Future):
+            with cls._inflight_lock:
+                if cls._inflight.get(key) is finished:
+                    del cls._inflight[key]
+            if not finished.cancelled() and finished.exception() is None:
+                SearchCache.set(source, query, finished.result())
+
+        future.add_done_callback(done)
+        return future
+
+    @classmethod
+    async def search_source(cls, source: str, query: str) -> dict:
+        """One provider's search bounded by its deadline. Never raises: the outcome is in `status`."""
+        timeout = get_settings().SEARCH_SOURCE_TIMEOUT
+        started = time.perf_counter()
+        query = SearchCache.normalize(query)
+        outcome = {"source": source, "status": "ok", "results": [], "error": None, "cached": False}
+
+        cached = SearchCache.get(source, query)
+        if cached is not None:
+            outcome["results"], fresh = cached
+            outcome["cached"] = True
+            if not fresh:
+                # Stale-while-revalidate: answer now, the refresh lands in the cache for the next search
+                cls._fetch(source, query)
+            outcome["results_count"] = len(outcome["results"])
+            outcome["duration_ms"] = int((time.perf_counter() - started) * 1000)
+            return outcome
+
+        try:
+            # Shielded: a deadline only abandons this wait, not the call other searches may be sharing
+            outcome["results"] = await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(cls._fetch(source, query))), timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            # The search goes on by itself; its late results only fill the cache
+            logger.warning(f"[SearchService] ⏱️ {source} missed its {timeout}s deadline for '{query}'.")
+            outcome["status"] = "timeout"
+        except Exception as e:
+            logger.error(f"[SearchService] {source} search failed for '{query}': {e}", exc_info=True)
+            outcome["status"] = "error"
+            outcome["error"] = str(e)
+
+        outcome["results_count"] = len(outcome["results"])
+        outcome["duration_ms"] = int((time.perf_counter() - started) * 1000)
+        return outcome
+
+    @classmethod
+    async def iter_search(cls, sources: List[str], query: str) -> AsyncIterator[dict]:
+        """Searches every source concurrently and yields each outcome as soon as it is ready."""
+        for next_done in asyncio.as_completed([cls.search_source(source, query) for source in sources]):
+            yield await next_done
+
+    @classmethod
+    async def search_many(cls, sources: List[str], query: str) -> List[dict]:
+        """Concurrent search; outcomes in the requested source order."""
+        return list(await asyncio.gather(*(cls.search_source(source, query) for source in sources)))
+
+    @classmethod
+    def reset(cls):
+        """Forgets the searches in flight (their threads still finish)."""
+        with cls._inflight_lock:
+            cls._inflight.clear()
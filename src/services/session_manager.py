@@ -0,0 +1,311 @@
+import asyncio
+import queue
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+
+import cloudscraper
+import httpx
+
+from src.config import get_settings
+from src.services.clearance_store import ClearanceStore
+from src.services.registry import ScraperRegistry
+from src.utils.logger import logger
+
+
+BROWSER_PROFILE = {
+    'browser': 'chrome',
+    'platform': 'windows',
+    'desktop': True
+}
+
+# Default headers of the async clients (cloudscraper sessions generate their own)
+ASYNC_CLIENT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9,pt-BR;q=0.8,pt;q=0.7",
+}
+
+
+# --- DNS CACHE ---
+
+_dns_cache: Dict[tuple, Tuple[float, list]] = {}
+_dns_lock = threading.Lock()
+_original_getaddrinfo = socket.getaddrinfo
+
+
+def _cached_getaddrinfo(*args, **kwargs):
+    """socket.getaddrinfo with a small TTL cache (hosts are resolved once per TTL, not per connection)."""
+    key = args + tuple(sorted(kwargs.items()))
+    ttl = get_settings().DNS_CACHE_TTL
+    now = time.time()
+
+    with _dns_lock:
+        cached = _dns_cache.get(key)
+        if cached and now - cached[0] < ttl:
+            return cached[1]
+
+    result = _original_getaddrinfo(*args, **kwargs)
+    with _dns_lock:
+        _dns_cache[key] = (now, result)
+    return result
+
+
+def install_dns_cache():
+    """Installs the process-wide DNS cache (no-op when DNS_CACHE_TTL is 0 or already installed)."""
+    if get_settings().DNS_CACHE_TTL > 0 and socket.getaddrinfo is not _cached_getaddrinfo:
+        socket.getaddrinfo = _cached_getaddrinfo
+        logger.info("[SessionManager] DNS cache enabled.")
+
+
+# --- SESSION POOL ---
+
+class SessionPool:
+    """
+    Bounded pool of cloudscraper sessions for one (domain, proxy) pair.
+    Sessions keep their TLS connections, keep-alive sockets and solved challenge cookies between jobs.
+    """
+
+    def __init__(self, domain: str, proxy_url: Optional[str], size: int):
+        self.domain = domain
+        self.proxy_url = proxy_url
+        self.size = size
+
+        # LIFO: hand out the most recently used (warmest) session first
+        self._idle: "queue.LifoQueue" = queue.LifoQueue()
+        self._created = 0
+        self._in_use = 0
+        self._lock = threading.Lock()
+
+    def _create_session(self):
+        settings = get_settings()
+        session = cloudscraper.create_scraper(browser=BROWSER_PROFILE)
+
+        # Re-size the connection pools of the mounted adapters (keeps cloudscraper's TLS adapter)
+        for prefix in ("https://", "http://"):
+            session.get_adapter(prefix).init_poolmanager(
+                settings.HTTP_POOL_CONNECTIONS,
+                settings.HTTP_POOL_MAXSIZE
+            )
+
+        if self.proxy_url:
+            session.proxies = {"http": self.proxy_url, "https": self.proxy_url}
+
+        logger.debug(f"[SessionManager] New session created for {self.domain} ({self._created + 1}/{self.size})")
+        return session
+
+    def acquire(self, timeout: float):
+        try:
+            session = self._idle.get_nowait()
+        except queue.Empty:
+            session = None
+
+        if session is None:
+            with self._lock:
+                can_create = self._created < self.size
+                if can_create:
+                    self._created += 1
+            if can_create:
+                session = self._create_session()
+            else:
+                try:
+                    session = self._idle.get(timeout=timeout)
+                except queue.Empty:
+                    # Pool exhausted for too long: serve an overflow session rather than dead-locking
+                    logger.warning(f"[SessionManager] Pool for {self.domain} exhausted. Creating overflow session.")
+                    with self._lock:
+                        self._created += 1
+                    session = self._create_session()
+
+        with self._lock:
+            self._in_use += 1
+        return session
+
+    def release(self, session):
+        with self._lock:
+            self._in_use -= 1
+            overflow = self._created > self.size
+            if overflow:
+                self._created -= 1
+
+        if overflow:
+            session.close()
+        else:
+            self._idle.put(session)
+
+    def prefill(self):
+        """Creates the missing sessions up front so the first job does not pay for it."""
+        with self._lock:
+            missing = self.size - self._created
+            self._created += max(0, missing)
+        for _ in range(missing):
+            self._idle.put(self._create_session())
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": self.size,
+                "created": self._created,
+                "in_use": self._in_use,
+                "idle": self._idle.qsize(),
+                "proxied": bool(self.proxy_url)
+            }
+
+
+class SessionManager:
+    """
+    Process-level manager handing out per-domain session pools.
+    Replaces the per-instance `cloudscraper.create_scraper` calls of services and scrapers.
+    Clearance cookies are shared between pooled sessions through the ClearanceStore.
+    """
+    _pools: Dict[Tuple[str, Optional[str]], SessionPool] = {}
+    # Async clients per (domain, proxy), with the event loop they are bound to
+    _async_clients: Dict[Tuple[str, Optional[str]], Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_pool(cls, domain: str, proxy_url: Optional[str] = None) -> SessionPool:
+        key = (domain, proxy_url)
+        with cls._lock:
+            pool = cls._pools.get(key)
+            if pool is None:
+                settings = get_settings()
+                install_dns_cache()
+                pool = SessionPool(domain, proxy_url, size=settings.SESSION_POOL_SIZE or settings.MAX_WORKERS)
+                cls._pools[key] = pool
+                logger.info(f"[SessionManager] Session pool created for {domain} (size={pool.size}).")
+            return pool
+
+    @classmethod
+    @contextmanager
+    def acquire(cls, url: str, proxy_url: Optional[str] = None):
+        """Borrows a session for the domain of `url`; it is returned to the pool on exit."""
+        pool = cls.get_pool(ScraperRegistry.domain_key(url), proxy_url)
+        session = pool.acquire(timeout=get_settings().DEFAULT_TIMEOUT)
+        try:
+            yield session
+        finally:
+            pool.release(session)
+
+    @classmethod
+    def get_async_client(cls, url: str, proxy_url: Optional[str] = None) -> httpx.AsyncClient:
+        """
+        Pooled httpx client for the domain of `url` (keep-alive connections shared by every coroutine).
+        Must be called from a running event loop; a client is only reused on the loop that created it.
+        """
+        key = (ScraperRegistry.domain_key(url), proxy_url)
+        loop = asyncio.get_running_loop()
+        with cls._lock:
+            entry = cls._async_clients.get(key)
+            if entry is None or entry[0] is not loop:
+                settings = get_settings()
+                install_dns_cache()
+                client = httpx.AsyncClient(
+                    proxy=proxy_url,
+                    headers=ASYNC_CLIENT_HEADERS,
+                    timeout=settings.DEFAULT_TIMEOUT,
+                    follow_redirects=True,
+                    limits=httpx.Limits(
+                        max_connections=settings.HTTP_POOL_MAXSIZE,
+                        max_keepalive_connections=settings.HTTP_POOL_CONNECTIONS
+                    )
+                )
+                entry = cls._async_clients[key] = (loop, client)
+                logger.info(f"[SessionManager] Async client created for {key[0]}.")
+            return entry[1]
+
+    @classmethod
+    def get_session(cls, owner: str, proxy_url: Optional[str] = None) -> "PooledSession":
+        return PooledSession(owner, proxy_url)
+
+    @classmethod
+    def stats(cls) -> Dict[str, dict]:
+        with cls._lock:
+            pools = list(cls._pools.values())
+        return {pool.domain + (" (proxy)" if pool.proxy_url else ""): pool.stats() for pool in pools}
+
+    @classmethod
+    def reset(cls):
+        """Closes every pooled session (used on shutdown and in tests)."""
+        with cls._lock:
+            pools = list(cls._pools.values())
+            cls._pools.clear()
+            async_clients = list(cls._async_clients.values())
+            cls._async_clients.clear()
+        for pool in pools:
+            pool.close()
+        for loop, client in async_clients:
+            # Closed on their own loop; a loop that already stopped took its connections with it
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+
+class PooledSession:
+    """
+    Thread-safe drop-in for the old per-instance session (`self._session`).
+
+    Exposes the small part of the requests.Session API the scrapers use (`get`, `post`, `head`,
+    `headers`, `proxies`). Every call borrows a pooled session for the target domain, so executor
+    threads never share a session concurrently.
+    """
+
+    def __init__(self, owner: str, proxy_url: Optional[str] = None):
+        self.owner = owner
+        self.headers: Dict[str, str] = {}
+        self.proxies: Dict[str, str] = {"http": proxy_url, "https": proxy_url} if proxy_url else {}
+
+    def request(self, method: str, url: str, **kwargs):
+        headers = {**self.headers, **(kwargs.pop("headers", None) or {})}
+        proxy_url = self.proxies.get("https") or self.proxies.get("http")
+
+        domain = ScraperRegistry.domain_key(url)
+
+        with SessionManager.acquire(url, proxy_url) as session:
+            # Reuse clearance solved by any other session/job (or a previous process)
+            ClearanceStore.sync(session, domain, proxy_url)
+            response = getattr(session, method.lower())(url, headers=headers or None, **kwargs)
+            ClearanceStore.capture(session, response, domain, proxy_url)
+            return response
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def head(self, url: str, **kwargs):
+        return self.request("HEAD", url, **kwargs)
+
+    async def arequest(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Non-blocking request over the domain's pooled async client, with the stored clearance applied.
+        Anti-bot challenges are not solved here: callers fall back to the blocking (cloudscraper) path.
+        """
+        headers = {**self.headers, **(kwargs.pop("headers", None) or {})}
+        proxy_url = self.proxies.get("https") or self.proxies.get("http")
+        domain = ScraperRegistry.domain_key(url)
+
+        client = SessionManager.get_async_client(url, proxy_url)
+        clearance = ClearanceStore.get(domain, proxy_url)
+        if clearance:
+            for cookie in clearance["cookies"]:
+                client.cookies.set(
+                    cookie["name"], cookie["value"],
+                    domain=cookie.get("domain") or "", path=cookie.get("path") or "/"
+                )
+            # The clearance is bound to the User-Agent that obtained it
+            if clearance.get("user_agent"):
+                headers.setdefault("User-Agent", clearance["user_agent"])
+        return await client.request(method, url, headers=headers or None, **kwargs)
+
+    async def aget(self, url: str, **kwargs) -> httpx.Response:
+        return await self.arequest("GET", url, **kwargs)
@@ -0,0 +1,94 @@
+import asyncio
+import signal
+import threading
+import time
+from typing import Optional
+
+from src.config import get_settings
+from src.services.task_manager import TaskManager
+from src.utils.logger import logger
+
+
+class ShutdownService:
+    """
+    Graceful shutdown (SIGTERM of a redeploy or scale-down):
+    1. Drain: new jobs are refused (503), queued ones are left for the restart and running ones
+       get SHUTDOWN_DRAIN_SECONDS to finish.
+    2. Interrupt: jobs still running stop between two chapters (JobInterruptedException); their
+       checkpoint (CheckpointStore) is kept, so the next start resumes them.
+    3. The state of finished tasks is persisted, so their downloads survive the restart.
+    """
+    _draining = False
+    _interrupt = threading.Event()
+    _drain_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def is_draining(cls) -> bool:
+        return cls._draining
+
+    @classmethod
+    def is_interrupted(cls) -> bool:
+        """Checked by the scrapers between two chapters."""
+        return cls._interrupt.is_set()
+
+    @classmethod
+    def install_signal_handlers(cls):
+        """
+        Starts draining as soon as SIGTERM/SIGINT arrives. The server then waits for its open requests,
+        background jobs included, before the lifespan shutdown runs: the drain deadline has to start here.
+        The server's own handlers still run.
+        """
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            previous = signal.getsignal(sig)
+            if not callable(previous):
+                continue
+
+            def handler(signum, frame, previous=previous):
+                loop.call_soon_threadsafe(cls.begin_drain)
+                previous(signum, frame)
+
+            try:
+                signal.signal(sig, handler)
+            except ValueError:
+                # Not the main thread (embedded servers, tests): the lifespan shutdown still drains
+                return
+
+    @classmethod
+    def begin_drain(cls) -> asyncio.Task:
+        """Stops accepting jobs and starts the drain deadline. Idempotent; runs on the event loop."""
+        if cls._drain_task is None:
+            cls._draining = True
+            logger.info(f"[Shutdown] 🛑 Draining: no new jobs, {TaskManager.running_count()} running.")
+            cls._drain_task = asyncio.get_running_loop().create_task(cls._drain())
+        return cls._drain_task
+
+    @classmethod
+    async def _drain(cls):
+        settings = get_settings()
+        deadline = time.monotonic() + settings.SHUTDOWN_DRAIN_SECONDS
+        while TaskManager.running_count() and time.monotonic() < deadline:
+            await asyncio.sleep(0.2)
+
+        running = TaskManager.running_count()
+        if not running:
+            logger.info("[Shutdown] All running jobs finished.")
+            return
+        logger.warning(f"[Shutdown] {running} jobs still running: interrupting them (checkpoints kept).")
+        cls._interrupt.set()
+        # Chapters already being fetched complete first
+        deadline = time.monotonic() + settings.SHUTDOWN_INTERRUPT_GRACE
+        while TaskManager.running_count() and time.monotonic() < deadline:
+            await asyncio.sleep(0.2)
+
+    @classmethod
+    async def shutdown(cls):
+        """Lifespan shutdown: finishes the drain, then persists the task state."""
+        await cls.begin_drain()
+        TaskManager.save_state(get_settings().TASK_STATE_PATH)
+
+    @classmethod
+    def reset(cls):
+        cls._draining = False
+        cls._interrupt.clear()
+        cls._drain_task = None
@@ -1,7 +1,9 @@
 import uuid
 import time
 import os
-from typing import Dict, Optional, Any
+import json
+import shutil
+from typing import Dict, List, Optional, Any
 
 from src.utils.logger import logger
 
@@ -18,16 +20,25 @@ class TaskManager:
         return cls._instance
 
     @classmethod
-    async def create_task(cls) -> str:
-        """Creates a new task ID and initializes its state."""
+    async def create_task(cls, url: Optional[str] = None, task_id: Optional[str] = None) -> str:
+        """
+        Creates a new task ID and initializes its state. `url` is recorded for items of a job group;
+        `task_id` restores the id of a job resumed after a restart.
+        """
         # async with cls._lock:
-        task_id = str(uuid.uuid4())
+        task_id = task_id or str(uuid.uuid4())
         cls._tasks[task_id] = {
+            "url": url,
             "status": "pending",
             "progress": 0,
             "created_at": time.time(),
             "file_path": None,
             "filename": None,
+            "artifact_id": None,
+            "artifact_revision": None,
+            "missing_chapters": 0,  # Error placeholders in the artifact (refilled in the background)
+            "volumes": None,
+            "partial": None,  # PartialBook of a running job (finished prefix downloadable early)
             "error": None
         }
         logger.info(f"[TaskManager] Task created: {task_id}")
@@ -44,7 +55,15 @@ class TaskManager:
             cls._tasks[task_id]["status"] = "processing"
 
     @classmethod
-    async def complete_task(cls, task_id: str, file_path: str, filename: str):
+    def set_partial(cls, task_id: str, partial):
+        """Attaches the PartialBook a running job fills (see /books/download?partial=1)."""
+        if task_id in cls._tasks:
+            cls._tasks[task_id]["partial"] = partial
+
+    @classmethod
+    async def complete_task(cls, task_id: str, file_path: str, filename: str, artifact_id: Optional[str] = None,
+                            volumes: Optional[list] = None, artifact_revision: Optional[int] = None,
+                            missing_chapters: int = 0):
         """Marks task as completed and stores key information."""
         # async with cls._lock:
         if task_id in cls._tasks:
@@ -52,8 +71,33 @@ class TaskManager:
             cls._tasks[task_id]["progress"] = 100
             cls._tasks[task_id]["file_path"] = file_path
             cls._tasks[task_id]["filename"] = filename
+            cls._tasks[task_id]["artifact_id"] = artifact_id
+            cls._tasks[task_id]["volumes"] = volumes
+            cls._tasks[task_id]["artifact_revision"] = artifact_revision
+            cls._tasks[task_id]["missing_chapters"] = missing_chapters
+            # The whole book is there now
+            cls._tasks[task_id]["partial"] = None
             logger.info(f"[TaskManager] Task completed: {task_id}")
 
+    @classmethod
+    def mark_upgraded(cls, task_id: str, artifact_path: Optional[str], revision: int, missing_chapters: int):
+        """A refill patched the task's artifact: the file to download becomes the upgraded one."""
+        task = cls._tasks.get(task_id)
+        if not task or task["status"] != "completed":
+            return
+        if task.get("file_path") and artifact_path:
+            try:
+                # Copy-then-rename: a download already streaming keeps the previous file
+                tmp_path = f"{task['file_path']}.tmp"
+                shutil.copyfile(artifact_path, tmp_path)
+                os.replace(tmp_path, task["file_path"])
+            except Exception as e:
+                logger.error(f"[TaskManager] Could not upgrade the file of task {task_id}: {e}")
+                return
+        task["artifact_revision"] = revision
+        task["missing_chapters"] = missing_chapters
+        logger.info(f"[TaskManager] Task {task_id} upgraded to artifact revision {revision}.")
+
     @classmethod
     async def fail_task(cls, task_id: str, error_msg: str):
         """Marks task as failed."""
@@ -63,10 +107,133 @@ class TaskManager:
             cls._tasks[task_id]["error"] = error_msg
             logger.error(f"[TaskManager] Task failed: {task_id} - {error_msg}")
 
+    @classmethod
+    async def interrupt_task(cls, task_id: str):
+        """Marks a job stopped by a server shutdown (it is resumed from its checkpoint after the restart)."""
+        if task_id in cls._tasks:
+            cls._tasks[task_id]["status"] = "interrupted"
+            logger.warning(f"[TaskManager] Task interrupted: {task_id}")
+
+    @classmethod
+    def running_count(cls) -> int:
+        """Jobs being processed right now (job groups are not counted, their items are)."""
+        return sum(
+            1 for task in list(cls._tasks.values())
+            if task["status"] == "processing" and task.get("items") is None
+        )
+
+    @classmethod
+    def save_state(cls, path: str):
+        """
+        Persists the finished tasks (and job groups) so their downloads and SSE results survive a restart.
+        Unfinished jobs are not saved: their checkpoints resume them under the same id.
+        """
+        state = {
+            task_id: {key: value for key, value in task.items() if key != "partial"}
+            for task_id, task in list(cls._tasks.items())
+            if task["status"] in ("completed", "failed") or task.get("items") is not None
+        }
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, path)
+            logger.info(f"[TaskManager] Saved the state of {len(state)} tasks.")
+        except Exception as e:
+            logger.error(f"[TaskManager] Could not save the task state: {e}")
+
+    @classmethod
+    def load_state(cls, path: str):
+        """Restores the tasks saved by the last shutdown (completed ones only while their file still exists)."""
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            os.remove(path)
+        except Exception as e:
+            logger.error(f"[TaskManager] Could not load the task state: {e}")
+            return
+
+        restored = 0
+        for task_id, task in state.items():
+            if task["status"] == "completed" and not (task.get("file_path") and os.path.exists(task["file_path"])):
+                continue
+            cls._tasks.setdefault(task_id, {**task, "partial": None})
+            restored += 1
+        logger.info(f"[TaskManager] Restored {restored} tasks from the last shutdown.")
+
     @classmethod
     def get_task(cls, task_id: str) -> Optional[Dict[str, Any]]:
         return cls._tasks.get(task_id)
 
+    @classmethod
+    async def create_batch(cls, item_task_ids: List[str]) -> str:
+        """Creates a job group whose status and progress are derived from its item tasks."""
+        batch_id = await cls.create_task()
+        cls._tasks[batch_id]["items"] = list(item_task_ids)
+        logger.info(f"[TaskManager] Batch {batch_id} created with {len(item_task_ids)} items.")
+        return batch_id
+
+    @classmethod
+    def get_batch_state(cls, batch_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Aggregate state of a job group: average progress of its items, `completed` once every item
+        has finished (`failed` if none succeeded, `interrupted` if a shutdown stopped the rest).
+        Items already downloaded and cleaned up count as done.
+        """
+        batch = cls._tasks.get(batch_id)
+        if not batch or batch.get("items") is None:
+            return None
+
+        items = [(task_id, cls._tasks.get(task_id)) for task_id in batch["items"]]
+        finished = [task for _, task in items if task is None or task["status"] in ("completed", "failed", "interrupted")]
+        progress = sum(100 if task is None else task["progress"] for _, task in items) // max(len(items), 1)
+
+        if len(finished) == len(items):
+            succeeded = any(task is None or task["status"] == "completed" for task in finished)
+            if succeeded:
+                status = "completed"
+            elif any(task["status"] == "interrupted" for task in finished):
+                status = "interrupted"
+            else:
+                status = "failed"
+            progress = 100
+        elif finished or any(task["status"] == "processing" for _, task in items):
+            status = "processing"
+        else:
+            status = "pending"
+
+        batch["status"] = status
+        batch["progress"] = progress
+        return {"status": status, "progress": progress, "items": items}
+
+    @classmethod
+    async def release_file(cls, task_id: str):
+        """
+        Deletes a downloaded task's file but keeps the task, so its SSE stream can still report the
+        background refill of its artifact (see RefillService); forget_downloaded drops it afterwards.
+        """
+        task = cls._tasks.get(task_id)
+        path = task.get("file_path") if task else None
+        if not path:
+            return
+        task["file_path"] = None
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+                logger.info(f"[TaskManager] Cleaned up file: {path}")
+        except Exception as e:
+            logger.error(f"[TaskManager] Error cleaning up file for task {task_id}: {e}")
+
+    @classmethod
+    def forget_downloaded(cls, task_id: str):
+        """Drops a task kept after its download by release_file."""
+        task = cls._tasks.get(task_id)
+        if task and task["status"] == "completed" and not task.get("file_path"):
+            cls._tasks.pop(task_id, None)
+
     @classmethod
     async def cleanup_task(cls, task_id: str):
         """Removes task from memory and deletes temporary file."""
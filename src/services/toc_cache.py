@@ -0,0 +1,72 @@
+import threading
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from src.config import get_settings
+from src.utils.logger import logger
+
+
+class TocCache:
+    """
+    Short-lived cache of discovered chapter lists, keyed by book URL.
+    Lets the /generate pre-flight check and the job itself share one TOC discovery,
+    and spares repeated jobs on the same book from re-reading the index.
+    """
+    # { "host/path": { "total": int, "links": [str] | None, "expires_at": float } }
+    _entries: Dict[str, dict] = {}
+    _lock = threading.Lock()
+    # { "host/path": Lock } held while a chapter list is being discovered
+    _discoveries: Dict[str, threading.Lock] = {}
+
+    @staticmethod
+    def _key(url: str) -> str:
+        parsed = urlparse(url.strip().lower())
+        host = (parsed.hostname or "").removeprefix("www.")
+        return f"{host}{parsed.path.rstrip('/')}"
+
+    @classmethod
+    def get(cls, url: str) -> Optional[dict]:
+        with cls._lock:
+            entry = cls._entries.get(cls._key(url))
+            if not entry:
+                return None
+            if entry["expires_at"] <= time.time():
+                cls._entries.pop(cls._key(url), None)
+                return None
+            return entry
+
+    @classmethod
+    def get_total(cls, url: str) -> Optional[int]:
+        entry = cls.get(url)
+        return entry["total"] if entry else None
+
+    @classmethod
+    def set(cls, url: str, total: int, links: Optional[List[str]] = None):
+        ttl = get_settings().TOC_CACHE_TTL
+        if ttl <= 0:
+            return
+        with cls._lock:
+            cls._entries[cls._key(url)] = {
+                "total": total,
+                "links": links,
+                "expires_at": time.time() + ttl
+            }
+        logger.debug(f"[TocCache] Cached {total} chapters for {url}")
+
+    @classmethod
+    def discovery_lock(cls, url: str) -> threading.Lock:
+        """Lock serializing the discoveries of one book, so concurrent callers share the first result."""
+        with cls._lock:
+            return cls._discoveries.setdefault(cls._key(url), threading.Lock())
+
+    @classmethod
+    def invalidate(cls, url: str):
+        with cls._lock:
+            cls._entries.pop(cls._key(url), None)
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._entries.clear()
+            cls._discoveries.clear()
@@ -0,0 +1,134 @@
+import concurrent.futures
+import io
+import re
+import threading
+import zipfile
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from src.config import get_settings
+from src.schemas.novel_schema import BookMetadata
+from src.services.epub_builder import EpubBuilder
+from src.utils.logger import logger
+
+
+@dataclass
+class VolumePlan:
+    number: int
+    title: str
+    first_chapter: int  # chapter number in the book
+    urls: List[str]
+
+
+class VolumeService:
+    """
+    Splits large jobs into multi-volume EPUBs: fixed-size volumes, or the site's own volumes
+    (see BaseScraper.get_volumes). Volumes are downloaded and built concurrently (VOLUME_WORKERS)
+    and delivered as a zip bundle whose entries can also be downloaded one by one.
+    """
+    # Temp file prefix of the bundles (lets the stale file cleanup recognise them)
+    BUNDLE_PREFIX = "novel_volumes_"
+
+    @staticmethod
+    def plan(chapter_urls: List[str], start: int, volume_size: Optional[int] = None,
+             site_volumes: Optional[List[Tuple[str, int]]] = None) -> List[VolumePlan]:
+        """
+        Cuts the job's chapters (book chapters `start`..) into volumes. Site volumes are clipped to the
+        requested range; without them (or a size) the job is a single volume.
+        """
+        end = start + len(chapter_urls) - 1
+        bounds = []
+        if site_volumes:
+            first = 1
+            for title, count in site_volumes:
+                last = first + count - 1
+                if last >= start and first <= end:
+                    bounds.append((title, max(first, start), min(last, end)))
+                first = last + 1
+        else:
+            size = volume_size or len(chapter_urls)
+            for first in range(start, end + 1, size):
+                bounds.append((None, first, min(first + size - 1, end)))
+
+        return [
+            VolumePlan(
+                number=number,
+                title=title or f"Volume {number}",
+                first_chapter=first,
+                urls=chapter_urls[first - start:last - start + 1]
+            )
+            for number, (title, first, last) in enumerate(bounds, start=1)
+        ]
+
+    @staticmethod
+    def filename(title: str, suffix: str) -> str:
+        return re.sub(r'[^\w\s.-]', '', f"{title}{suffix}").strip() or f"novel{suffix}"
+
+    @classmethod
+    def scrape_volumes(cls, scraper, start: int, volume_size: Optional[int] = None, use_site_volumes: bool = False,
+                       progress_callback=None) -> Tuple[BookMetadata, List[dict], bytes]:
+        """
+        Runs a sharded job. Returns the book metadata, the volume descriptions
+        ({number, title, filename, first_chapter, chapters}) and the zip bundle of their EPUBs.
+        """
+        settings = get_settings()
+        metadata, chapter_urls, cover_bytes = scraper.load_book(progress_callback)
+
+        site_volumes = scraper.get_volumes() if use_site_volumes else None
+        if use_site_volumes and not site_volumes and not volume_size:
+            logger.warning(f"[VolumeService] No site volumes for {metadata.book_title}: building a single volume.")
+        plans = cls.plan(chapter_urls, start, volume_size, site_volumes)
+        logger.info(f"[VolumeService] '{metadata.book_title}': {len(chapter_urls)} chapters in {len(plans)} volumes.")
+
+        # Overall progress = chapters downloaded over every volume (15% -> 95%, like a single job)
+        progress = {plan.number: 0.0 for plan in plans}
+        progress_lock = threading.Lock()
+
+        def volume_progress(plan: VolumePlan):
+            def callback(pct: int):
+                with progress_lock:
+                    progress[plan.number] = (pct - 15) / 80 * len(plan.urls)
+                    done = sum(progress.values())
+                if progress_callback:
+                    progress_callback(15 + int(done / max(len(chapter_urls), 1) * 80))
+            return callback
+
+        def build(plan: VolumePlan) -> Tuple[VolumePlan, bytes]:
+            volume_metadata = metadata.model_copy(update={"book_title": f"{metadata.book_title} - {plan.title}"})
+            novel = scraper.download_novel(
+                volume_metadata, plan.urls, cover_bytes, volume_progress(plan), first_index=plan.first_chapter
+            )
+            return plan, EpubBuilder.create_epub(novel).getvalue()
+
+        results = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, settings.VOLUME_WORKERS)) as executor:
+            futures = [executor.submit(build, plan) for plan in plans]
+            try:
+                for future in concurrent.futures.as_completed(futures):
+                    results.append(future.result())
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+        results.sort(key=lambda result: result[0].number)
+
+        # EPUBs are already compressed: store them as-is in the bundle
+        volumes = []
+        bundle = io.BytesIO()
+        with zipfile.ZipFile(bundle, "w", compression=zipfile.ZIP_STORED) as archive:
+            for plan, epub_bytes in results:
+                filename = cls.filename(f"{metadata.book_title} - {plan.number:02d} - {plan.title}", ".epub")
+                archive.writestr(filename, epub_bytes)
+                volumes.append({
+                    "number": plan.number,
+                    "title": plan.title,
+                    "filename": filename,
+                    "first_chapter": plan.first_chapter,
+                    "chapters": len(plan.urls)
+                })
+        return metadata, volumes, bundle.getvalue()
+
+    @staticmethod
+    def read_volume(bundle_path: str, filename: str) -> bytes:
+        with zipfile.ZipFile(bundle_path) as archive:
+            return archive.read(filename)
@@ -0,0 +1,87 @@
+import asyncio
+import concurrent.futures
+import time
+from typing import Dict
+
+from src.config import get_settings
+from src.services.registry import ScraperRegistry
+from src.services.session_manager import SessionManager
+from src.utils.logger import logger
+
+
+class WarmupService:
+    """
+    Pre-creates and validates pooled sessions for every registered domain (session creation, DNS,
+    TLS and anti-bot challenge), so the first job after a deploy or cold start runs at steady-state speed.
+    """
+    # { domain: { "status": "pending" | "ready" | "failed", "latency_ms": float, "checked_at": float, "error": str } }
+    _readiness: Dict[str, dict] = {}
+
+    @staticmethod
+    def _domain_url(domain: str) -> str:
+        service_cls = ScraperRegistry.get_service(domain)
+        base_url = getattr(service_cls, "BASE_URL", None)
+        return base_url if base_url and domain in base_url else f"https://{domain}"
+
+    @classmethod
+    def warm_domain(cls, domain: str, method: str = "GET") -> dict:
+        """
+        Fills the domain's session pool and sends one request per pooled session (concurrently,
+        so every session opens its own keep-alive connection). Blocking: run it in a thread.
+        """
+        settings = get_settings()
+        url = cls._domain_url(domain)
+        pool = SessionManager.get_pool(domain, settings.PROXY_URL)
+        cls._readiness.setdefault(domain, {"status": "pending"})
+
+        start = time.perf_counter()
+        try:
+            pool.prefill()
+            session = SessionManager.get_session("WarmupService", settings.PROXY_URL)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=pool.size) as executor:
+                responses = list(executor.map(
+                    lambda _: session.request(method, url, timeout=settings.DEFAULT_TIMEOUT),
+                    range(pool.size)
+                ))
+
+            blocked = [r.status_code for r in responses if r.status_code in (403, 429) or r.status_code >= 500]
+            if blocked:
+                raise RuntimeError(f"Validation request returned HTTP {blocked[0]}")
+
+            state = {"status": "ready", "sessions": pool.size}
+        except Exception as e:
+            logger.warning(f"[Warmup] {domain} warm-up failed: {e}")
+            state = {"status": "failed", "error": str(e)}
+
+        state["latency_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        state["checked_at"] = time.time()
+        cls._readiness[domain] = state
+        return state
+
+    @classmethod
+    async def warm_up_all(cls):
+        """Non-blocking startup phase: warms every registered domain concurrently in worker threads."""
+        domains = ScraperRegistry.get_registered_domains()
+        for domain in domains:
+            cls._readiness[domain] = {"status": "pending"}
+
+        logger.info(f"[Warmup] 🔥 Warming up sessions for {len(domains)} domains...")
+        results = await asyncio.gather(
+            *(asyncio.to_thread(cls.warm_domain, domain) for domain in domains),
+            return_exceptions=True
+        )
+        ready = sum(1 for r in results if isinstance(r, dict) and r["status"] == "ready")
+        logger.info(f"[Warmup] Warm-up complete: {ready}/{len(domains)} domains ready.")
+
+    @classmethod
+    def keep_alive(cls):
+        """
+        Scheduled job: light HEAD request on every pooled session so idle keep-alive connections and
+        clearance cookies do not expire between jobs.
+        """
+        for domain in ScraperRegistry.get_registered_domains():
+            cls.warm_domain(domain, method="HEAD")
+
+    @classmethod
+    def readiness(cls) -> Dict[str, dict]:
+        return dict(cls._readiness)
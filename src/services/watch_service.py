@@ -0,0 +1,238 @@
+import json
+import os
+import random
+import threading
+import time
+from typing import Dict, List, Optional
+
+from src.config import get_settings
+from src.services.chapter_cache import ChapterCache
+from src.services.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from src.services.rate_limiter import DomainRateLimiter
+from src.services.registry import ScraperRegistry
+from src.services.toc_cache import TocCache
+from src.utils.logger import logger
+
+
+class WatchService:
+    """
+    New-chapter watcher. Clients subscribe to novels; a scheduled job polls each one's book page
+    with a conditional request (see SpecScraper.poll_chapters), spread over time with jitter and
+    per-domain spacing, records the chapters that appeared and prefetches them into the ChapterCache.
+
+    Subscriptions are persisted (WATCH_STORE_PATH) so restarts keep the known chapter lists.
+    """
+    # { "host/path": { "url", "known": [str], "new": [str], "validators": {}, "next_check_at",
+    #                  "last_checked_at", "subscribed_at", "last_error" } }
+    _entries: Dict[str, dict] = {}
+    _loaded = False
+    _lock = threading.RLock()
+
+    @classmethod
+    def _path(cls) -> str:
+        return get_settings().WATCH_STORE_PATH
+
+    @classmethod
+    def _ensure_loaded(cls):
+        # Caller must hold the lock
+        if cls._loaded:
+            return
+        cls._loaded = True
+        path = cls._path()
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                cls._entries = json.load(f)
+            logger.info(f"[WatchService] Loaded {len(cls._entries)} watched novels.")
+        except Exception as e:
+            logger.warning(f"[WatchService] Could not load {path}: {e}")
+            cls._entries = {}
+
+    @classmethod
+    def _save(cls):
+        # Caller must hold the lock. Write-then-rename so a crash never leaves a truncated file.
+        path = cls._path()
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(cls._entries, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"[WatchService] Failed to persist subscriptions: {e}")
+
+    @staticmethod
+    def _key(url: str) -> str:
+        # Same normalization as the chapter-list cache (scheme and www. do not matter)
+        return TocCache._key(url)
+
+    @staticmethod
+    def _next_check(base: Optional[float] = None) -> float:
+        # ±20% jitter: novels subscribed together do not keep getting polled together
+        interval = get_settings().WATCH_INTERVAL_SECONDS if base is None else base
+        return time.time() + interval * random.uniform(0.8, 1.2)
+
+    @staticmethod
+    def _summary(entry: dict) -> dict:
+        return {
+            "url": entry["url"],
+            "known_chapters": len(entry["known"]),
+            "new_chapters": list(entry["new"]),
+            "prefetched": sum(1 for url in entry["new"] if ChapterCache.contains(url)),
+            "last_checked_at": entry["last_checked_at"],
+            "next_check_at": entry["next_check_at"],
+            "last_error": entry.get("last_error")
+        }
+
+    @classmethod
+    def subscribe(cls, url: str) -> dict:
+        key = cls._key(url)
+        with cls._lock:
+            cls._ensure_loaded()
+            entry = cls._entries.get(key)
+            if entry is None:
+                entry = cls._entries[key] = {
+                    "url": url,
+                    "known": [],
+                    "new": [],
+                    "validators": {},
+                    # First (baseline) poll soon, spread over the next ticks
+                    "next_check_at": cls._next_check(get_settings().WATCH_TICK_SECONDS),
+                    "last_checked_at": None,
+                    "subscribed_at": time.time(),
+                    "last_error": None
+                }
+                cls._save()
+                logger.info(f"[WatchService] 👀 Watching {url}")
+            return cls._summary(entry)
+
+    @classmethod
+    def unsubscribe(cls, url: str) -> bool:
+        with cls._lock:
+            cls._ensure_loaded()
+            removed = cls._entries.pop(cls._key(url), None) is not None
+            if removed:
+                cls._save()
+            return removed
+
+    @classmethod
+    def get(cls, url: str) -> Optional[dict]:
+        with cls._lock:
+            cls._ensure_loaded()
+            entry = cls._entries.get(cls._key(url))
+            return cls._summary(entry) if entry else None
+
+    @classmethod
+    def list_all(cls) -> List[dict]:
+        with cls._lock:
+            cls._ensure_loaded()
+            return [cls._summary(entry) for entry in cls._entries.values()]
+
+    @classmethod
+    def mark_seen(cls, url: str):
+        """The reader got the new chapters (a job on this novel completed)."""
+        with cls._lock:
+            cls._ensure_loaded()
+            entry = cls._entries.get(cls._key(url))
+            if entry and entry["new"]:
+                entry["new"] = []
+                cls._save()
+
+    @classmethod
+    def poll_due(cls):
+        """
+        Scheduled job: polls the subscriptions that are due. A domain already polled less than
+        WATCH_DOMAIN_INTERVAL ago is left for a later tick.
+        """
+        settings = get_settings()
+        now = time.time()
+        with cls._lock:
+            cls._ensure_loaded()
+            due = sorted(
+                (dict(entry) for entry in cls._entries.values() if entry["next_check_at"] <= now),
+                key=lambda entry: entry["next_check_at"]
+            )
+
+        for entry in due:
+            url = entry["url"]
+            if CircuitBreakerRegistry.get(url).state == CircuitBreaker.OPEN:
+                continue
+            if not DomainRateLimiter.try_acquire(ScraperRegistry.domain_key(url), settings.WATCH_DOMAIN_INTERVAL):
+                continue
+            cls.poll(url)
+
+    @classmethod
+    def poll(cls, url: str) -> Optional[List[str]]:
+        """Polls one subscription. Returns the chapters that appeared (None if nothing changed)."""
+        settings = get_settings()
+        key = cls._key(url)
+        with cls._lock:
+            cls._ensure_loaded()
+            entry = cls._entries.get(key)
+            if entry is None:
+                return None
+            validators = dict(entry["validators"])
+            known = list(entry["known"])
+
+        service_class = ScraperRegistry.get_service(url)
+        if not service_class:
+            return None
+
+        appeared = None
+        error = None
+        try:
+            scraper = service_class().get_book_instance(url, settings.MAX_CHAPTERS_LIMIT, 1)
+            links, validators = scraper.poll_chapters(validators, settings.WATCH_DOMAIN_INTERVAL)
+            if links is not None and known:
+                known_set = set(known)
+                appeared = [link for link in links if link not in known_set]
+            if links is not None:
+                known = links
+        except Exception as e:
+            logger.warning(f"[WatchService] Poll failed for {url}: {e!r}")
+            error = str(e)
+
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                return None
+            entry["known"] = known
+            entry["validators"] = validators
+            entry["last_checked_at"] = time.time()
+            entry["next_check_at"] = cls._next_check()
+            entry["last_error"] = error
+            if appeared:
+                entry["new"] = list(dict.fromkeys(entry["new"] + appeared))
+            cls._save()
+
+        if appeared:
+            logger.info(f"[WatchService] 🆕 {len(appeared)} new chapters for {url}")
+            cls._prefetch(scraper, appeared)
+        return appeared
+
+    @classmethod
+    def _prefetch(cls, scraper, urls: List[str]):
+        """Downloads new chapters into the ChapterCache, spaced by the per-domain limit."""
+        settings = get_settings()
+        domain = ScraperRegistry.domain_key(urls[0])
+        for url in urls[:settings.WATCH_PREFETCH_MAX]:
+            if ChapterCache.contains(url):
+                continue
+            if CircuitBreakerRegistry.get(url).state == CircuitBreaker.OPEN:
+                break
+            DomainRateLimiter.acquire(domain, settings.WATCH_DOMAIN_INTERVAL)
+            try:
+                chapter = scraper.get_chapter_content(url)
+            except Exception as e:
+                logger.warning(f"[WatchService] Prefetch failed for {url}: {e!r}")
+                continue
+            if chapter and chapter.content:
+                ChapterCache.set(url, chapter)
+
+    @classmethod
+    def reset(cls):
+        """Forgets the in-memory state (the file is re-read on next access)."""
+        with cls._lock:
+            cls._entries = {}
+            cls._loaded = False
@@ -1,10 +1,140 @@
+import logging
 import os
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, PropertyMock
+
+from src.services.circuit_breaker import CircuitBreakerRegistry
+from src.services.session_manager import SessionManager
+from src.services.clearance_store import ClearanceStore
+from src.services.metrics_service import MetricsService
+from src.services.toc_cache import TocCache
+from src.services.mirror_router import MirrorRouter
+from src.services.artifact_store import ArtifactStore
+from src.services.refill_service import RefillService
+from src.services.checkpoint_store import CheckpointStore
+from src.services.shutdown_service import ShutdownService
+from src.services.watch_service import WatchService
+from src.services.chapter_cache import ChapterCache
+from src.services.rate_limiter import DomainRateLimiter
+from src.services.search_cache import SearchCache
+from src.services.search_service import SearchService
+from src.services.catalog_index import CatalogIndex
+from src.services.details_service import NovelDetailsService
+from src.services.reader_service import ReaderService
+from src.utils.logger import logger
+from sse_starlette.sse import AppStatus
 
 # Define paths to fixtures
 FIXTURES_DIR = os.path.dirname(os.path.abspath(__file__)) + "/fixtures"
 
+@pytest.fixture(autouse=True, scope="session")
+def no_log_file():
+    """Test runs log to the console only, never to logs/app.log."""
+    file_handlers = [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
+    for handler in file_handlers:
+        logger.removeHandler(handler)
+        handler.close()
+    yield
+
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers():
+    """Circuit breakers are process-wide; isolate each test from the others' failures."""
+    CircuitBreakerRegistry.reset()
+    yield
+    CircuitBreakerRegistry.reset()
+
+@pytest.fixture(autouse=True)
+def reset_session_pools():
+    """Session pools are process-wide; make sure each test gets sessions from its own (mocked) factory."""
+    SessionManager.reset()
+    yield
+    SessionManager.reset()
+
+@pytest.fixture(autouse=True)
+def isolated_clearance_store(tmp_path, mocker):
+    """Never read or write the real clearance file during tests."""
+    mocker.patch.object(ClearanceStore, "_path", return_value=str(tmp_path / "clearance.json"))
+    ClearanceStore.reset()
+    yield
+    ClearanceStore.reset()
+
+@pytest.fixture(autouse=True)
+def isolated_toc_metrics(tmp_path, mocker):
+    """Scrape benchmarks and TOC metrics go to temporary files; TOC stats start empty."""
+    mocker.patch.object(MetricsService, "FILE_PATH", str(tmp_path / "benchmarks.jsonl"))
+    mocker.patch.object(MetricsService, "TOC_FILE_PATH", str(tmp_path / "toc_metrics.jsonl"))
+    MetricsService.reset_toc_stats()
+    yield
+    MetricsService.reset_toc_stats()
+
+@pytest.fixture(autouse=True)
+def reset_toc_cache():
+    """Discovered chapter lists and novel details are cached process-wide."""
+    TocCache.reset()
+    NovelDetailsService.reset()
+    yield
+    TocCache.reset()
+    NovelDetailsService.reset()
+
+@pytest.fixture(autouse=True)
+def reset_mirror_router():
+    """Mirror health and latency are tracked process-wide."""
+    MirrorRouter.reset()
+    yield
+    MirrorRouter.reset()
+
+@pytest.fixture(autouse=True)
+def isolated_artifact_store(tmp_path, mocker):
+    """Generated artifacts and job checkpoints go to a temporary directory; queued refills and drains never leak between tests."""
+    mocker.patch.object(ArtifactStore, "_dir", return_value=str(tmp_path / "artifacts"))
+    mocker.patch.object(CheckpointStore, "_dir", return_value=str(tmp_path / "checkpoints"))
+    mocker.patch.object(RefillService, "_path", return_value=str(tmp_path / "refills.json"))
+    RefillService.reset()
+    CheckpointStore.reset()
+    ShutdownService.reset()
+    yield
+    RefillService.reset()
+    CheckpointStore.reset()
+    ShutdownService.reset()
+
+@pytest.fixture(autouse=True)
+def isolated_watcher(tmp_path, mocker):
+    """Watched novels, reading sessions, prefetched chapters and domain spacing never leak between tests."""
+    mocker.patch.object(WatchService, "_path", return_value=str(tmp_path / "watches.json"))
+    WatchService.reset()
+    ReaderService.reset()
+    ChapterCache.reset()
+    DomainRateLimiter.reset()
+    yield
+    WatchService.reset()
+    ReaderService.reset()
+    ChapterCache.reset()
+    DomainRateLimiter.reset()
+
+@pytest.fixture(autouse=True)
+def reset_search_cache():
+    """Cached and in-flight searches are process-wide."""
+    SearchCache.reset()
+    SearchService.reset()
+    yield
+    SearchCache.reset()
+    SearchService.reset()
+
+@pytest.fixture(autouse=True)
+def isolated_catalog(tmp_path, mocker):
+    """The catalog index is persisted and process-wide."""
+    mocker.patch.object(CatalogIndex, "_path", return_value=str(tmp_path / "catalog.json"))
+    CatalogIndex.reset()
+    yield
+    CatalogIndex.reset()
+
+@pytest.fixture(autouse=True)
+def reset_sse_exit_event():
+    """sse_starlette binds its shutdown event to the first loop that streams; each test client runs its own loop."""
+    AppStatus.should_exit_event = None
+    yield
+    AppStatus.should_exit_event = None
+
 @pytest.fixture
 def royalroad_toc_html():
     with open(f"{FIXTURES_DIR}/royalroad_toc.html", "r", encoding="utf-8") as f:
@@ -53,6 +183,10 @@ def mock_cloudscraper(mocker):
     mock_scraper = MagicMock()
     mock_response = MagicMock()
     mock_response.status_code = 200
+    # Scrapers parse the raw bytes: keep .content in sync with the .text set by each test
+    type(mock_response).content = PropertyMock(
+        side_effect=lambda: mock_response.text.encode("utf-8") if isinstance(mock_response.text, str) else b""
+    )
     mock_scraper.get.return_value = mock_response
     
     # Patch the create_scraper function where it is used
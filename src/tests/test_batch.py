@@ -0,0 +1,87 @@
+import asyncio
+import threading
+import time
+from collections import Counter
+from unittest.mock import MagicMock
+
+from fastapi.testclient import TestClient
+
+from src.main import app, verify_internal_token
+from src.routes.book_routes import task_payload
+from src.schemas.novel_schema import BookMetadata, Chapter, Novel
+from src.services.task_manager import TaskManager
+
+client = TestClient(app)
+app.dependency_overrides[verify_internal_token] = lambda: {"sub": "test", "action": "generate-epub"}
+
+ROYALROAD = "https://www.royalroad.com/fiction/{}/novel"
+PANDA = "https://novelfire.net/book/novel-{}"
+
+
+def test_batch_runs_one_job_per_domain_at_a_time(mocker):
+    running = Counter()
+    peak = Counter()
+    lock = threading.Lock()
+
+    def get_book_instance(url, qty, start):
+        domain = "royalroad" if "royalroad" in url else "novelfire"
+
+        def scrape_novel(**kwargs):
+            with lock:
+                running[domain] += 1
+                peak[domain] = max(peak[domain], running[domain])
+            time.sleep(0.05)
+            with lock:
+                running[domain] -= 1
+            return Novel(
+                metadata=BookMetadata(book_title=url, book_author="A", book_description="D"),
+                chapters=[Chapter(index=1, title="Ch1", content="<p>Text</p>")]
+            )
+
+        scraper = MagicMock()
+        scraper.scrape_novel.side_effect = scrape_novel
+        return scraper
+
+    service_cls = MagicMock()
+    service_cls.return_value.get_book_instance.side_effect = get_book_instance
+    mocker.patch("src.services.registry.ScraperRegistry.get_service", return_value=service_cls)
+
+    urls = [ROYALROAD.format(1), ROYALROAD.format(2), PANDA.format(1), ROYALROAD.format(3)]
+    response = client.post("/books/generate/batch", json={"items": [{"url": url} for url in urls]})
+
+    assert response.status_code == 202
+    data = response.json()
+    assert len(data["task_ids"]) == 4
+
+    # Background tasks have run once the test client returns
+    batch = TaskManager.get_batch_state(data["batch_id"])
+    assert batch["status"] == "completed" and batch["progress"] == 100
+    assert [task_payload(task_id, task)["url"] for task_id, task in batch["items"]] == urls
+    assert peak == {"royalroad": 1, "novelfire": 1}
+
+
+def test_batch_aggregates_item_progress():
+    async def scenario():
+        first = await TaskManager.create_task(url=ROYALROAD.format(1))
+        second = await TaskManager.create_task(url=PANDA.format(1))
+        batch_id = await TaskManager.create_batch([first, second])
+
+        await TaskManager.update_progress(first, 50)
+        state = TaskManager.get_batch_state(batch_id)
+        assert (state["status"], state["progress"]) == ("processing", 25)
+
+        await TaskManager.fail_task(first, "boom")
+        await TaskManager.complete_task(second, "/tmp/x.epub", "x.epub")
+        state = TaskManager.get_batch_state(batch_id)
+        assert state["status"] == "completed"
+        assert [task_payload(task_id, task)["status"] for task_id, task in state["items"]] == ["failed", "completed"]
+
+    asyncio.run(scenario())
+
+
+def test_batch_rejects_unsupported_items():
+    items = [{"url": ROYALROAD.format(1)}, {"url": "https://unknown-site.com/novel"}]
+    response = client.post("/books/generate/batch", json={"items": items})
+
+    assert response.status_code == 400
+    assert "unknown-site.com" in response.json()["detail"]
@@ -0,0 +1,88 @@
+from unittest.mock import MagicMock
+
+from fastapi.testclient import TestClient
+
+from src.main import app
+from src.services.catalog_index import CatalogIndex
+
+client = TestClient(app)
+
+TITLES = {
+    1: ["Shadow Slave", "The Shadow Monarch", "Mother of Learning"],
+    2: ["Super Supportive", "Beware of Chicken"],
+}
+
+
+def _listing(titles):
+    items = "".join(
+        f'<div class="fiction-list-item"><img src="/covers/{n}.jpg">'
+        f'<h2 class="fiction-title"><a href="/fiction/{n}/{t.lower().replace(" ", "-")}">{t}</a></h2>'
+        f'<div class="stats"><i class="fa fa-list"></i><span>{n * 10} Chapters</span></div></div>'
+        for n, t in enumerate(titles, start=1)
+    )
+    return f"<html><body>{items}</body></html>"
+
+
+def _crawl_royal(mock_cloudscraper, mocker):
+    mock_scraper, _ = mock_cloudscraper
+    mocker.patch("src.services.rate_limiter.time.sleep")
+
+    def get(url, params=None, **kwargs):
+        response = MagicMock(status_code=200)
+        response.text = _listing(TITLES.get(params["page"], []))
+        return response
+
+    mock_scraper.get.side_effect = get
+    return CatalogIndex.crawl("royal")
+
+
+def test_crawl_walks_listing_pages_and_persists(mock_cloudscraper, mocker):
+    assert _crawl_royal(mock_cloudscraper, mocker) == 5
+    assert mock_cloudscraper[0].get.call_count == 3  # two pages, then the empty one
+
+    # A restart reloads the crawled catalog from disk
+    CatalogIndex.reset()
+    assert CatalogIndex.stats()["royal"]["titles"] == 5
+    assert CatalogIndex.suggest("mother")[0]["chapters_count"] == "30 Chapters"
+
+
+def test_suggest_ranks_prefixes_and_tolerates_typos(mock_cloudscraper, mocker):
+    _crawl_royal(mock_cloudscraper, mocker)
+
+    assert [r["title"] for r in CatalogIndex.suggest("sha")] == ["Shadow Slave", "The Shadow Monarch"]
+    assert CatalogIndex.suggest("shadow mon")[0]["title"] == "The Shadow Monarch"
+    assert CatalogIndex.suggest("chikcen")[0]["title"] == "Beware of Chicken"
+    assert CatalogIndex.suggest("zzz") == []
+
+
+def test_suggest_route(mock_cloudscraper, mocker):
+    _crawl_royal(mock_cloudscraper, mocker)
+
+    data = client.get("/search/suggest", params={"query": "super", "source": "royal"}).json()
+    assert data["results_count"] == 1
+    assert data["results"][0]["source"] == "royal"
+    assert data["results"][0]["url"] == "https://www.royalroad.com/fiction/1/super-supportive"
+    assert client.get("/search/suggest", params={"query": "super", "source": "panda"}).json()["results"] == []
+    assert client.get("/search/suggest", params={"query": "super", "source": "nope"}).status_code == 400
+
+
+def test_sources_without_listing_are_skipped(mock_cloudscraper):
+    assert CatalogIndex.crawl("panda") is None
+    assert mock_cloudscraper[0].get.call_count == 0
+
+
+def test_interrupted_crawl_keeps_the_previous_catalog(mock_cloudscraper, mocker):
+    _crawl_royal(mock_cloudscraper, mocker)
+    crawled_at = CatalogIndex.stats()["royal"]["crawled_at"]
+
+    def flaky(url, params=None, **kwargs):
+        if params["page"] == 2:
+            raise ConnectionError("listing unavailable")
+        response = MagicMock(status_code=200)
+        response.text = _listing(TITLES[1])
+        return response
+
+    mock_cloudscraper[0].get.side_effect = flaky
+    assert CatalogIndex.crawl("royal") == 5
+    assert CatalogIndex.stats()["royal"]["crawled_at"] == crawled_at
+    assert CatalogIndex.suggest("beware")[0]["title"] == "Beware of Chicken"
@@ -0,0 +1,75 @@
+import asyncio
+import json
+import os
+
+from src.classes.royalroad_book import MyRoyalRoadBook
+from src.routes.book_routes import resume_interrupted_jobs
+from src.schemas.novel_schema import BookMetadata, Chapter, ChapterContent
+from src.services.checkpoint_store import CheckpointStore
+from src.services.royalroad_service import RoyalRoadService  # noqa: F401 (registers royalroad.com)
+from src.services.task_manager import TaskManager
+from src.utils.constants import EPUB_STRINGS
+
+BOOK_URL = "https://www.royalroad.com/fiction/12345/test-novel"
+LINKS = [f"{BOOK_URL}/chapter/{n}" for n in range(1, 4)]
+TASK_ID = "0b5c8a36-6a3e-4c8e-9f1e-2d7a4b9c1e00"
+
+
+def _chapter(n, content=None):
+    return Chapter(index=n, title=f"Title {n}", content=content or f"<p>Text {n}</p>", url=LINKS[n - 1])
+
+
+def test_checkpoint_keeps_finished_chapters_only():
+    CheckpointStore.begin(TASK_ID, BOOK_URL, 3, 1)
+    CheckpointStore.add(TASK_ID, _chapter(1))
+    CheckpointStore.add(TASK_ID, _chapter(1))
+    CheckpointStore.add(TASK_ID, _chapter(2, EPUB_STRINGS["error_content"]))
+    # A job killed mid-write leaves a torn last line
+    with open(os.path.join(CheckpointStore._dir(), TASK_ID, "chapters.jsonl"), "a") as f:
+        f.write('{"url": "' + LINKS[2])
+
+    assert [job["task_id"] for job in CheckpointStore.pending()] == [TASK_ID]
+    chapters = CheckpointStore.load_chapters(TASK_ID)
+    assert list(chapters) == [LINKS[0]]
+    assert chapters[LINKS[0]].content == "<p>Text 1</p>"
+
+    CheckpointStore.discard(TASK_ID)
+    assert CheckpointStore.pending() == []
+
+
+def test_interrupted_job_resumes_without_refetching(mocker):
+    CheckpointStore.begin(TASK_ID, BOOK_URL, 3, 1)
+    CheckpointStore.add(TASK_ID, _chapter(1))
+    CheckpointStore.add(TASK_ID, _chapter(2))
+    CheckpointStore.reset()  # a new process
+
+    fetched = []
+    mocker.patch.object(MyRoyalRoadBook, "get_book_metadata", return_value=BookMetadata(
+        book_title="Test Novel", book_author="Author", book_description="Desc"
+    ))
+    mocker.patch.object(MyRoyalRoadBook, "get_chapters_link", return_value=LINKS)
+    mocker.patch.object(MyRoyalRoadBook, "get_chapter_content", side_effect=lambda url: fetched.append(url) or
+                        ChapterContent(title="Title 3", content="<p>Text 3</p>"))
+
+    asyncio.run(resume_interrupted_jobs())
+
+    assert fetched == [LINKS[2]]
+    task = TaskManager.get_task(TASK_ID)
+    assert task["status"] == "completed"
+    assert CheckpointStore.pending() == []
+    asyncio.run(TaskManager.cleanup_task(TASK_ID))
+
+
+def test_job_interrupted_too_often_is_dropped(mocker):
+    mocker.patch("src.services.checkpoint_store.get_settings").return_value.configure_mock(
+        CHECKPOINT_DIR=CheckpointStore._dir(), CHECKPOINT_MAX_AGE_HOURS=24, CHECKPOINT_MAX_RESUMES=2
+    )
+    CheckpointStore.begin(TASK_ID, BOOK_URL, 3, 1)
+    for _ in range(2):
+        job, = CheckpointStore.pending()
+        CheckpointStore.mark_resumed(job)
+
+    with open(os.path.join(CheckpointStore._dir(), TASK_ID, "job.json")) as f:
+        assert json.load(f)["resumes"] == 2
+    assert CheckpointStore.pending() == []
+    assert not os.path.exists(os.path.join(CheckpointStore._dir(), TASK_ID))
@@ -0,0 +1,113 @@
+import threading
+import time
+
+import pytest
+import requests
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+
+from src.main import app, verify_internal_token
+from src.services.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from src.utils.exceptions import CircuitOpenException
+from src.tests.test_resilience import MockScraper
+
+app.dependency_overrides[verify_internal_token] = lambda: {"sub": "test", "action": "generate-epub"}
+
+
+def _http_error(status_code: int) -> requests.exceptions.HTTPError:
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.exceptions.HTTPError(response=response)
+
+
+def test_breaker_opens_after_threshold_and_half_opens():
+    breaker = CircuitBreaker("example.com", failure_threshold=2, recovery_timeout=60)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+    # Simulate the recovery timeout elapsing
+    breaker._opened_at -= 61
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()       # the probe
+    assert not breaker.allow_request()   # everyone else waits for the probe
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_probe_failure_reopens():
+    breaker = CircuitBreaker("example.com", failure_threshold=5, recovery_timeout=60)
+    for _ in range(5):
+        breaker.record_failure()
+    breaker._opened_at -= 61
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_workers_wait_for_the_half_open_probe():
+    breaker = CircuitBreaker("example.com", failure_threshold=1, recovery_timeout=60)
+    breaker.record_failure()
+    breaker._opened_at -= 61
+    assert breaker.allow_request()  # the probe is in flight
+
+    outcome = []
+    waiter = threading.Thread(target=lambda: outcome.append(breaker.wait_for_request(timeout=5)))
+    waiter.start()
+    time.sleep(0.05)
+    assert outcome == []  # not refused: waiting for the probe
+    breaker.record_success()
+    waiter.join(timeout=2)
+    assert outcome == [True]
+
+    # A failed probe re-opens the circuit: waiters give up at once
+    breaker.record_failure()
+    breaker._opened_at -= 61
+    assert breaker.allow_request()
+    waiter = threading.Thread(target=lambda: outcome.append(breaker.wait_for_request(timeout=5)))
+    waiter.start()
+    time.sleep(0.05)
+    breaker.record_failure()
+    waiter.join(timeout=2)
+    assert outcome == [True, False]
+
+
+def test_fetch_fails_fast_once_circuit_opens():
+    """
+    Repeated 403s must open the shared circuit and stop retrying (no cool-down sleeps).
+    """
+    scraper = MockScraper("http://test.com", 1, 1)
+    scraper._breaker.failure_threshold = 2
+
+    with patch.object(scraper, 'get_chapter_content', side_effect=_http_error(403)) as mock_get:
+        with patch('time.sleep') as mock_sleep:
+            with pytest.raises(CircuitOpenException):
+                scraper._fetch_with_retry("http://test.com/1", max_retries=3)
+
+            assert mock_get.call_count == 2
+            assert mock_sleep.call_count == 1
+
+            # A second job on the same domain does not even reach the network
+            other = MockScraper("http://test.com", 1, 1)
+            with pytest.raises(CircuitOpenException):
+                other._fetch_with_retry("http://test.com/2", max_retries=3)
+            assert mock_get.call_count == 2
+
+
+def test_generate_rejected_while_circuit_open():
+    breaker = CircuitBreakerRegistry.get("https://www.royalroad.com/fiction/1")
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+    client = TestClient(app)
+    response = client.post("/books/generate", params={"url": "https://www.royalroad.com/fiction/1"})
+    assert response.status_code == 503
+    assert "Retry-After" in response.headers
+
+    health = client.get("/").json()
+    assert health["circuits"]["royalroad.com"]["state"] == "open"
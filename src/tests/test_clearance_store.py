@@ -0,0 +1,68 @@
+import time
+import requests
+from unittest.mock import MagicMock
+
+from src.services.clearance_store import ClearanceStore
+
+
+UA = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0"
+
+
+def _solved_session(value: str = "token-1") -> requests.Session:
+    session = requests.Session()
+    session.cookies.set("cf_clearance", value, domain=".centralnovel.com", path="/", expires=int(time.time()) + 3600)
+    return session
+
+
+def _response(user_agent: str = UA):
+    response = MagicMock()
+    response.request.headers = {"User-Agent": user_agent}
+    return response
+
+
+def test_capture_persists_and_new_sessions_reuse_it():
+    ClearanceStore.capture(_solved_session(), _response(), "centralnovel.com")
+    assert ClearanceStore.has_clearance("centralnovel.com")
+
+    # Simulate a restart: state is re-read from disk
+    ClearanceStore.reset()
+    fresh = requests.Session()
+    assert ClearanceStore.sync(fresh, "centralnovel.com")
+    assert fresh.cookies.get("cf_clearance") == "token-1"
+    assert fresh.headers["User-Agent"] == UA
+
+    # Already up to date: nothing to apply
+    assert not ClearanceStore.sync(fresh, "centralnovel.com")
+
+
+def test_clearance_is_scoped_per_proxy():
+    ClearanceStore.capture(_solved_session(), _response(), "centralnovel.com", proxy_url="http://proxy:1")
+    assert ClearanceStore.has_clearance("centralnovel.com", "http://proxy:1")
+    assert not ClearanceStore.has_clearance("centralnovel.com")
+
+
+def test_expired_and_invalidated_clearance_is_ignored(mocker):
+    ClearanceStore.capture(_solved_session(), _response(), "centralnovel.com")
+    ClearanceStore.invalidate("centralnovel.com")
+    assert not ClearanceStore.has_clearance("centralnovel.com")
+
+    ClearanceStore.mark_warm("centralnovel.com", UA)
+    assert ClearanceStore.get_user_agent("centralnovel.com") == UA
+    mocker.patch("time.time", return_value=time.time() + 10 ** 6)
+    assert not ClearanceStore.has_clearance("centralnovel.com")
+
+
+def test_central_search_skips_warm_up_with_stored_clearance(mock_cloudscraper, mocker):
+    from src.services.centralnovel_service import CentralNovelService
+
+    mock_scraper, mock_response = mock_cloudscraper
+    mock_response.text = "<html></html>"
+    ClearanceStore.mark_warm("centralnovel.com", UA)
+
+    sleep = mocker.patch("time.sleep")
+    CentralNovelService().search("shadow")
+
+    # Only the search request: no homepage warm-up and no human-like pause
+    assert mock_scraper.get.call_count == 1
+    assert mock_scraper.get.call_args.kwargs["headers"]["User-Agent"] == UA
+    assert not sleep.called
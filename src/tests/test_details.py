@@ -0,0 +1,47 @@
+import requests
+from fastapi.testclient import TestClient
+
+from src.main import app, verify_internal_token
+from src.services.royalroad_service import RoyalRoadService  # noqa: F401 (registers royalroad.com)
+
+client = TestClient(app)
+app.dependency_overrides[verify_internal_token] = lambda: {"sub": "test", "action": "generate-epub"}
+
+BOOK_URL = "https://www.royalroad.com/fiction/12345/test-novel"
+
+
+def test_details_reads_one_page_then_serves_from_cache(mock_cloudscraper, royalroad_toc_html):
+    mock_scraper, mock_response = mock_cloudscraper
+    mock_response.text = royalroad_toc_html
+
+    first = client.get("/books/details", params={"url": BOOK_URL}).json()
+    second = client.get("/books/details", params={"url": BOOK_URL}).json()
+
+    assert first["book_title"] == "The Great Test Novel"
+    assert first["total_chapters"] == 3
+    assert (first["cached"], second["cached"]) == (False, True)
+    # Metadata and chapter count come from the same book page, fetched once
+    assert mock_scraper.get.call_count == 1
+
+
+def test_details_of_missing_novel_is_404(mock_cloudscraper):
+    _, mock_response = mock_cloudscraper
+    mock_response.status_code = 404
+    mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=mock_response)
+
+    assert client.get("/books/details", params={"url": BOOK_URL}).status_code == 404
+    assert client.get("/books/details", params={"url": "https://example.com/novel"}).status_code == 400
+
+
+def test_batch_details_report_each_item(mock_cloudscraper, royalroad_toc_html):
+    mock_scraper, mock_response = mock_cloudscraper
+    mock_response.text = royalroad_toc_html
+
+    response = client.post("/books/details/batch", json={
+        "urls": [BOOK_URL, "https://example.com/novel", BOOK_URL]
+    })
+
+    items = response.json()["items"]
+    assert [item["status"] for item in items] == ["ok", "unsupported", "ok"]
+    assert items[0]["details"]["total_chapters"] == 3
+    assert mock_scraper.get.call_count == 1  # the duplicate is looked up once
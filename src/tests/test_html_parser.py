@@ -0,0 +1,38 @@
+import pytest
+
+from src.classes.centralnovel_book import MyCentralNovelBook
+from src.classes.novelsbr_book import MyNovelsBrBook
+from src.classes.pandanovel_book import MyPandaNovelBook
+from src.classes.royalroad_book import MyRoyalRoadBook
+from src.utils.html_parser import RegionFilter, make_soup
+
+
+@pytest.mark.parametrize("scraper_class, fixture_name, selector", [
+    (MyRoyalRoadBook, "royalroad_chap_html", "div.chapter-inner.chapter-content"),
+    (MyPandaNovelBook, "pandanovel_chap_html", "div#content"),
+    (MyNovelsBrBook, "novelsbr_chap_html", "div.chapter-content"),
+    (MyCentralNovelBook, "centralnovel_chap_html", "div.epcontent.entry-content"),
+])
+def test_region_parse_matches_full_parse(scraper_class, fixture_name, selector, request):
+    """Restricting the parse to the declared regions must not change the extracted chapter body."""
+    html = request.getfixturevalue(fixture_name).encode("utf-8")
+
+    full = make_soup(html, encoding="utf-8", backend="html.parser").select_one(selector)
+    restricted = make_soup(html, scraper_class.spec.chapter.regions, encoding="utf-8").select_one(selector)
+
+    assert restricted is not None
+    assert restricted.decode_contents().strip() == full.decode_contents().strip()
+
+
+def test_region_parse_skips_everything_else():
+    html = b"<html><body><nav>menu</nav><div id='content' class='a b'><p>text</p></div><footer>x</footer></body></html>"
+    soup = make_soup(html, ["div#content.a"], encoding="utf-8")
+
+    assert soup.find("nav") is None
+    assert soup.find("footer") is None
+    assert soup.select_one("div#content p").get_text() == "text"
+
+
+def test_unsupported_region_selector_is_rejected():
+    with pytest.raises(ValueError):
+        RegionFilter(["div > p"])
@@ -0,0 +1,75 @@
+import zipfile
+
+from fastapi.testclient import TestClient
+
+from src.classes.royalroad_book import MyRoyalRoadBook
+from src.main import app, verify_internal_token
+from src.schemas.novel_schema import BookMetadata, ChapterContent
+from src.services.artifact_store import ArtifactStore
+from src.services.epub_builder import EpubBuilder
+from src.utils.constants import EPUB_STRINGS
+
+client = TestClient(app)
+app.dependency_overrides[verify_internal_token] = lambda: {"sub": "test", "action": "generate-epub"}
+
+BOOK_URL = "https://www.royalroad.com/fiction/12345/test-novel"
+
+
+def _scraper(mocker, links, failing=()):
+    """RoyalRoad scraper whose book has `links`; records every downloaded chapter."""
+    book = MyRoyalRoadBook(BOOK_URL, len(links), 1)
+    fetched = []
+
+    def content(url):
+        fetched.append(url)
+        if url in failing:
+            raise ValueError("broken chapter")
+        return ChapterContent(title=f"Title {url[-1]}", content=f"<p>Text of {url}</p>")
+
+    mocker.patch.object(book, "get_book_metadata", return_value=BookMetadata(
+        book_title="Test Novel", book_author="Author", book_description="Desc"
+    ))
+    mocker.patch.object(book, "get_chapters_link", return_value=links)
+    mocker.patch.object(book, "get_chapter_content", side_effect=content)
+    mocker.patch("src.classes.base_book.time.sleep")
+    return book, fetched
+
+
+def _build(novel, artifact_id=None):
+    return ArtifactStore.save(EpubBuilder.create_epub(novel).getvalue(), novel, BOOK_URL, 1, artifact_id)
+
+
+def test_update_downloads_only_new_and_failed_chapters(mocker):
+    links = [f"{BOOK_URL}/chapter/{n}" for n in range(1, 4)]
+    book, _ = _scraper(mocker, links, failing=(links[1],))
+    artifact_id = _build(book.scrape_novel())
+
+    # Two chapters were published since; chapter 2 failed the first time
+    new_links = links + [f"{BOOK_URL}/chapter/4", f"{BOOK_URL}/chapter/5"]
+    book, fetched = _scraper(mocker, new_links)
+    novel = book.scrape_novel(reuse=ArtifactStore.load_chapters(artifact_id))
+    assert _build(novel, artifact_id) == artifact_id
+
+    assert sorted(fetched) == [links[1], new_links[3], new_links[4]]
+    assert [c.index for c in novel.chapters] == [1, 2, 3, 4, 5]
+
+    with zipfile.ZipFile(ArtifactStore.get_path(artifact_id)) as archive:
+        chapter_one = next(n for n in archive.namelist() if n.endswith("chap_1.xhtml"))
+        assert f"Text of {links[0]}" in archive.read(chapter_one).decode("utf-8")
+    manifest = ArtifactStore.get_manifest(artifact_id)
+    assert [c["url"] for c in manifest["chapters"]] == new_links
+    assert not any(c["error"] for c in manifest["chapters"])
+
+
+def test_error_placeholders_are_not_reused(mocker):
+    links = [f"{BOOK_URL}/chapter/1"]
+    book, _ = _scraper(mocker, links, failing=(links[0],))
+    novel = book.scrape_novel()
+    assert novel.chapters[0].content == EPUB_STRINGS["error_content"]
+
+    assert ArtifactStore.load_chapters(_build(novel)) == {}
+
+
+def test_update_unknown_artifact_returns_404():
+    assert client.post("/books/update", params={"artifact_id": "0" * 32}).status_code == 404
+    assert client.post("/books/update", params={"artifact_id": "../../etc/passwd"}).status_code == 404
@@ -0,0 +1,106 @@
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.classes.lightnovel_theme_book import LightNovelThemeBook
+from src.classes.spec_scraper import SpecScraper
+from src.services.lightnovel_theme_service import LightNovelThemeService
+from src.services.registry import ScraperRegistry
+
+BOOK_URL = "https://theme-novels.example/series/test-novel/"
+
+AJAX_FRAGMENT = """
+<ul>
+    <li class="wp-manga-chapter"><a href="https://theme-novels.example/test-novel/chapter-2/">Chapter 2</a></li>
+    <li class="wp-manga-chapter"><a href="https://theme-novels.example/test-novel/chapter-1/">Chapter 1</a></li>
+</ul>
+"""
+
+BOOK_PAGE = """
+<div class="eplister"><ul>
+    <li><a href="/test-novel/chapter-3/">Chapter 3</a></li>
+    <li><a href="/test-novel/chapter-2/">Chapter 2</a></li>
+    <li><a href="/test-novel/chapter-1/">Chapter 1</a></li>
+</ul></div>
+"""
+
+
+@pytest.fixture(autouse=True)
+def reset_endpoint_support():
+    SpecScraper._endpoint_failures.clear()
+    yield
+    SpecScraper._endpoint_failures.clear()
+
+
+def _response(status_code: int, text: str = ""):
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = text.encode("utf-8")
+    return response
+
+
+def test_ajax_chapter_list_is_preferred(mock_cloudscraper):
+    mock_scraper, _ = mock_cloudscraper
+    mock_scraper.post.return_value = _response(200, AJAX_FRAGMENT)
+
+    links = LightNovelThemeBook(BOOK_URL, 5, 1).get_chapters_link()
+
+    # Oldest first, and the book page was never downloaded
+    assert links == [
+        "https://theme-novels.example/test-novel/chapter-1/",
+        "https://theme-novels.example/test-novel/chapter-2/"
+    ]
+    assert mock_scraper.post.call_args.args[0] == "https://theme-novels.example/series/test-novel/ajax/chapters/"
+    assert not mock_scraper.get.called
+
+
+def test_falls_back_to_book_page_without_ajax_endpoint(mock_cloudscraper):
+    mock_scraper, mock_response = mock_cloudscraper
+    mock_scraper.post.return_value = _response(404)
+    mock_response.text = BOOK_PAGE
+
+    links = LightNovelThemeBook(BOOK_URL, 2, 1).get_chapters_link()
+
+    # The eplister is newest first: chapters come back in reading order
+    assert links == [
+        "https://theme-novels.example/test-novel/chapter-1/",
+        "https://theme-novels.example/test-novel/chapter-2/"
+    ]
+
+
+
+def test_missing_endpoint_is_skipped_after_repeated_failures(mock_cloudscraper, mocker):
+    mock_scraper, mock_response = mock_cloudscraper
+    mock_scraper.post.return_value = _response(404)
+    mock_response.text = BOOK_PAGE
+
+    books = [f"https://theme-novels.example/series/novel-{n}/" for n in range(5)]
+
+    # One miss (a single odd book) does not disable the endpoint for the host
+    LightNovelThemeBook(books[0], 2, 1).get_chapters_link()
+    LightNovelThemeBook(books[1], 2, 1).get_chapters_link()
+    assert mock_scraper.post.call_count == 2
+
+    # Repeated misses do, for TOC_ENDPOINT_RETRY_SECONDS only
+    LightNovelThemeBook(books[2], 2, 1).get_chapters_link()
+    LightNovelThemeBook(books[3], 2, 1).get_chapters_link()
+    assert mock_scraper.post.call_count == 3
+
+    now = time.time()
+    mocker.patch("src.classes.spec_scraper.time.time", return_value=now + 10 ** 6)
+    mock_scraper.post.return_value = _response(200, AJAX_FRAGMENT)
+    assert len(LightNovelThemeBook(books[4], 2, 1).get_chapters_link()) == 2
+    assert mock_scraper.post.call_count == 4
+
+
+def test_new_theme_site_registers_in_one_line(mock_cloudscraper):
+    service_cls = ScraperRegistry.register("theme-novels.example")(
+        LightNovelThemeService.for_site("https://theme-novels.example")
+    )
+    try:
+        assert ScraperRegistry.get_service(BOOK_URL) is service_cls
+        assert service_cls.DOMAIN == "theme-novels.example"
+        assert isinstance(service_cls().get_book_instance(BOOK_URL, 1, 1), LightNovelThemeBook)
+    finally:
+        ScraperRegistry._registry.pop("theme-novels.example", None)
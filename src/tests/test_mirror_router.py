@@ -0,0 +1,97 @@
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from src.classes.pandanovel_book import MyPandaNovelBook
+from src.services.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from src.services.mirror_router import MirrorRouter
+from src.services.registry import ScraperRegistry
+from src.utils.exceptions import CircuitOpenException
+
+MIRRORS = ("mirror-a.example", "mirror-b.example")
+
+
+@pytest.fixture
+def mirror_group():
+    ScraperRegistry.register("mirror-a.example", mirrors=MIRRORS)(type("MirrorService", (), {}))
+    yield
+    for host in MIRRORS:
+        ScraperRegistry._registry.pop(host, None)
+        ScraperRegistry._mirrors.pop(host, None)
+        ScraperRegistry._mirror_keys.pop(host, None)
+
+
+def test_route_only_uses_registered_mirrors(mirror_group):
+    assert MirrorRouter.route("https://other.example/x") == "https://other.example/x"
+    routed = {MirrorRouter.route("https://mirror-a.example/book/x/chapter-1") for _ in range(50)}
+    assert routed <= {f"https://{host}/book/x/chapter-1" for host in MIRRORS}
+
+
+def test_failing_mirror_is_taken_out_of_rotation(mirror_group, mocker):
+    for _ in range(2):  # MIRROR_FAILURE_THRESHOLD
+        MirrorRouter.record_failure("https://mirror-a.example/")
+
+    assert {MirrorRouter.pick(MIRRORS) for _ in range(20)} == {"mirror-b.example"}
+    assert MirrorRouter.snapshot()["mirror-a.example"]["healthy"] is False
+
+    # Back in rotation once the recovery time has passed
+    clock = mocker.patch("src.services.mirror_router.time.time")
+    clock.return_value = 10 ** 10
+    assert "mirror-a.example" in {MirrorRouter.pick(MIRRORS) for _ in range(50)}
+
+
+def test_faster_mirror_gets_more_traffic(mirror_group):
+    MirrorRouter.record_success("https://mirror-a.example/", 0.05)
+    MirrorRouter.record_success("https://mirror-b.example/", 1.0)
+
+    picks = [MirrorRouter.pick(MIRRORS) for _ in range(400)]
+    assert picks.count("mirror-a.example") > picks.count("mirror-b.example") * 3
+
+
+def test_chapter_fetch_fails_over_to_healthy_mirror(mock_cloudscraper, mocker):
+    mocker.patch.object(ScraperRegistry, "_mirrors", {
+        host: ("novelfire.noveljk.org", "novelfire.net") for host in ("novelfire.noveljk.org", "novelfire.net")
+    })
+    mock_scraper, _ = mock_cloudscraper
+
+    def fake_get(url, **kwargs):
+        if "noveljk" in url:
+            raise requests.exceptions.ConnectionError("mirror down")
+        return MagicMock(status_code=200, content=b"<div id='content'>ok</div>")
+
+    mock_scraper.get.side_effect = fake_get
+    book = MyPandaNovelBook("https://novelfire.net/book/panda-test-novel", 1, 1)
+    url = "https://novelfire.noveljk.org/book/panda-test-novel/chapter-1"
+
+    # The failing mirror is dropped after MIRROR_FAILURE_THRESHOLD errors; retries land on the healthy one
+    errors = 0
+    for _ in range(20):
+        try:
+            assert book.fetch_chapter(url) == b"<div id='content'>ok</div>"
+        except requests.exceptions.ConnectionError:
+            errors += 1
+    assert errors <= 2
+    assert MirrorRouter.snapshot()["novelfire.net"]["requests"] >= 18
+
+
+def test_mirror_hosts_share_one_domain_key_and_breaker(mock_cloudscraper, mocker):
+    from src.services.pandanovel_service import PandaNovelService
+
+    chapter_url = "https://novelfire.noveljk.org/book/panda-test-novel/chapter-1"
+    assert ScraperRegistry.get_service(chapter_url) is PandaNovelService
+    assert ScraperRegistry.domain_key(chapter_url) == ScraperRegistry.domain_key("https://novelfire.net/book/x") == "novelfire.net"
+
+    mock_scraper, _ = mock_cloudscraper
+    banned = MagicMock(status_code=403)
+    banned.raise_for_status.side_effect = requests.exceptions.HTTPError(response=banned)
+    mock_scraper.get.return_value = banned
+    mocker.patch("src.classes.base_book.time.sleep")
+    breaker = CircuitBreakerRegistry.get(chapter_url)
+    breaker.failure_threshold = 1
+
+    # The book page lives on another host: the ban is still recorded where the reader and watcher look
+    book = MyPandaNovelBook("https://pandanovel.co/book/panda-test-novel", 1, 1)
+    with pytest.raises(CircuitOpenException):
+        book._fetch_with_retry(chapter_url)
+    assert CircuitBreakerRegistry.get("https://novelfire.net/book/panda-test-novel/chapter-1").state == CircuitBreaker.OPEN
@@ -0,0 +1,68 @@
+import pytest
+
+from src.classes.base_book import BaseScraper
+from src.classes.royalroad_book import MyRoyalRoadBook
+from src.config import get_settings
+from src.services.parse_pool import ParsePool
+from src.tests.test_resilience import MockScraper
+
+
+@pytest.fixture
+def pool_settings(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "PARSE_PROCESS_WORKERS", 1)
+    monkeypatch.setattr(settings, "PARSE_POOL_MIN_CHAPTERS", 2)
+    monkeypatch.setattr(settings, "PARSE_BATCH_SIZE", 2)
+    yield settings
+    ParsePool.shutdown()
+
+
+def test_should_use_pool_only_for_large_jobs(pool_settings, monkeypatch):
+    assert not ParsePool.should_use(1)
+    assert ParsePool.should_use(2)
+
+    monkeypatch.setattr(pool_settings, "PARSE_PROCESS_WORKERS", 0)
+    assert not ParsePool.should_use(1000)
+
+
+def test_split_parse_matches_in_process_result(mock_cloudscraper, royalroad_chap_html):
+    mock_scraper, mock_response = mock_cloudscraper
+    mock_response.text = royalroad_chap_html
+
+    book = MyRoyalRoadBook("https://royalroad.com/fiction/123", 10, 1)
+    assert book.supports_split_parsing()
+
+    combined = book.get_chapter_content("https://dummy.url")
+    split = MyRoyalRoadBook.parse_chapter(book.fetch_chapter("https://dummy.url"), "https://dummy.url")
+    assert split == combined
+
+
+def test_download_chapters_parses_in_process_pool(pool_settings, mock_cloudscraper, royalroad_chap_html):
+    """
+    Raw pages are fetched in threads and parsed in batches by a worker process.
+    """
+    mock_scraper, mock_response = mock_cloudscraper
+    mock_response.text = royalroad_chap_html
+
+    book = MyRoyalRoadBook("https://royalroad.com/fiction/123", 3, 1)
+    urls = [f"https://www.royalroad.com/fiction/123/chapter/{i}" for i in range(3)]
+
+    results = book._download_chapters(urls)
+
+    assert len(results) == 3
+    assert all(r.title == "Chapter 1: The Beginning" for r in results)
+    assert all("Once upon a time" in r.content for r in results)
+
+
+def test_adapters_must_implement_chapter_content():
+    class IncompleteBook(BaseScraper):
+        def get_book_metadata(self):
+            pass
+
+        def get_chapters_link(self):
+            return []
+
+    with pytest.raises(TypeError):
+        IncompleteBook("https://example.com/book", 1, 1)
+    assert not MockScraper.supports_split_parsing()
+    assert MyRoyalRoadBook.supports_split_parsing()
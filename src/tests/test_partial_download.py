@@ -0,0 +1,84 @@
+import asyncio
+import io
+import zipfile
+
+from fastapi.testclient import TestClient
+
+from src.main import app, verify_internal_token
+from src.routes.book_routes import task_payload
+from src.schemas.novel_schema import BookMetadata, Chapter
+from src.services.epub_builder import EpubBuilder
+from src.services.partial_book import PartialBook
+from src.services.task_manager import TaskManager
+
+client = TestClient(app)
+app.dependency_overrides[verify_internal_token] = lambda: {"sub": "test", "action": "generate-epub"}
+
+
+def _chapter(n):
+    return Chapter(index=n, title=f"Chapter {n}", content=f"<p>Text {n}</p>", url=f"https://x.test/c/{n}")
+
+
+def _partial(total=5):
+    partial = PartialBook()
+    partial.start(BookMetadata(book_title="Test Novel", book_author="A", book_description="D"), None, total)
+    return partial
+
+
+def _chapter_files(epub_bytes):
+    with zipfile.ZipFile(io.BytesIO(epub_bytes)) as archive:
+        return sorted(name for name in archive.namelist() if name.startswith("EPUB/chap_"))
+
+
+def test_only_the_contiguous_prefix_is_ready():
+    partial = _partial()
+    partial.add(1, _chapter(2))
+    assert partial.ready == 0 and partial.build() is None
+
+    partial.add(0, _chapter(1))
+    partial.add(3, _chapter(4))
+    assert partial.ready == 2
+
+    chapters, epub_bytes = partial.build()
+    assert chapters == 2
+    assert len(_chapter_files(epub_bytes)) == 2
+    # The same prefix is built once
+    assert partial.build()[1] is epub_bytes
+
+
+def test_chapters_are_only_rendered_when_a_partial_is_built(mocker):
+    render = mocker.spy(EpubBuilder, "render_chapter")
+    partial = _partial()
+    chapters = [_chapter(n) for n in (1, 2)]
+    for position, chapter in enumerate(chapters):
+        partial.add(position, chapter)
+
+    # The job's own chapters are referenced, not copied
+    assert not render.called
+    assert partial._chapters[0] is chapters[0]
+
+    partial.build()
+    assert render.call_count == 2
+
+
+def test_partial_download_of_a_running_task():
+    task_id = asyncio.run(TaskManager.create_task())
+    TaskManager._tasks[task_id]["status"] = "processing"
+    assert client.get(f"/books/download/{task_id}", params={"partial": 1}).status_code == 404
+
+    partial = _partial()
+    TaskManager.set_partial(task_id, partial)
+    for position in range(3):
+        partial.add(position, _chapter(position + 1))
+
+    response = client.get(f"/books/download/{task_id}", params={"partial": 1})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/epub+zip"
+    assert "1-3.epub" in response.headers["content-disposition"]
+    assert len(_chapter_files(response.content)) == 3
+
+    payload = task_payload(task_id, TaskManager.get_task(task_id))
+    assert payload["partial_chapters"] == 3
+    assert payload["partial_download_url"] == f"/books/download/{task_id}?partial=1"
+    # Without the flag a running task is still not downloadable
+    assert client.get(f"/books/download/{task_id}").status_code == 404
@@ -0,0 +1,76 @@
+import time
+from unittest.mock import MagicMock
+
+from fastapi.testclient import TestClient
+
+from src.main import app, verify_internal_token
+from src.services.chapter_cache import ChapterCache
+from src.services.reader_service import ReaderService
+from src.services.royalroad_service import RoyalRoadService  # noqa: F401 (registers royalroad.com)
+
+client = TestClient(app)
+app.dependency_overrides[verify_internal_token] = lambda: {"sub": "test", "action": "generate-epub"}
+
+BOOK_URL = "https://www.royalroad.com/fiction/12345/test-novel"
+CHAPTER_URL = "https://www.royalroad.com/fiction/12345/chapter/{}"
+
+
+def _site(mocker, mock_cloudscraper, toc_html, chap_html):
+    """Serves the book page and its chapters; returns the list of requested URLs."""
+    mock_scraper, _ = mock_cloudscraper
+    mocker.patch("src.services.rate_limiter.time.sleep")
+    requested = []
+
+    def get(url, **kwargs):
+        requested.append(url)
+        response = MagicMock(status_code=200)
+        response.text = chap_html if "/chapter/" in url else toc_html
+        response.content = response.text.encode("utf-8")
+        return response
+
+    mock_scraper.get.side_effect = get
+    return requested
+
+
+def _wait_cached(url, timeout=2.0):
+    deadline = time.time() + timeout
+    while not ChapterCache.contains(url) and time.time() < deadline:
+        time.sleep(0.01)
+    return ChapterCache.contains(url)
+
+
+def test_read_then_next_chapter_comes_from_read_ahead(mocker, mock_cloudscraper, royalroad_toc_html, royalroad_chap_html):
+    requested = _site(mocker, mock_cloudscraper, royalroad_toc_html, royalroad_chap_html)
+
+    first = client.get("/books/chapters", params={"url": BOOK_URL, "n": 1}).json()
+    assert first["chapter_url"] == CHAPTER_URL.format(1)
+    assert first["content"] and first["cached"] is False
+    assert first["total_chapters"] == 3
+    assert first["prefetching"] == 1
+    assert _wait_cached(CHAPTER_URL.format(2))
+
+    second = client.get("/books/chapters", params={"url": BOOK_URL, "n": 2}).json()
+    assert second["cached"] is True
+    # One book page (then the TocCache), chapter 1 read, chapter 2 read ahead
+    assert requested.count(BOOK_URL) == 1
+    assert requested.count(CHAPTER_URL.format(2)) == 1
+
+
+def test_chapter_past_the_end_is_404(mocker, mock_cloudscraper, royalroad_toc_html, royalroad_chap_html):
+    _site(mocker, mock_cloudscraper, royalroad_toc_html, royalroad_chap_html)
+
+    assert client.get("/books/chapters", params={"url": BOOK_URL, "n": 4}).status_code == 404
+
+
+def test_read_ahead_depth_follows_reading_pace(mocker):
+    settings = mocker.patch("src.services.reader_service.get_settings").return_value
+    settings.READER_PREFETCH_MIN, settings.READER_PREFETCH_MAX = 1, 10
+    settings.READER_PREFETCH_HORIZON, settings.READER_SESSION_GAP = 120, 1800
+
+    assert ReaderService.read_ahead_depth(BOOK_URL, 1, now=0) == 1
+    # Skimming: a chapter every 20s -> 6 chapters cover the next two minutes
+    assert ReaderService.read_ahead_depth(BOOK_URL, 2, now=20) == 6
+    assert ReaderService.read_ahead_depth(BOOK_URL, 3, now=40) == 6
+    # Slower reading lowers it, a jump resets it
+    assert ReaderService.read_ahead_depth(BOOK_URL, 4, now=340) == 1
+    assert ReaderService.read_ahead_depth(BOOK_URL, 30, now=350) == 1
@@ -0,0 +1,156 @@
+import asyncio
+import io
+import zipfile
+
+from fastapi.testclient import TestClient
+
+from src.classes.royalroad_book import MyRoyalRoadBook
+from src.main import app, verify_internal_token
+from src.schemas.novel_schema import BookMetadata, ChapterContent
+from src.services.artifact_store import ArtifactStore
+from src.services.epub_builder import EpubBuilder
+from src.services.refill_service import RefillService
+from src.services.royalroad_service import RoyalRoadService  # noqa: F401 (registers royalroad.com)
+from src.services.task_manager import TaskManager
+
+client = TestClient(app)
+app.dependency_overrides[verify_internal_token] = lambda: {"sub": "test", "action": "generate-epub"}
+
+BOOK_URL = "https://www.royalroad.com/fiction/12345/test-novel"
+LINKS = [f"{BOOK_URL}/chapter/{n}" for n in range(1, 4)]
+
+
+def _artifact_with_failed_chapter(mocker):
+    """Artifact of a 3-chapter book whose chapter 2 could not be downloaded."""
+    book = MyRoyalRoadBook(BOOK_URL, len(LINKS), 1)
+
+    def content(url):
+        if url == LINKS[1]:
+            raise ValueError("proxy down")
+        return ChapterContent(title=f"Title {url[-1]}", content=f"<p>Text of {url}</p>")
+
+    mocker.patch.object(book, "get_book_metadata", return_value=BookMetadata(
+        book_title="Test Novel", book_author="Author", book_description="Desc"
+    ))
+    mocker.patch.object(book, "get_chapters_link", return_value=LINKS)
+    mocker.patch.object(book, "get_chapter_content", side_effect=content)
+    mocker.patch("src.classes.base_book.time.sleep")
+    mocker.patch("src.services.rate_limiter.time.sleep")
+    novel = book.scrape_novel()
+    return ArtifactStore.save(EpubBuilder.create_epub(novel).getvalue(), novel, BOOK_URL, 1)
+
+
+def _read(artifact_id, suffix):
+    with zipfile.ZipFile(ArtifactStore.get_path(artifact_id)) as archive:
+        name = next(n for n in archive.namelist() if n.endswith(suffix))
+        return archive.read(name).decode("utf-8"), archive.namelist()
+
+
+def test_refill_patches_only_the_failed_chapter(mocker):
+    artifact_id = _artifact_with_failed_chapter(mocker)
+    assert [entry["index"] for entry in ArtifactStore.failed_chapters(artifact_id)] == [2]
+    untouched, names = _read(artifact_id, "chap_1.xhtml")
+
+    fetched = []
+    mocker.patch.object(MyRoyalRoadBook, "get_chapter_content", side_effect=lambda url: fetched.append(url) or
+                        ChapterContent(title="The Real Title", content="<p>Recovered text</p>"))
+    assert RefillService.refill(artifact_id, BOOK_URL) == 0
+
+    assert fetched == [LINKS[1]]
+    assert "Recovered text" in _read(artifact_id, "chap_2.xhtml")[0]
+    assert _read(artifact_id, "chap_1.xhtml") == (untouched, names)
+    assert "The Real Title" in _read(artifact_id, "nav.xhtml")[0]
+
+    manifest = ArtifactStore.get_manifest(artifact_id)
+    assert manifest["revision"] == 2
+    assert not ArtifactStore.failed_chapters(artifact_id)
+    # The patched artifact is reused as a whole by the next update
+    assert len(ArtifactStore.load_chapters(artifact_id)) == 3
+
+
+def test_failed_refill_backs_off_then_gives_up(mocker):
+    artifact_id = _artifact_with_failed_chapter(mocker)
+    mocker.patch.object(MyRoyalRoadBook, "get_chapter_content", side_effect=ValueError("still down"))
+    RefillService.schedule(artifact_id, BOOK_URL)
+    next_at = RefillService._queue[artifact_id]["next_at"]
+
+    # Not due yet
+    RefillService.run_due(now=next_at - 1)
+    assert RefillService._queue[artifact_id]["attempts"] == 0
+
+    RefillService.run_due(now=next_at)
+    entry = RefillService._queue[artifact_id]
+    assert entry["attempts"] == 1 and entry["next_at"] > next_at
+
+    for _ in range(10):
+        RefillService.run_due(now=entry["next_at"] + 10 ** 6)
+    assert not RefillService.is_pending(artifact_id)
+    assert ArtifactStore.get_manifest(artifact_id)["revision"] == 1
+
+
+def test_refill_upgrades_the_task_file(mocker, tmp_path):
+    artifact_id = _artifact_with_failed_chapter(mocker)
+    task_file = tmp_path / "task.epub"
+    task_file.write_bytes(open(ArtifactStore.get_path(artifact_id), "rb").read())
+    task_id = asyncio.run(TaskManager.create_task())
+    asyncio.run(TaskManager.complete_task(
+        task_id, str(task_file), "Test Novel.epub", artifact_id, artifact_revision=1, missing_chapters=1
+    ))
+
+    mocker.patch.object(MyRoyalRoadBook, "get_chapter_content",
+                        return_value=ChapterContent(title="Title 2", content="<p>Recovered text</p>"))
+    RefillService.refill(artifact_id, BOOK_URL, task_id)
+
+    task = TaskManager.get_task(task_id)
+    assert task["artifact_revision"] == 2 and task["missing_chapters"] == 0
+    assert task_file.read_bytes() == open(ArtifactStore.get_path(artifact_id), "rb").read()
+
+
+def test_downloaded_task_still_gets_the_upgrade(mocker, tmp_path):
+    artifact_id = _artifact_with_failed_chapter(mocker)
+    task_file = tmp_path / "task.epub"
+    task_file.write_bytes(open(ArtifactStore.get_path(artifact_id), "rb").read())
+    task_id = asyncio.run(TaskManager.create_task())
+    asyncio.run(TaskManager.complete_task(
+        task_id, str(task_file), "Test Novel.epub", artifact_id, artifact_revision=1, missing_chapters=1
+    ))
+    RefillService.schedule(artifact_id, BOOK_URL, task_id)
+
+    # The client downloads the book with its placeholder right away
+    assert client.get(f"/books/download/{task_id}").status_code == 200
+    assert not task_file.exists()
+    assert TaskManager.get_task(task_id)["status"] == "completed"
+
+    mocker.patch.object(MyRoyalRoadBook, "get_chapter_content",
+                        return_value=ChapterContent(title="Title 2", content="<p>Recovered text</p>"))
+    RefillService.run_due(now=RefillService._queue[artifact_id]["next_at"])
+    assert TaskManager.get_task(task_id)["artifact_revision"] == 2
+
+    response = client.get(f"/books/artifacts/{artifact_id}")
+    assert response.status_code == 200
+    assert response.headers["x-artifact-revision"] == "2"
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        name = next(n for n in archive.namelist() if n.endswith("chap_2.xhtml"))
+        assert "Recovered text" in archive.read(name).decode("utf-8")
+
+    # Forgotten on the next tick, once its stream had the chance to report the upgrade
+    RefillService.run_due()
+    assert TaskManager.get_task(task_id) is None
+
+
+def test_pending_refills_survive_a_restart(mocker):
+    artifact_id = _artifact_with_failed_chapter(mocker)
+    RefillService.schedule(artifact_id, BOOK_URL)
+    next_at = RefillService._queue[artifact_id]["next_at"]
+
+    # New process: the queue is read back from REFILL_STORE_PATH
+    RefillService.reset()
+    assert RefillService.is_pending(artifact_id)
+
+    mocker.patch.object(MyRoyalRoadBook, "get_chapter_content",
+                        return_value=ChapterContent(title="Title 2", content="<p>Recovered text</p>"))
+    RefillService.run_due(now=next_at)
+    assert not ArtifactStore.failed_chapters(artifact_id)
+
+    RefillService.reset()
+    assert not RefillService.is_pending(artifact_id)
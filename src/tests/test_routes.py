@@ -68,3 +68,35 @@ def test_generate_epub_invalid_domain():
     
     assert response.status_code == 400
     assert "Unsupported domain" in response.json()['detail']
+
+
+def test_generate_rejects_start_past_known_total(mocker):
+    """
+    A range starting after the last chapter is refused before a job is created.
+    """
+    from src.services.toc_cache import TocCache
+
+    url = "https://www.royalroad.com/fiction/12345/test-novel"
+    TocCache.set(url, total=3)
+    create_task = mocker.patch("src.routes.book_routes.TaskManager.create_task")
+
+    response = client.post("/books/generate", params={"url": url, "qty": 5, "start": 10})
+
+    assert response.status_code == 400
+    assert "total available chapters (3)" in response.json()['detail']
+    assert not create_task.called
+
+
+def test_generate_skips_preflight_without_paginated_index(mocker):
+    """
+    Without a cached count or a paginated index the job is accepted at once; it checks the range itself.
+    """
+    from src.classes.royalroad_book import MyRoyalRoadBook
+
+    discovery = mocker.patch.object(MyRoyalRoadBook, "get_total_chapters", return_value=3)
+    mocker.patch("src.routes.book_routes.background_epub_generation")
+
+    response = client.post("/books/generate", params={"url": "https://www.royalroad.com/fiction/12345/test-novel", "start": 10})
+
+    assert response.status_code == 202
+    assert not discovery.called
@@ -1,3 +1,5 @@
+from unittest.mock import MagicMock
+
 from src.classes.pandanovel_book import MyPandaNovelBook
 from src.classes.novelsbr_book import MyNovelsBrBook
 from src.classes.centralnovel_book import MyCentralNovelBook
@@ -31,6 +33,35 @@ class TestPandaNovelScraper:
         assert links[0] == "https://novelfire.noveljk.org/book/panda-test-novel/chapter-1"
         assert links[-1] == "https://novelfire.noveljk.org/book/panda-test-novel/chapter-5"
 
+    def test_get_chapters_link_from_paginated_index(self, mock_cloudscraper):
+        mock_scraper, _ = mock_cloudscraper
+        base = "https://novelfire.noveljk.org/book/panda-test-novel"
+        pages = {
+            f"{base}/chapters?page=1": (
+                '<ul class="chapter-list"><li><a href="/book/panda-test-novel/chapter-1">1</a></li>'
+                '<li><a href="/book/panda-test-novel/chapter-2">2</a></li></ul>'
+                '<ul class="pagination"><li><a href="?page=2">2</a></li><li><a href="?page=3">Last</a></li></ul>'
+            ),
+            f"{base}/chapters?page=2": '<ul class="chapter-list"><li><a href="/book/panda-test-novel/chapter-3">3</a></li></ul>',
+            # Chapter 4 was removed by the site: 5 follows 3
+            f"{base}/chapters?page=3": '<ul class="chapter-list"><li><a href="/book/panda-test-novel/chapter-5">5</a></li></ul>',
+        }
+
+        def fake_get(url, **kwargs):
+            # Index pages are spread over the registered mirrors
+            response = MagicMock(status_code=200)
+            response.content = pages[url.replace("://novelfire.net/", "://novelfire.noveljk.org/")].encode("utf-8")
+            return response
+        mock_scraper.get.side_effect = fake_get
+
+        book = MyPandaNovelBook("https://www.pandanovel.com/details/panda-test-novel", 10, 3)
+        links = book.get_chapters_link()
+
+        assert book.get_total_chapters() == 4
+        assert links == [f"{base}/chapter-3", f"{base}/chapter-5"]
+        # Cached for the next job on the same book
+        assert mock_scraper.get.call_count == 3
+
     def test_get_chapter_content(self, mock_cloudscraper, pandanovel_chap_html):
         mock_scraper, mock_response = mock_cloudscraper
         mock_response.text = pandanovel_chap_html
@@ -119,3 +150,16 @@ class TestCentralNovelScraper:
         assert data.title == "Chapter 1: Central Origin"
         assert "Central content paragraph" in data.content
         assert "Inteligência Artificial" not in data.content
+
+    def test_only_the_leading_ai_disclaimer_is_removed(self, mock_cloudscraper, centralnovel_chap_html):
+        mock_scraper, mock_response = mock_cloudscraper
+        mock_response.text = centralnovel_chap_html.replace(
+            "<p>Central content paragraph.</p>",
+            "<p>Central content paragraph.</p><p>Ela estudava Inteligência Artificial na academia.</p>"
+        )
+
+        book = MyCentralNovelBook("https://centralnovel.com/central-test-novel/", 10, 1)
+        data = book.get_chapter_content("https://dummy.url")
+
+        assert "removed text" not in data.content
+        assert "Ela estudava Inteligência Artificial na academia." in data.content
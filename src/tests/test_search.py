@@ -0,0 +1,140 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from src.main import app
+from src.services.royalroad_service import RoyalRoadService
+from src.services.search_cache import SearchCache
+from src.services.search_service import SearchService
+from src.services.session_manager import SessionManager
+
+client = TestClient(app)
+
+
+def _result(title: str) -> dict:
+    return {"title": title, "url": f"https://example.com/{title}", "cover": None, "chapters_count": "1"}
+
+
+@pytest.fixture
+def providers(mocker):
+    """royal answers at once, panda after 0.2s, central is too slow, novelsbr breaks."""
+    async def run(source, query):
+        if source == "central":
+            await asyncio.sleep(0.5)
+        if source == "panda":
+            await asyncio.sleep(0.2)
+        if source == "novelsbr":
+            raise RuntimeError("layout changed")
+        return [_result(f"{source}-{query}")]
+
+    mocker.patch.object(SearchService, "_run", side_effect=run)
+    mocker.patch("src.services.search_service.get_settings").return_value.SEARCH_SOURCE_TIMEOUT = 0.3
+
+
+def test_all_sources_return_partial_results(providers):
+    started = time.perf_counter()
+    response = client.get("/search/", params={"source": "all", "query": "slave"})
+
+    assert response.status_code == 200
+    # Bounded by the deadline, not by the sum of the sources
+    assert time.perf_counter() - started < 0.5
+    data = response.json()
+    status = {s["source"]: s["status"] for s in data["sources"]}
+    assert status == {"central": "timeout", "novelsbr": "error", "panda": "ok", "royal": "ok"}
+    assert data["results_count"] == 2
+
+
+def test_single_source_keeps_its_response(providers):
+    response = client.get("/search/", params={"source": "royal", "query": "slave"})
+
+    assert response.json() == {"source": "royal", "results_count": 1, "results": [_result("royal-slave")]}
+
+
+def test_stream_sends_each_source_as_it_finishes(providers):
+    response = client.get("/search/", params={"source": "royal,panda", "query": "slave", "stream": True})
+
+    events = [line.split(":", 1)[1].strip() for line in response.text.splitlines() if line.startswith("event:")]
+    data = [json.loads(line.split(":", 1)[1]) for line in response.text.splitlines() if line.startswith("data:")]
+    assert events == ["result", "result", "done"]
+    assert [d.get("source") for d in data[:2]] == ["royal", "panda"]  # fastest first
+    assert data[2]["results_count"] == 2
+
+
+def test_unknown_source_is_rejected():
+    assert client.get("/search/", params={"source": "royal,nope", "query": "slave"}).status_code == 400
+
+
+def test_normalized_repeat_is_served_from_cache(providers):
+    first = client.get("/search/", params={"source": "royal,panda", "query": "Shadow  Slave"}).json()
+    second = client.get("/search/", params={"source": "royal,panda", "query": " shadow slave "}).json()
+
+    assert SearchService._run.call_count == 2  # once per source
+    assert not any(s["cached"] for s in first["sources"])
+    assert all(s["cached"] for s in second["sources"])
+    assert second["sources"][0]["results"] == [_result("royal-shadow slave")]
+
+
+def test_stale_entry_is_served_then_refreshed(providers, mocker):
+    SearchCache.set("royal", "slave", [_result("old")])
+    # Aged past its freshness, still within the stale window
+    key = ("royal", "slave")
+    results, _, stale_until = SearchCache._entries[key]
+    SearchCache._entries[key] = (results, time.time() - 1, stale_until)
+
+    response = client.get("/search/", params={"source": "royal", "query": "slave"})
+    assert response.json()["results"] == [_result("old")]
+
+    deadline = time.time() + 2
+    while SearchCache.get("royal", "slave") != ([_result("royal-slave")], True) and time.time() < deadline:
+        time.sleep(0.01)
+    assert SearchCache.get("royal", "slave") == ([_result("royal-slave")], True)
+
+
+def test_identical_concurrent_searches_share_one_call(providers):
+    async def both():
+        return await asyncio.gather(
+            SearchService.search_source("panda", "slave"), SearchService.search_source("panda", "SLAVE")
+        )
+
+    outcomes = asyncio.run(both())
+    assert [o["results"] for o in outcomes] == [[_result("panda-slave")]] * 2
+    assert SearchService._run.call_count == 1
+
+
+def test_concurrency_is_not_bounded_by_threads(providers):
+    async def many():
+        return await asyncio.gather(*(SearchService.search_source("panda", f"query {n}") for n in range(40)))
+
+    started = time.perf_counter()
+    outcomes = asyncio.run(many())
+    # 40 searches waiting 0.2s each, far more than SEARCH_WORKERS threads: they all wait together
+    assert all(o["status"] == "ok" for o in outcomes)
+    assert time.perf_counter() - started < 0.3
+
+
+def test_async_provider_falls_back_to_blocking_search_on_challenge(mocker):
+    html = (
+        '<div class="fiction-list-item"><h2 class="fiction-title"><a href="/fiction/1/slave">Slave</a></h2></div>'
+    )
+    statuses = iter([200, 403])
+    transport = httpx.MockTransport(lambda request: httpx.Response(next(statuses), text=html))
+    mocker.patch.object(SessionManager, "get_async_client", return_value=httpx.AsyncClient(transport=transport))
+    blocking = mocker.patch.object(RoyalRoadService, "search", return_value=[_result("blocking")])
+
+    assert asyncio.run(RoyalRoadService().asearch("slave"))[0]["url"] == "https://www.royalroad.com/fiction/1/slave"
+    assert asyncio.run(RoyalRoadService().asearch("slave")) == [_result("blocking")]
+    blocking.assert_called_once_with("slave")
+
+
+def test_failed_fallback_is_an_error_not_cached_as_empty(mocker, mock_cloudscraper):
+    transport = httpx.MockTransport(lambda request: httpx.Response(403, text="challenge"))
+    mocker.patch.object(SessionManager, "get_async_client", return_value=httpx.AsyncClient(transport=transport))
+    mock_cloudscraper[0].get.side_effect = ConnectionError("origin down")
+
+    outcome = asyncio.run(SearchService.search_source("royal", "slave"))
+    assert outcome["status"] == "error" and outcome["results"] == []
+    assert SearchCache.get("royal", "slave") is None
@@ -0,0 +1,80 @@
+import threading
+from unittest.mock import MagicMock
+
+from src.services.session_manager import SessionManager, SessionPool
+from src.classes.royalroad_book import MyRoyalRoadBook
+
+
+def test_sessions_are_reused_across_instances(mock_cloudscraper, mocker):
+    """
+    Two scrapers for the same domain must share the pooled session instead of creating a new one.
+    """
+    create = mocker.patch("cloudscraper.create_scraper", return_value=mock_cloudscraper[0])
+
+    first = MyRoyalRoadBook("https://www.royalroad.com/fiction/1", 1, 1)
+    second = MyRoyalRoadBook("https://www.royalroad.com/fiction/2", 1, 1)
+    first._session.get("https://www.royalroad.com/fiction/1")
+    second._session.get("https://www.royalroad.com/fiction/2")
+
+    assert create.call_count == 1
+    assert SessionManager.stats()["royalroad.com"]["created"] == 1
+
+
+def test_pool_is_bounded_and_thread_safe(mocker):
+    mocker.patch("cloudscraper.create_scraper", side_effect=lambda **kwargs: MagicMock())
+    pool = SessionPool("example.com", None, size=2)
+
+    a = pool.acquire(timeout=1)
+    b = pool.acquire(timeout=1)
+    assert a is not b
+
+    # Pool exhausted: a third caller waits until a session is released
+    acquired = []
+    waiter = threading.Thread(target=lambda: acquired.append(pool.acquire(timeout=5)))
+    waiter.start()
+    pool.release(a)
+    waiter.join()
+
+    assert acquired == [a]
+    assert pool.stats()["created"] == 2
+
+
+def test_overflow_session_is_discarded(mocker):
+    mocker.patch("cloudscraper.create_scraper", side_effect=lambda **kwargs: MagicMock())
+    pool = SessionPool("example.com", None, size=1)
+
+    first = pool.acquire(timeout=1)
+    overflow = pool.acquire(timeout=0.01)
+    pool.release(overflow)
+    pool.release(first)
+
+    assert overflow.close.called
+    assert pool.stats() == {"size": 1, "created": 1, "in_use": 0, "idle": 1, "proxied": False}
+
+
+def test_warm_domain_prefills_pool_and_reports_readiness(mocker):
+    from src.services.warmup_service import WarmupService
+
+    def make_session(**kwargs):
+        session = MagicMock()
+        session.get.return_value.status_code = 200
+        return session
+
+    mocker.patch("cloudscraper.create_scraper", side_effect=make_session)
+
+    state = WarmupService.warm_domain("royalroad.com")
+
+    assert state["status"] == "ready"
+    assert WarmupService.readiness()["royalroad.com"]["status"] == "ready"
+    stats = SessionManager.stats()["royalroad.com"]
+    assert stats["created"] == stats["size"] == stats["idle"]
+
+
+def test_warm_domain_reports_blocked_domain(mocker):
+    from src.services.warmup_service import WarmupService
+
+    blocked = MagicMock()
+    blocked.get.return_value.status_code = 403
+    mocker.patch("cloudscraper.create_scraper", return_value=blocked)
+
+    assert WarmupService.warm_domain("centralnovel.com")["status"] == "failed"
@@ -0,0 +1,96 @@
+import asyncio
+import json
+
+from fastapi.testclient import TestClient
+
+from src.classes.royalroad_book import MyRoyalRoadBook
+from src.main import app, verify_internal_token
+from src.routes.book_routes import background_epub_generation
+from src.schemas.novel_schema import BookMetadata, ChapterContent
+from src.services.checkpoint_store import CheckpointStore
+from src.services.royalroad_service import RoyalRoadService  # noqa: F401 (registers royalroad.com)
+from src.services.shutdown_service import ShutdownService
+from src.services.task_manager import TaskManager
+
+client = TestClient(app)
+app.dependency_overrides[verify_internal_token] = lambda: {"sub": "test", "action": "generate-epub"}
+
+BOOK_URL = "https://www.royalroad.com/fiction/12345/test-novel"
+LINKS = [f"{BOOK_URL}/chapter/{n}" for n in range(1, 6)]
+
+
+def test_draining_server_refuses_new_jobs():
+    ShutdownService._draining = True
+    response = client.post("/books/generate", params={"url": BOOK_URL, "qty": 1})
+    assert response.status_code == 503
+    assert "Retry-After" in response.headers
+    assert client.get("/").json()["status"] == "draining"
+
+
+def test_interrupted_job_keeps_its_checkpoint(mocker):
+    mocker.patch.object(MyRoyalRoadBook, "get_book_metadata", return_value=BookMetadata(
+        book_title="Test Novel", book_author="Author", book_description="Desc"
+    ))
+    mocker.patch.object(MyRoyalRoadBook, "get_chapters_link", return_value=LINKS)
+
+    def content(url):
+        # The shutdown deadline passes while the job runs
+        ShutdownService._interrupt.set()
+        return ChapterContent(title=f"Title {url[-1]}", content=f"<p>Text of {url}</p>")
+
+    mocker.patch.object(MyRoyalRoadBook, "get_chapter_content", side_effect=content)
+
+    async def run():
+        task_id = await TaskManager.create_task()
+        CheckpointStore.begin(task_id, BOOK_URL, len(LINKS), 1)
+        await background_epub_generation(task_id, BOOK_URL, len(LINKS), 1)
+        return task_id
+
+    task_id = asyncio.run(run())
+    assert TaskManager.get_task(task_id)["status"] == "interrupted"
+    # Resumable, with the chapters finished before the interruption
+    assert [job["task_id"] for job in CheckpointStore.pending()] == [task_id]
+    assert CheckpointStore.load_chapters(task_id)
+
+
+def test_shutdown_interrupts_jobs_past_the_deadline_and_saves_state(mocker, tmp_path):
+    settings = mocker.patch("src.services.shutdown_service.get_settings").return_value
+    settings.configure_mock(SHUTDOWN_DRAIN_SECONDS=0, SHUTDOWN_INTERRUPT_GRACE=0, TASK_STATE_PATH=str(tmp_path / "tasks.json"))
+    epub_path = tmp_path / "done.epub"
+    epub_path.write_bytes(b"epub")
+
+    async def run():
+        running = await TaskManager.create_task()
+        await TaskManager.update_progress(running, 40)
+        done = await TaskManager.create_task()
+        await TaskManager.complete_task(done, str(epub_path), "Done.epub", "a" * 32)
+        await ShutdownService.shutdown()
+        return running, done
+
+    running, done = asyncio.run(run())
+    assert ShutdownService.is_interrupted()
+    with open(tmp_path / "tasks.json") as f:
+        saved = json.load(f)
+    assert done in saved and running not in saved
+
+    # Next start: the finished task is downloadable again
+    TaskManager._tasks.clear()
+    TaskManager.load_state(str(tmp_path / "tasks.json"))
+    assert TaskManager.get_task(done)["file_path"] == str(epub_path)
+    assert client.get(f"/books/download/{done}").content == b"epub"
+
+
+def test_job_group_finishes_when_queued_items_are_not_started():
+    async def run():
+        done = await TaskManager.create_task()
+        await TaskManager.fail_task(done, "Source error")
+        queued = await TaskManager.create_task()
+        batch_id = await TaskManager.create_batch([done, queued])
+        # The server starts draining before the second item runs
+        ShutdownService._draining = True
+        await background_epub_generation(queued, BOOK_URL, 1, 1)
+        return queued, batch_id
+
+    queued, batch_id = asyncio.run(run())
+    assert TaskManager.get_task(queued)["status"] == "interrupted"
+    assert TaskManager.get_batch_state(batch_id)["status"] == "interrupted"
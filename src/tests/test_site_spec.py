@@ -0,0 +1,102 @@
+import dataclasses
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.classes.centralnovel_book import MyCentralNovelBook
+from src.classes.lightnovel_theme_book import LightNovelThemeBook
+from src.classes.royalroad_book import MyRoyalRoadBook
+from src.classes.site_spec import ChapterSpec, MetadataSpec, SiteSpec, TocSpec
+from src.classes.spec_scraper import SpecScraper
+from src.services.metrics_service import MetricsService
+from src.services.toc_cache import TocCache
+
+
+def test_invalid_spec_fails_when_the_scraper_is_defined():
+    with pytest.raises(ValueError):
+        class BrokenBook(SpecScraper):
+            spec = SiteSpec(
+                name="broken",
+                base_url="https://example.com",
+                metadata=MetadataSpec(container="div.header", title="h1", author="h2", description="div.desc"),
+                toc=TocSpec(mode="count", items=("li a",)),  # count mode needs a url_template
+                chapter=ChapterSpec(content=("div.text",))
+            )
+
+
+def test_metadata_and_toc_share_one_page_download(mock_cloudscraper, royalroad_toc_html):
+    mock_scraper, mock_response = mock_cloudscraper
+    mock_response.text = royalroad_toc_html
+
+    book = MyRoyalRoadBook("https://royalroad.com/fiction/123", 10, 1)
+    book.get_book_metadata()
+    book.get_chapters_link()
+
+    assert mock_scraper.get.call_count == 1
+
+
+def test_mirror_is_a_spec_replacement(mock_cloudscraper, centralnovel_toc_html):
+    """A mirror of an existing site only needs a spec with another base URL, no new parsing code."""
+    mock_scraper, mock_response = mock_cloudscraper
+    mock_response.text = centralnovel_toc_html
+
+    class CentralMirrorBook(SpecScraper):
+        spec = dataclasses.replace(MyCentralNovelBook.spec, base_url="https://mirror.example.com")
+
+    book = CentralMirrorBook("https://mirror.example.com/central-test-novel-12/", 2, 1)
+    assert book.get_chapters_link() == [
+        "https://mirror.example.com/central-test-novel-capitulo-1/",
+        "https://mirror.example.com/central-test-novel-capitulo-2/"
+    ]
+
+
+def test_embedded_chapter_list_is_used_and_measured(mock_cloudscraper, royalroad_toc_html):
+    mock_scraper, mock_response = mock_cloudscraper
+    embedded = (
+        '<script>window.chapters = [{"id": 1, "url": "/fiction/12345/chapter/10"}, '
+        '{"id": 2, "url": "/fiction/12345/chapter/11"}];</script>'
+    )
+    mock_response.text = royalroad_toc_html.replace("</body>", embedded + "</body>")
+
+    links = MyRoyalRoadBook("https://royalroad.com/fiction/123", 10, 1).get_chapters_link()
+
+    # The JSON list wins over the (stale) chapter table
+    assert links == [
+        "https://www.royalroad.com/fiction/12345/chapter/10",
+        "https://www.royalroad.com/fiction/12345/chapter/11"
+    ]
+    stats = MetricsService.get_toc_summary("royalroad.com")
+    assert stats["embedded_hits"] == 1 and stats["endpoint_hits"] == 0
+    # The book page is downloaded anyway: nothing is credited as saved
+    assert stats["bytes_saved"] == 0 and stats["time_saved_s"] == 0
+
+
+def test_fast_endpoint_reports_bytes_saved(mock_cloudscraper, centralnovel_toc_html):
+    mock_scraper, mock_response = mock_cloudscraper
+    book_url = "https://theme-metrics.example/series/novel/"
+
+    # First job: no endpoint yet, the whole book page is parsed
+    mock_scraper.post.return_value = MagicMock(status_code=500)
+    mock_scraper.post.return_value.raise_for_status.side_effect = RuntimeError("server error")
+    mock_response.text = centralnovel_toc_html
+    LightNovelThemeBook(book_url, 1, 1).get_chapters_link()
+
+    # Second job (chapter list expired from the cache): the AJAX fragment is a fraction of the page
+    TocCache.reset()
+    fragment = b'<li class="wp-manga-chapter"><a href="/novel/chapter-1/">1</a></li>'
+    mock_scraper.post.return_value = MagicMock(status_code=200, content=fragment)
+    LightNovelThemeBook(book_url, 1, 1).get_chapters_link()
+
+    stats = MetricsService.get_toc_summary("theme-metrics.example")
+    assert stats["html_hits"] == 1 and stats["endpoint_hits"] == 1
+    assert stats["bytes_saved"] == len(centralnovel_toc_html.encode("utf-8")) - len(fragment)
+
+
+def test_endpoint_savings_are_measured_against_the_book_page():
+    MetricsService.record_toc_metric("savings.example", "html", 100_000, 2.0, 50)
+    MetricsService.record_toc_metric("savings.example", "endpoint", 4_000, 0.5, 50)
+    MetricsService.record_toc_metric("savings.example", "embedded", 0, 0.1, 50)
+
+    stats = MetricsService.get_toc_summary("savings.example")
+    assert stats["bytes_saved"] == 96_000
+    assert stats["time_saved_s"] == 1.5
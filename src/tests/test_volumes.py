@@ -0,0 +1,119 @@
+import io
+import threading
+import time
+import zipfile
+
+from fastapi.testclient import TestClient
+
+from src.classes.novelsbr_book import MyNovelsBrBook
+from src.config import get_settings
+from src.main import app, verify_internal_token
+from src.schemas.novel_schema import BookMetadata, ChapterContent
+from src.services.volume_service import VolumeService
+
+client = TestClient(app)
+app.dependency_overrides[verify_internal_token] = lambda: {"sub": "test", "action": "generate-epub"}
+
+BOOK_URL = "https://novels-br.com/novels/test-novel/"
+
+ACCORDION = """
+<html><body>
+<div class="book-header"><h1 class="book-title">Volumes Novel</h1></div>
+<div id="volumes">
+  <div class="accordion-item">
+    <h2 class="accordion-header"><button class="accordion-button">Volume 1: Start</button></h2>
+    <div class="accordion-body"><ol>
+      <li><a href="/livro/1/capitulo-1" class="custom-link">1</a></li>
+      <li><a href="/livro/1/capitulo-2" class="custom-link">2</a></li>
+    </ol></div>
+  </div>
+  <div class="accordion-item">
+    <h2 class="accordion-header"><button class="accordion-button">Volume 2: End</button></h2>
+    <div class="accordion-body"><ol>
+      <li><a href="/livro/1/capitulo-3" class="custom-link">3</a></li>
+    </ol></div>
+  </div>
+</div>
+</body></html>
+"""
+
+
+def test_plan_by_size_and_by_site_volumes():
+    urls = [f"u{n}" for n in range(3, 13)]  # chapters 3..12
+
+    by_size = VolumeService.plan(urls, start=3, volume_size=4)
+    assert [(v.first_chapter, len(v.urls)) for v in by_size] == [(3, 4), (7, 4), (11, 2)]
+
+    # Site volumes of 5 chapters each, clipped to the requested range
+    by_site = VolumeService.plan(urls, start=3, site_volumes=[("A", 5), ("B", 5), ("C", 5)])
+    assert [(v.title, v.first_chapter, v.urls) for v in by_site] == [
+        ("A", 3, urls[:3]), ("B", 6, urls[3:8]), ("C", 11, urls[8:])
+    ]
+
+
+def test_novelsbr_exposes_its_accordion_volumes(mock_cloudscraper):
+    _, mock_response = mock_cloudscraper
+    mock_response.text = ACCORDION
+
+    assert MyNovelsBrBook(BOOK_URL, 3, 1).get_volumes() == [("Volume 1: Start", 2), ("Volume 2: End", 1)]
+
+
+def test_volumes_are_built_into_one_bundle(mocker):
+    book = MyNovelsBrBook(BOOK_URL, 3, 1)
+    urls = [f"https://novels-br.com/livro/1/capitulo-{n}" for n in range(1, 4)]
+    mocker.patch.object(book, "load_book", return_value=(
+        BookMetadata(book_title="Volumes Novel", book_author="A", book_description="D"), urls, None
+    ))
+    mocker.patch.object(book, "get_volumes", return_value=[("Volume 1: Start", 2), ("Volume 2: End", 1)])
+    mocker.patch.object(
+        book, "get_chapter_content", side_effect=lambda url: ChapterContent(title=url[-1], content=f"<p>{url}</p>")
+    )
+
+    _, volumes, bundle = VolumeService.scrape_volumes(book, 1, use_site_volumes=True)
+
+    assert [(v["title"], v["first_chapter"], v["chapters"]) for v in volumes] == [
+        ("Volume 1: Start", 1, 2), ("Volume 2: End", 3, 1)
+    ]
+    with zipfile.ZipFile(io.BytesIO(bundle)) as archive:
+        assert archive.namelist() == [v["filename"] for v in volumes]
+        with zipfile.ZipFile(io.BytesIO(archive.read(volumes[1]["filename"]))) as second:
+            # Chapters keep their book numbering inside each volume
+            assert any(name.endswith("chap_3.xhtml") for name in second.namelist())
+
+
+def test_volumes_share_the_chapter_download_slots(mocker):
+    settings = get_settings()
+    mocker.patch.object(settings, "MAX_WORKERS", 2)
+    mocker.patch.object(settings, "VOLUME_WORKERS", 3)
+    book = MyNovelsBrBook(BOOK_URL, 6, 1)
+    urls = [f"https://novels-br.com/livro/1/capitulo-{n}" for n in range(1, 7)]
+    mocker.patch.object(book, "load_book", return_value=(
+        BookMetadata(book_title="Volumes Novel", book_author="A", book_description="D"), urls, None
+    ))
+
+    in_flight, peak = [0], [0]
+    lock = threading.Lock()
+
+    def content(url):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        time.sleep(0.02)
+        with lock:
+            in_flight[0] -= 1
+        return ChapterContent(title=url[-1], content=f"<p>{url}</p>")
+
+    mocker.patch.object(book, "get_chapter_content", side_effect=content)
+
+    _, volumes, _ = VolumeService.scrape_volumes(book, 1, volume_size=2)
+
+    assert len(volumes) == 3
+    # 3 volumes x 2 workers, but never more than MAX_WORKERS requests to the domain
+    assert peak[0] == 2
+
+def test_large_jobs_must_be_split_into_volumes():
+    params = {"url": "https://www.royalroad.com/fiction/12345/test-novel", "qty": 2000}
+    response = client.post("/books/generate", params=params)
+
+    assert response.status_code == 400
+    assert "volumes" in response.json()["detail"]
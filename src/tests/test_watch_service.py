@@ -0,0 +1,131 @@
+import itertools
+from unittest.mock import MagicMock
+
+from src.classes.pandanovel_book import MyPandaNovelBook
+from src.classes.royalroad_book import MyRoyalRoadBook
+from src.services.chapter_cache import ChapterCache
+from src.services.rate_limiter import DomainRateLimiter
+from src.services.royalroad_service import RoyalRoadService  # noqa: F401 (registers royalroad.com)
+from src.services.watch_service import WatchService
+
+BOOK_URL = "https://www.royalroad.com/fiction/12345/test-novel"
+
+
+def _toc(chapters: int) -> str:
+    rows = "".join(
+        f'<tr class="chapter-row" data-url="/fiction/12345/chapter/{n}"><td>Chapter {n}</td></tr>'
+        for n in range(1, chapters + 1)
+    )
+    return f'<html><body><div class="fic-header"><h1>Test</h1></div><table id="chapters">{rows}</table></body></html>'
+
+
+def _page(text: str, status_code: int = 200, headers=None):
+    response = MagicMock(status_code=status_code, content=text.encode("utf-8"), headers=headers or {})
+    return response
+
+
+def _chapter_page(url: str):
+    return _page(
+        f'<h1 class="font-white break-word">Chapter</h1>'
+        f'<div class="chapter-inner chapter-content"><p>Text of {url}</p></div>'
+    )
+
+
+def test_new_chapters_are_detected_and_prefetched(mock_cloudscraper, mocker):
+    mock_scraper, _ = mock_cloudscraper
+    mocker.patch("src.services.rate_limiter.time.sleep")
+    WatchService.subscribe(BOOK_URL)
+
+    # Baseline poll: nothing is "new" yet
+    mock_scraper.get.side_effect = lambda url, **kw: _page(_toc(2), headers={"ETag": '"v1"'})
+    assert WatchService.poll(BOOK_URL) is None
+    assert WatchService.get(BOOK_URL)["known_chapters"] == 2
+
+    # Two chapters published: the changed page is read once and the new chapters are prefetched
+    def site(url, **kwargs):
+        return _chapter_page(url) if "/chapter/" in url else _page(_toc(4), headers={"ETag": '"v2"'})
+
+    mock_scraper.get.side_effect = site
+    appeared = WatchService.poll(BOOK_URL)
+    assert appeared == [
+        "https://www.royalroad.com/fiction/12345/chapter/3",
+        "https://www.royalroad.com/fiction/12345/chapter/4"
+    ]
+    assert WatchService.get(BOOK_URL)["prefetched"] == 2
+
+    # The update job then serves them from the cache without any request
+    mock_scraper.get.reset_mock()
+    results = MyRoyalRoadBook(BOOK_URL, 2, 3)._download_chapters(appeared)
+    assert [r.content for r in results] == [ChapterCache.get(url).content for url in appeared]
+    assert not mock_scraper.get.called
+
+
+def test_unchanged_book_page_skips_discovery(mock_cloudscraper, mocker):
+    mock_scraper, _ = mock_cloudscraper
+    WatchService.subscribe(BOOK_URL)
+    mock_scraper.get.side_effect = lambda url, **kw: _page(_toc(2), headers={"ETag": '"v1"'})
+    WatchService.poll(BOOK_URL)
+
+    discover = mocker.patch.object(MyRoyalRoadBook, "_discover_chapters")
+    mock_scraper.get.side_effect = lambda url, **kw: _page("", status_code=304)
+    assert WatchService.poll(BOOK_URL) is None
+
+    assert mock_scraper.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    assert not discover.called
+
+
+def test_due_polls_are_spaced_per_domain(mocker):
+    poll = mocker.patch.object(WatchService, "poll")
+    WatchService.subscribe(BOOK_URL)
+    WatchService.subscribe("https://www.royalroad.com/fiction/999/other-novel")
+    for entry in WatchService._entries.values():
+        entry["next_check_at"] = 0
+
+    WatchService.poll_due()
+    assert poll.call_count == 1  # the second novel waits for the next tick
+
+    DomainRateLimiter.reset()
+    WatchService.poll_due()
+    assert poll.call_count == 2
+
+
+def test_page_noise_does_not_trigger_discovery(mock_cloudscraper, mocker):
+    mock_scraper, _ = mock_cloudscraper
+    WatchService.subscribe(BOOK_URL)
+    # No validators from the server; the ad slot changes on every request
+    nonce = itertools.count()
+    mock_scraper.get.side_effect = lambda url, **kw: _page(_toc(2) + f'<div class="ad" data-nonce="{next(nonce)}"></div>')
+    WatchService.poll(BOOK_URL)
+
+    discover = mocker.patch.object(MyRoyalRoadBook, "_discover_chapters")
+    assert WatchService.poll(BOOK_URL) is None
+    assert not discover.called
+
+
+def test_poll_spaces_paginated_index_requests(mock_cloudscraper, mocker):
+    mock_scraper, _ = mock_cloudscraper
+    base = "https://novelfire.noveljk.org/book/panda-test-novel"
+    pages = {
+        f"{base}/chapters?page=1": (
+            '<ul class="chapter-list"><li><a href="/book/panda-test-novel/chapter-1">1</a></li></ul>'
+            '<ul class="pagination"><li><a href="?page=2">2</a></li></ul>'
+        ),
+        f"{base}/chapters?page=2": '<ul class="chapter-list"><li><a href="/book/panda-test-novel/chapter-2">2</a></li></ul>',
+    }
+    book_page = '<div class="novel-info"><div class="header-stats"><span>2 Chapters</span></div><h1>Panda</h1></div>'
+    # Index pages are spread over PandaNovel's mirrors
+    mock_scraper.get.side_effect = lambda url, **kw: _page(
+        pages.get(url.replace("://novelfire.net/", "://novelfire.noveljk.org/"), book_page)
+    )
+    acquire = mocker.patch.object(DomainRateLimiter, "acquire")
+
+    book = MyPandaNovelBook("https://www.pandanovel.com/details/panda-test-novel", 10, 1)
+    links, validators = book.poll_chapters(None, interval=5.0)
+
+    assert links == [f"{base}/chapter-1", f"{base}/chapter-2"]
+    assert [call.args[1] for call in acquire.call_args_list] == [5.0, 5.0]
+
+    # Same chapter count on the next poll: no index page is read
+    mock_scraper.get.reset_mock()
+    assert MyPandaNovelBook("https://www.pandanovel.com/details/panda-test-novel", 10, 1).poll_chapters(validators)[0] is None
+    assert mock_scraper.get.call_count == 1
@@ -13,3 +13,21 @@ class ScraperParsingException(BaseScraperException):
 class ChapterLimitException(BaseScraperException):
     """Raised when the requested chapter range is invalid or exceeds limits."""
     pass
+
+
+class CircuitOpenException(BaseScraperException):
+    """Raised when a domain's circuit breaker is open (the site is currently blocking us)."""
+    def __init__(self, domain: str, retry_after: float = 0.0):
+        self.domain = domain
+        self.retry_after = retry_after
+        super().__init__(f"Source '{domain}' is temporarily blocking requests. Retry in {retry_after:.0f}s.")
+
+
+class SearchFailedException(BaseScraperException):
+    """Raised by a non-blocking search whose blocking fallback failed (an error must never be cached as "no results")."""
+    pass
+
+
+class JobInterruptedException(BaseScraperException):
+    """Raised when a running job is stopped by a server shutdown (its checkpoint is kept for the restart)."""
+    pass
@@ -0,0 +1,92 @@
+import re
+from functools import lru_cache
+from typing import Iterable, Optional, Tuple, Union
+
+import lxml.html
+from bs4 import BeautifulSoup
+from bs4.filter import ElementFilter
+
+from src.config import get_settings
+
+
+Markup = Union[str, bytes]
+
+# Simple selector: optional tag, optional #id, any number of .classes (e.g. 'div.chapter-inner.chapter-content')
+_SIMPLE_SELECTOR = re.compile(r'^(?P<tag>[a-zA-Z][\w-]*)?(?:#(?P<id>[\w-]+))?(?P<classes>(?:\.[\w-]+)*)$')
+
+
+def _compile_region(selector: str) -> Tuple[Optional[str], Optional[str], frozenset]:
+    """Turns a simple CSS selector ('tag#id.class1.class2') into (tag, id, classes)."""
+    match = _SIMPLE_SELECTOR.match(selector.strip())
+    if not match:
+        raise ValueError(f"Unsupported region selector: {selector!r} (use tag#id.class form)")
+    classes = match.group('classes')
+    return (match.group('tag'), match.group('id'), frozenset(c for c in classes.split('.') if c))
+
+
+class RegionFilter(ElementFilter):
+    """
+    Parse-time filter (like a SoupStrainer) that only builds the subtrees matching the declared
+    regions. Everything else in the page is skipped by the tree builder.
+    """
+
+    def __init__(self, regions: Iterable[str]):
+        super().__init__()
+        self.regions = tuple(_compile_region(r) for r in regions)
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        attrs = attrs or {}
+        tag_classes = attrs.get('class', '')
+        if isinstance(tag_classes, str):
+            tag_classes = tag_classes.split()
+        tag_classes = set(tag_classes)
+
+        for tag, element_id, classes in self.regions:
+            if tag and tag != name:
+                continue
+            if element_id and attrs.get('id') != element_id:
+                continue
+            if classes and not classes.issubset(tag_classes):
+                continue
+            return True
+        return False
+
+    def allow_string_creation(self, string) -> bool:
+        # Only strings inside an allowed region are kept
+        return False
+
+
+@lru_cache(maxsize=64)
+def _region_filter(regions: Tuple) -> RegionFilter:
+    return RegionFilter(regions)
+
+
+def make_soup(
+    markup: Markup,
+    regions: Optional[Iterable[str]] = None,
+    encoding: Optional[str] = None,
+    backend: Optional[str] = None
+) -> BeautifulSoup:
+    """
+    Single entry point used by the scrapers to build a BeautifulSoup tree.
+
+    - `backend`: tree builder ('lxml' or 'html.parser'); defaults to HTML_PARSER_BACKEND.
+    - `regions`: selectors of the only parts of the page the caller needs (see RegionFilter).
+    - `encoding`: when the page encoding is known, raw bytes are decoded directly (no charset sniffing).
+    """
+    backend = backend or get_settings().HTML_PARSER_BACKEND
+    parse_only = _region_filter(tuple(regions)) if regions else None
+
+    if isinstance(markup, bytes) and encoding:
+        return BeautifulSoup(markup, backend, parse_only=parse_only, from_encoding=encoding)
+    return BeautifulSoup(markup, backend, parse_only=parse_only)
+
+
+def make_tree(markup: Markup, encoding: Optional[str] = 'utf-8') -> lxml.html.HtmlElement:
+    """
+    Parses with lxml directly (no BeautifulSoup layer). Fastest option for XPath/cssselect-style extraction.
+    """
+    if isinstance(markup, bytes):
+        parser = lxml.html.HTMLParser(encoding=encoding) if encoding else None
+        return lxml.html.fromstring(markup, parser=parser)
+    return lxml.html.fromstring(markup)
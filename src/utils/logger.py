@@ -29,11 +29,13 @@ def setup_logger():
 
     # 2. File Handler (Saves to logs/app.log)
     # RotatingFileHandler: keeps the file from getting too big (max 5MB, keeps 3 backups)
+    # delay: the file is only opened on the first record (the test suite detaches this handler)
     file_handler = RotatingFileHandler(
         LOG_DIR / "app.log", 
         maxBytes=5*1024*1024, 
         backupCount=3,
-        encoding='utf-8'
+        encoding='utf-8',
+        delay=True
     )
     file_handler.setFormatter(formatter)
     logger.addHandler(file_handler)